@@ -0,0 +1,109 @@
+"""
+PDF 생성 벤치마크
+
+create_pdf의 빌드 시간과 출력 파일 크기를 이미지 인코딩 옵션별로 측정합니다.
+- 첫 호출(폰트 등록 포함)과 이후 호출(폰트 캐시 사용) 시간 분리
+- 원본 PNG / 양자화 PNG / JPEG 임베딩 비교
+
+사용법:
+    python scripts/benchmark_pdf.py [--runs 10] [--charts 4]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.pdf_utils import create_pdf  # noqa: E402
+
+SAMPLE_REPORT = """# AAPL 종합 분석 보고서
+
+## 1. 기업 개요
+Apple Inc.는 **아이폰**, 맥, 서비스 부문을 중심으로 사업을 영위합니다.
+
+- 매출 성장률: **+8.1%**
+- 영업이익률: 30.2%
+- 순이익률: 25.3%
+
+## 2. 재무 지표
+
+| 지표 | 2022 | 2023 | 2024 | 비고 |
+|---|---|---|---|---|
+| 매출 (십억 USD) | 394.3 | 383.3 | 391.0 | 서비스 부문 성장 |
+| 순이익 (십억 USD) | 99.8 | 97.0 | 93.7 | 일회성 세금 비용 |
+| ROE | 175% | 156% | 160% | 자사주 매입 영향 |
+
+## 3. 투자 의견
+1. 서비스 매출 비중 확대로 **이익 안정성** 개선
+2. 하드웨어 교체 주기 장기화는 리스크 요인
+"""
+
+
+def _make_chart(index: int, dpi: int) -> BytesIO:
+    """벤치마크용 차트 이미지 생성 (chart_utils와 같은 크기/해상도)"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    rng = np.random.default_rng(index)
+    fig, ax = plt.subplots(figsize=(10, 4))
+    for i in range(3):
+        ax.plot(np.cumsum(rng.normal(size=250)), linewidth=1.5, label=f"T{i}")
+    ax.legend(loc="upper left")
+    ax.grid(True, alpha=0.3, linestyle="--")
+    buf = BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi, facecolor="white")
+    plt.close(fig)
+    buf.seek(0)
+    return buf
+
+
+def _run(label: str, charts: list, runs: int, image_format=None) -> None:
+    times = []
+    size = 0
+    for _ in range(runs):
+        for buf in charts:
+            buf.seek(0)
+        start = time.perf_counter()
+        pdf_bytes = create_pdf(
+            SAMPLE_REPORT, chart_images=charts, image_format=image_format
+        )
+        times.append(time.perf_counter() - start)
+        size = len(pdf_bytes)
+
+    print(
+        f"{label:<16} first={times[0] * 1000:8.1f}ms  "
+        f"median={statistics.median(times) * 1000:8.1f}ms  "
+        f"size={size / 1024:8.1f}KB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="create_pdf 벤치마크")
+    parser.add_argument("--runs", type=int, default=10, help="옵션별 반복 횟수")
+    parser.add_argument("--charts", type=int, default=4, help="차트 이미지 개수")
+    parser.add_argument("--dpi", type=int, default=300, help="차트 원본 해상도")
+    args = parser.parse_args()
+
+    print(f"📄 PDF 벤치마크 (runs={args.runs}, charts={args.charts}, dpi={args.dpi})")
+    print(f"   PID {os.getpid()} - 첫 호출에 폰트 등록 비용 포함\n")
+
+    charts = [_make_chart(i, args.dpi) for i in range(args.charts)]
+    raw_kb = sum(len(buf.getvalue()) for buf in charts) / 1024
+    print(f"   원본 차트 PNG 합계: {raw_kb:.1f}KB\n")
+
+    _run("text only", [], args.runs)
+    _run("raw png", charts, args.runs)
+    _run("quantized png", charts, args.runs, image_format="png")
+    _run("jpeg", charts, args.runs, image_format="jpeg")
+
+
+if __name__ == "__main__":
+    main()
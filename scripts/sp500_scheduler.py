@@ -29,6 +29,8 @@ sys.path.insert(0, str(project_root))
 
 from dotenv import load_dotenv
 
+from src.utils.rate_limiter import BACKGROUND, request_priority
+
 load_dotenv()
 
 # 로그 설정
@@ -224,8 +226,32 @@ def save_to_csv(data: List[Dict], output_dir: Path = None):
     logger.info(f"💾 JSON 저장됨: {json_file}")
 
 
+def sync_duckdb_mirror():
+    """Supabase 변경분을 로컬 DuckDB 미러(TextToSQL용)에 증분 반영 후 비율 패널/대시보드 스냅샷 재계산"""
+    try:
+        from src.sql.duckdb_mirror import get_mirror
+        from src.utils.ratio_engine import materialize_ratio_panel
+        from src.utils.dashboard_snapshot import refresh_dashboard_snapshot
+
+        mirror = get_mirror()
+        fetched = mirror.sync()
+        logger.info(f"🦆 DuckDB 미러 동기화: {fetched}")
+        ratio_rows = materialize_ratio_panel(mirror)
+        logger.info(f"📐 재무비율 패널 재계산: {ratio_rows}행")
+        snapshot = refresh_dashboard_snapshot(mirror)
+        logger.info(f"🏠 홈 대시보드 스냅샷 갱신: {snapshot}")
+    except Exception as e:
+        logger.error(f"❌ DuckDB 미러 동기화 실패: {e}")
+
+
 def collect_sp500_data():
-    """S&P 500 기업 정보 수집 메인 함수"""
+    """S&P 500 기업 정보 수집 메인 함수 (백그라운드 우선순위로 API 예산 사용)"""
+    # 대화형 요청이 먼저 토큰을 받도록 수집 전체를 BACKGROUND로 표시
+    with request_priority(BACKGROUND):
+        _collect_sp500_data()
+
+
+def _collect_sp500_data():
     import pytz
 
     kst = pytz.timezone("Asia/Seoul")
@@ -309,6 +335,7 @@ def collect_sp500_data():
     if os.getenv("SUPABASE_URL") and os.getenv("SUPABASE_KEY"):
         db_count = save_to_supabase(all_data)
         logger.info(f"🗄️ Supabase 저장: {db_count}개 기업")
+        sync_duckdb_mirror()
     else:
         logger.info("⚠️ Supabase 설정 없음 - CSV/JSON만 저장됨")
 
@@ -0,0 +1,67 @@
+"""
+Supabase -> 로컬 DuckDB 미러 동기화
+
+TextToSQL이 Supabase 호출 없이 로컬에서 분석 쿼리를 실행할 수 있도록
+companies, annual_reports, quarterly_reports, stock_prices,
+company_relationships 테이블을 Parquet 스냅샷으로 저장하고,
+동기화 후 재무비율 패널(financial_ratios)과 홈 대시보드 스냅샷을 다시 계산합니다.
+
+사용법:
+    python scripts/sync_duckdb_mirror.py                 # 증분 동기화 (watermark 이후 변경분)
+    python scripts/sync_duckdb_mirror.py --full          # 전체 재구축 (삭제된 행 반영)
+    python scripts/sync_duckdb_mirror.py --tables companies annual_reports
+    python scripts/sync_duckdb_mirror.py --status        # 동기화 상태 출력
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from dotenv import load_dotenv  # noqa: E402
+
+load_dotenv()
+
+from sql.duckdb_mirror import MIRROR_TABLES, get_mirror  # noqa: E402
+from utils.dashboard_snapshot import refresh_dashboard_snapshot  # noqa: E402
+from utils.ratio_engine import materialize_ratio_panel  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Supabase -> DuckDB 미러 동기화")
+    parser.add_argument("--full", action="store_true", help="watermark 무시하고 전체 재구축")
+    parser.add_argument(
+        "--tables", nargs="+", choices=list(MIRROR_TABLES), help="동기화할 테이블"
+    )
+    parser.add_argument("--status", action="store_true", help="동기화 상태만 출력")
+    args = parser.parse_args()
+
+    mirror = get_mirror()
+
+    if not args.status:
+        start = time.perf_counter()
+        fetched = mirror.sync(tables=args.tables, full=args.full)
+        elapsed = time.perf_counter() - start
+        failed = [t for t, n in fetched.items() if n < 0]
+        print(f"\n🦆 동기화 완료 ({elapsed:.1f}초): {fetched}")
+        if failed:
+            print(f"❌ 실패: {', '.join(failed)}")
+
+        ratio_rows = materialize_ratio_panel(mirror)
+        print(f"📐 financial_ratios 재계산: {ratio_rows}행")
+
+        snapshot = refresh_dashboard_snapshot(mirror)
+        print(f"🏠 홈 대시보드 스냅샷: {snapshot}")
+
+    print(f"\n📁 {mirror.mirror_dir}")
+    print(mirror.status().to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,9 @@ load_dotenv()
 # Supabase 클라이언트
 from supabase import create_client, Client
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from utils.ratio_engine import compute_basic_ratios
+
 # 설정
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
@@ -79,84 +82,58 @@ def get_company_id_map(supabase: Client) -> dict:
     return {row["ticker"]: row["id"] for row in result.data}
 
 
+# CSV 열 접두사 -> annual_reports 컬럼
+ANNUAL_FIELD_PREFIXES = {
+    "Revenue": "revenue",
+    "NetIncome": "net_income",
+    "TotalAssets": "total_assets",
+    "TotalLiabilities": "total_liabilities",
+    "Equity": "stockholders_equity",
+    "OperatingIncome": "operating_income",
+    "CashFlow": "operating_cash_flow",
+    "EPS": "eps",
+}
+
+# annual_reports 테이블에 저장하는 비율 컬럼
+ANNUAL_RATIO_COLUMNS = ["profit_margin", "roe", "roa", "debt_to_equity"]
+
+
 def extract_annual_data(df: pd.DataFrame) -> list:
-    """DataFrame에서 연간 재무 데이터 추출"""
-    annual_data = []
-    
+    """DataFrame에서 연간 재무 데이터 추출 (연도별 열을 세로로 펼친 뒤 비율 일괄 계산)"""
     # 2020-2025년 데이터 추출
     years = range(2020, 2026)
-    
-    for _, row in df.iterrows():
-        ticker = row["ticker"]
-        
-        for year in years:
-            record = {
-                "ticker": ticker,
-                "fiscal_year": year,
-            }
-            
-            # 각 재무 지표 추출
-            revenue_col = f"Revenue_{year}"
-            net_income_col = f"NetIncome_{year}"
-            assets_col = f"TotalAssets_{year}"
-            liabilities_col = f"TotalLiabilities_{year}"
-            equity_col = f"Equity_{year}"
-            operating_col = f"OperatingIncome_{year}"
-            cashflow_col = f"CashFlow_{year}"
-            eps_col = f"EPS_{year}"
-            
-            # 값이 있는 경우만 추가
-            has_data = False
-            
-            if revenue_col in df.columns and pd.notna(row.get(revenue_col)):
-                record["revenue"] = float(row[revenue_col])
-                has_data = True
-            
-            if net_income_col in df.columns and pd.notna(row.get(net_income_col)):
-                record["net_income"] = float(row[net_income_col])
-                has_data = True
-            
-            if assets_col in df.columns and pd.notna(row.get(assets_col)):
-                record["total_assets"] = float(row[assets_col])
-                has_data = True
-            
-            if liabilities_col in df.columns and pd.notna(row.get(liabilities_col)):
-                record["total_liabilities"] = float(row[liabilities_col])
-                has_data = True
-            
-            if equity_col in df.columns and pd.notna(row.get(equity_col)):
-                record["stockholders_equity"] = float(row[equity_col])
-                has_data = True
-            
-            if operating_col in df.columns and pd.notna(row.get(operating_col)):
-                record["operating_income"] = float(row[operating_col])
-                has_data = True
-            
-            if cashflow_col in df.columns and pd.notna(row.get(cashflow_col)):
-                record["operating_cash_flow"] = float(row[cashflow_col])
-                has_data = True
-            
-            if eps_col in df.columns and pd.notna(row.get(eps_col)):
-                record["eps"] = float(row[eps_col])
-                has_data = True
-            
-            # 비율 계산
-            if "revenue" in record and "net_income" in record and record["revenue"] > 0:
-                record["profit_margin"] = record["net_income"] / record["revenue"]
-            
-            if "stockholders_equity" in record and "net_income" in record and record["stockholders_equity"] > 0:
-                record["roe"] = record["net_income"] / record["stockholders_equity"]
-            
-            if "total_assets" in record and "net_income" in record and record["total_assets"] > 0:
-                record["roa"] = record["net_income"] / record["total_assets"]
-            
-            if "stockholders_equity" in record and "total_liabilities" in record and record["stockholders_equity"] > 0:
-                record["debt_to_equity"] = record["total_liabilities"] / record["stockholders_equity"]
-            
-            if has_data:
-                annual_data.append(record)
-    
-    return annual_data
+
+    frames = []
+    for year in years:
+        columns = {
+            f"{prefix}_{year}": field
+            for prefix, field in ANNUAL_FIELD_PREFIXES.items()
+            if f"{prefix}_{year}" in df.columns
+        }
+        if not columns:
+            continue
+        part = df[["ticker"] + list(columns)].rename(columns=columns)
+        part["fiscal_year"] = year
+        frames.append(part)
+
+    if not frames:
+        return []
+
+    annual = pd.concat(frames, ignore_index=True)
+    value_cols = [c for c in ANNUAL_FIELD_PREFIXES.values() if c in annual.columns]
+    annual[value_cols] = annual[value_cols].apply(pd.to_numeric, errors="coerce")
+
+    # 값이 하나라도 있는 연도만 추가
+    annual = annual.dropna(subset=value_cols, how="all")
+
+    # 비율 계산 (분모가 0 이하이면 생략)
+    ratios = compute_basic_ratios(annual)
+    annual[ANNUAL_RATIO_COLUMNS] = ratios.reindex(columns=ANNUAL_RATIO_COLUMNS)
+
+    return [
+        {key: value for key, value in record.items() if pd.notna(value)}
+        for record in annual.to_dict("records")
+    ]
 
 
 def upsert_annual_reports(supabase: Client, annual_data: list, company_id_map: dict):
@@ -0,0 +1,521 @@
+"""
+Async Stock API Client - 비동기 주가/뉴스/공시 클라이언트
+StockAPIClient와 같은 메서드 구성을 async로 제공 (httpx, HTTP/2 + 커넥션 풀)
+- 한 스레드의 이벤트 루프에서 수백 개의 요청을 동시에 처리 (스트리밍 채팅, MCP 서버, 일괄 수집)
+- rate limiter / 응답 캐시 / circuit breaker는 동기 클라이언트와 같은 인스턴스를 공유
+- yfinance fallback은 동기 클라이언트와 같은 함수를 스레드에서 실행
+- SyncStockAPIFacade: 동기 코드에서 전용 이벤트 루프 스레드로 호출하는 얇은 래퍼
+"""
+
+import asyncio
+import copy
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+try:
+    from data.stock_api_client import (
+        OPTIONAL_MIN_BUDGET,
+        RATE_LIMIT_WAIT_SECONDS,
+        StockAPIClient,
+        format_news_text,
+        format_quote_text,
+        is_valid_quote,
+        quote_columns,
+        yfinance_basic_financials,
+        yfinance_bulk_quotes,
+        yfinance_candles,
+        yfinance_price_target,
+        yfinance_quote,
+    )
+    from utils.api_cache import get_response_cache, make_key, ttl_for
+    from utils.candle_cache import get_candle_cache
+    from utils.circuit_breaker import get_circuit_breaker
+    from utils.rate_limiter import get_rate_limiter
+except ImportError:
+    from src.data.stock_api_client import (
+        OPTIONAL_MIN_BUDGET,
+        RATE_LIMIT_WAIT_SECONDS,
+        StockAPIClient,
+        format_news_text,
+        format_quote_text,
+        is_valid_quote,
+        quote_columns,
+        yfinance_basic_financials,
+        yfinance_bulk_quotes,
+        yfinance_candles,
+        yfinance_price_target,
+        yfinance_quote,
+    )
+    from src.utils.api_cache import get_response_cache, make_key, ttl_for
+    from src.utils.candle_cache import get_candle_cache
+    from src.utils.circuit_breaker import get_circuit_breaker
+    from src.utils.rate_limiter import get_rate_limiter
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT_SECONDS = 10
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+# get_quotes 동시 요청 수 (토큰 버킷이 실제 호출 속도를 제한)
+QUOTE_BATCH_CONCURRENCY = 50
+
+
+def _make_http_client() -> httpx.AsyncClient:
+    """HTTP/2 + 커넥션 풀 클라이언트 (h2 패키지가 없으면 HTTP/1.1)"""
+    options = dict(
+        timeout=REQUEST_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+    try:
+        return httpx.AsyncClient(http2=True, **options)
+    except ImportError:
+        logger.info("h2 not installed, using HTTP/1.1 connection pool")
+        return httpx.AsyncClient(**options)
+
+
+class AsyncStockAPIClient:
+    """
+    비동기 Stock API 클라이언트 (Finnhub + yfinance)
+
+    Usage:
+        async with AsyncStockAPIClient() as client:
+            quotes = await asyncio.gather(*(client.get_quote(s) for s in symbols))
+    """
+
+    BASE_URL = StockAPIClient.BASE_URL
+    FMP_BASE_URL = StockAPIClient.FMP_BASE_URL
+
+    def __init__(self, api_key: str = None, priority: int = None):
+        """Initialize async Stock API client
+
+        Args:
+            api_key: Finnhub API 키 (기본: FINNHUB_API_KEY)
+            priority: rate limiter 우선순위 (기본: 호출 컨텍스트의 우선순위)
+        """
+        self.api_key = (api_key or os.getenv("FINNHUB_API_KEY") or "").strip() or None
+        self.fmp_api_key = (os.getenv("FMP_API_KEY") or "").strip() or None
+
+        if self.api_key == "your_finnhub_api_key_here":
+            self.api_key = None
+        if not self.api_key:
+            logger.warning(
+                "FINNHUB_API_KEY not set. Get free key at https://finnhub.io"
+            )
+
+        self.priority = priority
+        # 동기 클라이언트와 같은 예산/캐시/차단기 공유
+        self.limiter = get_rate_limiter("finnhub")
+        self.cache = get_response_cache("finnhub")
+        self.breaker = get_circuit_breaker("finnhub")
+        self.candles = get_candle_cache()
+
+        # 이벤트 루프별 HTTP 클라이언트 (커넥션은 생성한 루프에서만 사용 가능)
+        self._http: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._http_lock = threading.Lock()
+        self._closing: set = set()  # 정리 중인 태스크 (완료 전 GC 방지)
+
+    def _client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프용 HTTP 클라이언트 (루프당 하나, 종료된 루프의 클라이언트는 정리)"""
+        loop = asyncio.get_running_loop()
+        with self._http_lock:
+            stale = [other for other in self._http if other.is_closed()]
+            discarded = [self._http.pop(other) for other in stale]
+            http = self._http.get(loop)
+            if http is None:
+                http = self._http[loop] = _make_http_client()
+        for old in discarded:
+            task = loop.create_task(self._discard(old))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        return http
+
+    @staticmethod
+    async def _discard(http: httpx.AsyncClient) -> None:
+        """종료된 루프에서 만든 클라이언트 정리 (소켓 해제, 루프 종료로 인한 오류는 무시)"""
+        try:
+            await http.aclose()
+        except Exception as e:
+            logger.debug(f"Discarded HTTP client close failed: {e!r}")
+
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 HTTP 클라이언트 종료"""
+        with self._http_lock:
+            http = self._http.pop(asyncio.get_running_loop(), None)
+        if http is not None:
+            await http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def _request(
+        self, endpoint: str, params: dict = None, optional: bool = False
+    ) -> Optional[Dict]:
+        """Make API request (StockAPIClient._request와 같은 규칙)"""
+        if not self.api_key:
+            return {"error": "Finnhub API key not configured"}
+
+        cache_key = make_key(endpoint, params)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return copy.copy(cached)
+
+        if optional and self.limiter.remaining() < OPTIONAL_MIN_BUDGET:
+            logger.info(f"Finnhub budget low, skipping optional endpoint: {endpoint}")
+            return {"error": "Rate limit budget low; optional endpoint skipped"}
+
+        if not self.breaker.allow(endpoint):
+            return {"error": f"Finnhub endpoint temporarily unavailable: {endpoint}"}
+
+        if not await self.limiter.acquire_async(
+            self.priority, timeout=RATE_LIMIT_WAIT_SECONDS
+        ):
+            logger.warning(f"Finnhub rate limit wait timed out: {endpoint}")
+            return {"error": "Rate limit wait timed out"}
+
+        params = dict(params or {}, token=self.api_key)
+
+        try:
+            response = await self._client().get(
+                f"{self.BASE_URL}/{endpoint}", params=params
+            )
+            response.raise_for_status()
+            result = response.json()
+            self.breaker.record_success(endpoint)
+            if not (isinstance(result, dict) and "error" in result):
+                self.cache.set(cache_key, result, ttl_for(endpoint, result))
+            return copy.copy(result)
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if status == 403:
+                self.breaker.record_failure(endpoint, unavailable=True)
+                logger.warning(
+                    f"Finnhub API 403 Forbidden (Premium endpoint?): {endpoint}"
+                )
+                return {
+                    "error": "Prediction/Premium endpoint not available on this plan"
+                }
+            if status == 429:
+                self.limiter.drain()
+                logger.warning(f"Finnhub API 429 Too Many Requests: {endpoint}")
+                return {"error": "Finnhub rate limit exceeded"}
+            if status >= 500:
+                self.breaker.record_failure(endpoint)
+            logger.error(f"Finnhub API error: {e}")
+            return {"error": str(e)}
+        except httpx.RequestError as e:
+            # 타임아웃/연결 오류
+            self.breaker.record_failure(endpoint)
+            logger.error(f"Finnhub API error: {e!r}")
+            return {"error": str(e) or type(e).__name__}
+        except ValueError as e:
+            logger.error(f"Finnhub API invalid JSON: {e}")
+            return {"error": str(e)}
+
+    def invalidate_cache(self, symbol: str = None, endpoint: str = None) -> int:
+        """응답 캐시 무효화 (동기 클라이언트와 공유)"""
+        return self.cache.invalidate(symbol=symbol, endpoint=endpoint)
+
+    # ========== 주가 데이터 ==========
+
+    async def get_quote(self, symbol: str) -> Dict:
+        """실시간 주가 조회 (Finnhub 실패 시 yfinance로 fallback)"""
+        result = await self._request("quote", {"symbol": symbol.upper()})
+        if is_valid_quote(result):
+            return result
+        return await asyncio.to_thread(yfinance_quote, symbol)
+
+    async def get_quotes(
+        self, symbols: List[str], concurrency: int = QUOTE_BATCH_CONCURRENCY
+    ) -> Dict[str, list]:
+        """여러 종목 시세 일괄 조회 (StockAPIClient.get_quotes와 같은 컬럼형 결과)"""
+        symbols = list(
+            dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip())
+        )
+        quotes: Dict[str, Dict] = {}
+
+        if self.api_key and symbols:
+            finnhub_symbols = symbols[: max(0, int(self.limiter.remaining()))]
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch(symbol: str):
+                async with semaphore:
+                    return await self._request("quote", {"symbol": symbol})
+
+            results = await asyncio.gather(*(fetch(s) for s in finnhub_symbols))
+            for symbol, result in zip(finnhub_symbols, results):
+                if is_valid_quote(result):
+                    quotes[symbol] = {**result, "source": "finnhub"}
+
+        missing = [s for s in symbols if s not in quotes]
+        if missing:
+            quotes.update(await asyncio.to_thread(yfinance_bulk_quotes, missing))
+
+        return quote_columns(symbols, quotes)
+
+    async def get_candles(
+        self,
+        symbol: str,
+        resolution: str = "D",
+        from_date: datetime = None,
+        to_date: datetime = None,
+    ) -> Dict:
+        """캔들 차트 데이터 (OHLCV, 캔들 캐시에 없는 앞/뒤 구간만 조회)"""
+        to_date = to_date or datetime.now()
+        from_date = from_date or (to_date - timedelta(days=30))
+
+        async def fetch(start: int, end: int) -> Dict:
+            result = await self._request(
+                "stock/candle",
+                {"symbol": symbol.upper(), "resolution": resolution, "from": start, "to": end},
+            )
+            if result and result.get("s") in ("ok", "no_data"):
+                return result
+            return await asyncio.to_thread(
+                yfinance_candles, symbol, start, end, resolution
+            )
+
+        return await self.candles.aget(
+            symbol,
+            resolution,
+            int(from_date.timestamp()),
+            int(to_date.timestamp()),
+            fetch,
+        )
+
+    # ========== 기업 정보 ==========
+
+    async def get_company_profile(self, symbol: str) -> Dict:
+        """기업 프로필 조회"""
+        return await self._request("stock/profile2", {"symbol": symbol.upper()})
+
+    async def get_company_peers(self, symbol: str) -> List[str]:
+        """경쟁사/유사기업 목록"""
+        result = await self._request(
+            "stock/peers", {"symbol": symbol.upper()}, optional=True
+        )
+        return result if isinstance(result, list) else []
+
+    # ========== 뉴스 ==========
+
+    async def get_company_news(
+        self, symbol: str, from_date: str = None, to_date: str = None
+    ) -> List[Dict]:
+        """기업 관련 뉴스 조회"""
+        to_date = to_date or datetime.now().strftime("%Y-%m-%d")
+        from_date = from_date or (datetime.now() - timedelta(days=7)).strftime(
+            "%Y-%m-%d"
+        )
+        result = await self._request(
+            "company-news", {"symbol": symbol.upper(), "from": from_date, "to": to_date}
+        )
+        return result if isinstance(result, list) else []
+
+    async def get_market_news(self, category: str = "general") -> List[Dict]:
+        """시장 전체 뉴스"""
+        result = await self._request("news", {"category": category})
+        return result if isinstance(result, list) else []
+
+    # ========== SEC 공시 ==========
+
+    async def get_sec_filings(
+        self,
+        symbol: str = None,
+        cik: str = None,
+        form: str = None,
+        from_date: str = None,
+        to_date: str = None,
+    ) -> List[Dict]:
+        """SEC 공시 목록 조회"""
+        params = {}
+        if symbol:
+            params["symbol"] = symbol.upper()
+        if cik:
+            params["cik"] = cik
+        if form:
+            params["form"] = form
+        if from_date:
+            params["from"] = from_date
+        if to_date:
+            params["to"] = to_date
+
+        result = await self._request("stock/filings", params)
+        return result if isinstance(result, list) else []
+
+    # ========== 재무 데이터 ==========
+
+    async def get_basic_financials(self, symbol: str, metric: str = "all") -> Dict:
+        """기본 재무 지표 (Finnhub 실패 시 yfinance로 fallback)"""
+        result = await self._request(
+            "stock/metric", {"symbol": symbol.upper(), "metric": metric}
+        )
+        if result and "metric" in result and result["metric"]:
+            return result
+        return await asyncio.to_thread(yfinance_basic_financials, symbol)
+
+    async def get_financials_reported(self, symbol: str, freq: str = "annual") -> Dict:
+        """실제 보고된 재무제표 데이터"""
+        return await self._request(
+            "stock/financials-reported", {"symbol": symbol.upper(), "freq": freq}
+        )
+
+    async def get_earnings(self, symbol: str) -> List[Dict]:
+        """실적 발표 데이터 (EPS)"""
+        result = await self._request("stock/earnings", {"symbol": symbol.upper()})
+        return result if isinstance(result, list) else []
+
+    # ========== 추천/분석 ==========
+
+    async def get_recommendation_trends(self, symbol: str) -> List[Dict]:
+        """애널리스트 추천 트렌드 (Buy/Hold/Sell)"""
+        result = await self._request(
+            "stock/recommendation", {"symbol": symbol.upper()}, optional=True
+        )
+        return result if isinstance(result, list) else []
+
+    async def get_price_target(self, symbol: str) -> Dict:
+        """목표 주가 (Finnhub 실패 시 yfinance로 fallback)"""
+        result = await self._request("stock/price-target", {"symbol": symbol.upper()})
+        if result and "error" not in result:
+            return result
+        return await asyncio.to_thread(yfinance_price_target, symbol)
+
+    async def get_earnings_surprises(self, symbol: str) -> List[Dict]:
+        """실적 서프라이즈 데이터"""
+        return await self.get_earnings(symbol)
+
+    # ========== 캘린더 (FMP) ==========
+
+    async def get_earnings_calendar(
+        self, from_date: str = None, to_date: str = None
+    ) -> List[Dict]:
+        """실적 발표 캘린더 (FMP API 사용)"""
+        if not self.fmp_api_key:
+            logger.warning("FMP API Key가 없어 캘린더 조회 불가")
+            return []
+
+        from_date = from_date or datetime.now().strftime("%Y-%m-%d")
+        to_date = to_date or (datetime.now() + timedelta(days=14)).strftime("%Y-%m-%d")
+
+        try:
+            response = await self._client().get(
+                f"{self.FMP_BASE_URL}/earning_calendar",
+                params={"from": from_date, "to": to_date, "apikey": self.fmp_api_key},
+            )
+            response.raise_for_status()
+            data = response.json()
+            return data if isinstance(data, list) else []
+        except Exception as e:
+            logger.error(f"FMP Earnings Calendar API error: {e}")
+            return []
+
+    # ========== 유틸리티 ==========
+
+    async def format_quote_summary(self, symbol: str) -> str:
+        """주가 정보를 읽기 쉬운 텍스트로 변환"""
+        return format_quote_text(symbol, await self.get_quote(symbol))
+
+    async def format_news_summary(self, symbol: str, limit: int = 5) -> str:
+        """최근 뉴스를 읽기 쉬운 텍스트로 변환"""
+        news = await self.get_company_news(symbol)
+        return format_news_text(symbol, news[:limit])
+
+
+class SyncStockAPIFacade:
+    """
+    AsyncStockAPIClient의 동기 래퍼
+    전용 이벤트 루프 스레드 하나에서 요청을 실행하므로 여러 스레드가 동시에 호출해도
+    OS 스레드는 늘어나지 않고 HTTP/2 커넥션 풀을 공유합니다.
+
+    Usage:
+        api = get_sync_stock_api_facade()
+        api.get_quote("AAPL")
+        api.gather(api.client.get_quote("AAPL"), api.client.get_quote("MSFT"))
+    """
+
+    def __init__(self, client: Optional[AsyncStockAPIClient] = None):
+        # 기본은 전용 클라이언트 (close()가 다른 루프에서 쓰는 클라이언트에 영향 없음)
+        self.client = client or AsyncStockAPIClient()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="stock-api-loop", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """코루틴을 이벤트 루프 스레드에서 실행하고 결과를 기다림"""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        return future.result(timeout)
+
+    def gather(self, *coros, timeout: Optional[float] = None) -> list:
+        """여러 코루틴을 동시에 실행"""
+
+        async def _gather():
+            return await asyncio.gather(*coros)
+
+        return self.run(_gather(), timeout)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.client, name)
+        if not asyncio.iscoroutinefunction(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            return self.run(attr(*args, **kwargs))
+
+        call.__name__ = name
+        call.__doc__ = attr.__doc__
+        return call
+
+    def close(self) -> None:
+        """HTTP 클라이언트와 이벤트 루프 종료"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.client.aclose(), loop).result(5)
+        loop.call_soon_threadsafe(loop.stop)
+
+
+# 싱글톤 인스턴스
+_async_client = None
+_facade = None
+_singleton_lock = threading.Lock()
+
+
+def get_async_stock_api_client() -> AsyncStockAPIClient:
+    """Get or create async Stock API client singleton"""
+    global _async_client
+    with _singleton_lock:
+        if _async_client is None:
+            _async_client = AsyncStockAPIClient()
+        return _async_client
+
+
+def get_sync_stock_api_facade() -> SyncStockAPIFacade:
+    """Get or create sync facade singleton (own client; cache/budget still shared)"""
+    global _facade
+    with _singleton_lock:
+        if _facade is None:
+            _facade = SyncStockAPIFacade()
+        return _facade
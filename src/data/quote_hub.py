@@ -0,0 +1,374 @@
+"""
+Quote Hub - 실시간 시세 단일 구독 허브
+모든 Streamlit 세션이 관심 종목 시세를 각자 폴링하지 않도록, 프로세스당 하나의
+업스트림 구독(Finnhub websocket, 불가 시 get_quotes 폴링)으로 전체 세션이 보는
+종목의 합집합만 받아 최신 체결값을 공유 메모리에 보관합니다.
+
+- 세션별 구독은 참조 카운트로 관리 (0 -> 1일 때만 업스트림 구독, 1 -> 0일 때 해지)
+- 세션은 subscribe()를 재호출해 임대(lease)를 갱신, 갱신이 끊긴 세션은 자동 정리
+- snapshot()으로 최신값 조회, wait_for_update()/add_listener()로 변경 구독
+- 업스트림 부하는 사용자 수가 아니라 고유 종목 수에 비례
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+try:
+    from utils.rate_limiter import BACKGROUND, request_priority
+except ImportError:
+    from src.utils.rate_limiter import BACKGROUND, request_priority
+
+logger = logging.getLogger(__name__)
+
+FINNHUB_WS_URL = "wss://ws.finnhub.io"
+POLL_INTERVAL_SECONDS = float(os.getenv("QUOTE_HUB_POLL_INTERVAL", "15"))
+LEASE_SECONDS = 120  # 이 시간 동안 subscribe() 갱신이 없으면 세션 구독 해지
+WS_RECV_TIMEOUT = 1.0  # 구독 변경 반영 주기
+WS_MAX_FAILURES = 3  # 연속 실패 시 폴링 모드로 전환
+WS_RETRY_SECONDS = 300  # 폴링 모드에서 websocket 재시도 간격
+
+Listener = Callable[[str, Dict], None]
+
+
+class QuoteHub:
+    """
+    세션 간 공유되는 실시간 시세 허브
+
+    Usage:
+        hub = get_quote_hub()
+        hub.subscribe(session_id, ["AAPL", "MSFT"])
+        hub.snapshot(["AAPL", "MSFT"])  # {"AAPL": {"price": ..., ...}, ...}
+    """
+
+    def __init__(
+        self,
+        client=None,
+        ws_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        use_websocket: bool = True,
+    ):
+        self._client = client
+        self.api_key = api_key if api_key is not None else os.getenv("FINNHUB_API_KEY")
+        self.ws_url = ws_url or FINNHUB_WS_URL
+        self.poll_interval = poll_interval
+        self.use_websocket = use_websocket
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._sessions: Dict[str, Dict[str, float]] = {}  # session -> {symbol: lease}
+        self._refs: Dict[str, int] = {}  # symbol -> 구독 세션 수
+        self._ticks: Dict[str, Dict] = {}
+        self._version = 0
+        self._listeners: List[Listener] = []
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.mode = "idle"
+
+    @property
+    def client(self):
+        if self._client is None:
+            try:
+                from data.stock_api_client import get_stock_api_client
+            except ImportError:
+                from src.data.stock_api_client import get_stock_api_client
+
+            self._client = get_stock_api_client()
+        return self._client
+
+    # ------------------------------------------------------------------
+    # 세션 구독 (참조 카운트)
+    # ------------------------------------------------------------------
+
+    def subscribe(self, session_id: str, symbols: Iterable[str]) -> None:
+        """세션의 관심 종목 등록/임대 갱신 (목록에서 빠진 종목은 해지)"""
+        wanted = {s.strip().upper() for s in symbols if s and s.strip()}
+        expires = time.time() + LEASE_SECONDS
+        with self._lock:
+            current = self._sessions.setdefault(session_id, {})
+            added = wanted - set(current)
+            for symbol in set(current) - wanted:
+                self._release(current, symbol)
+            for symbol in wanted:
+                current[symbol] = expires
+            new_upstream = [s for s in added if self._acquire(s)]
+
+        self._ensure_running()
+        if new_upstream:
+            # websocket은 다음 체결 전까지 값이 없으므로 현재 시세로 초기값 채움
+            threading.Thread(
+                target=self._seed, args=(new_upstream,), daemon=True
+            ).start()
+
+    def unsubscribe(self, session_id: str, symbols: Optional[Iterable[str]] = None) -> None:
+        """세션 구독 해지 (symbols 미지정 시 전체)"""
+        with self._lock:
+            current = self._sessions.get(session_id)
+            if not current:
+                return
+            targets = (
+                list(current)
+                if symbols is None
+                else [s.upper() for s in symbols if s.upper() in current]
+            )
+            for symbol in targets:
+                self._release(current, symbol)
+            if not current:
+                del self._sessions[session_id]
+
+    def _acquire(self, symbol: str) -> bool:
+        """참조 증가, 첫 구독이면 True (lock 보유 상태에서 호출)"""
+        self._refs[symbol] = self._refs.get(symbol, 0) + 1
+        return self._refs[symbol] == 1
+
+    def _release(self, leases: Dict[str, float], symbol: str) -> None:
+        """참조 감소, 마지막 구독이면 업스트림 목록에서 제거 (lock 보유 상태)"""
+        leases.pop(symbol, None)
+        count = self._refs.get(symbol, 0) - 1
+        if count > 0:
+            self._refs[symbol] = count
+        else:
+            self._refs.pop(symbol, None)
+
+    def _expire_leases(self) -> None:
+        now = time.time()
+        with self._lock:
+            for session_id in list(self._sessions):
+                leases = self._sessions[session_id]
+                for symbol in [s for s, exp in leases.items() if exp <= now]:
+                    self._release(leases, symbol)
+                if not leases:
+                    del self._sessions[session_id]
+
+    def watched_symbols(self) -> Set[str]:
+        """현재 업스트림에서 받아야 하는 종목 (전체 세션 합집합)"""
+        with self._lock:
+            return set(self._refs)
+
+    # ------------------------------------------------------------------
+    # 조회 / 변경 구독
+    # ------------------------------------------------------------------
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def snapshot(self, symbols: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+        """최신 시세 복사본"""
+        with self._lock:
+            if symbols is None:
+                return {s: dict(t) for s, t in self._ticks.items()}
+            return {
+                s.upper(): dict(self._ticks[s.upper()])
+                for s in symbols
+                if s and s.upper() in self._ticks
+            }
+
+    def wait_for_update(self, since_version: int, timeout: float = None) -> int:
+        """since_version 이후 변경이 생길 때까지 대기 후 현재 버전 반환"""
+        with self._changed:
+            self._changed.wait_for(lambda: self._version > since_version, timeout)
+            return self._version
+
+    def add_listener(self, listener: Listener) -> None:
+        """시세 변경 콜백 등록 (업스트림 스레드에서 호출되므로 빠르게 반환해야 함)"""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _publish(self, symbol: str, update: Dict) -> None:
+        with self._changed:
+            tick = self._ticks.setdefault(symbol, {"symbol": symbol})
+            if update.get("t") and tick.get("t") and update["t"] < tick["t"]:
+                # 더 최신 체결이 이미 반영됨 (폴링 응답이 websocket보다 늦게 도착)
+                update = {"prev_close": update.get("prev_close")}
+            tick.update({k: v for k, v in update.items() if v is not None})
+            prev_close = tick.get("prev_close")
+            if tick.get("price") is not None and prev_close:
+                tick["change"] = tick["price"] - prev_close
+                tick["change_pct"] = tick["change"] / prev_close * 100
+            tick["updated_at"] = time.time()
+            self._version += 1
+            self._changed.notify_all()
+            listeners = list(self._listeners)
+            snapshot = dict(tick)
+
+        for listener in listeners:
+            try:
+                listener(symbol, snapshot)
+            except Exception as e:
+                logger.warning(f"Quote listener failed: {e}")
+
+    def _publish_quotes(self, quotes: Dict[str, list]) -> None:
+        """get_quotes 컬럼형 결과 반영"""
+        for i, symbol in enumerate(quotes.get("symbol", [])):
+            price = quotes["c"][i]
+            if price is None:
+                continue
+            self._publish(
+                symbol,
+                {
+                    "price": price,
+                    "prev_close": quotes["pc"][i],
+                    "t": quotes["t"][i],
+                    "source": quotes["source"][i],
+                },
+            )
+
+    def _seed(self, symbols: List[str]) -> None:
+        try:
+            self._publish_quotes(self.client.get_quotes(symbols))
+        except Exception as e:
+            logger.warning(f"Quote hub seed failed: {e}")
+
+    # ------------------------------------------------------------------
+    # 업스트림 (websocket / 폴링)
+    # ------------------------------------------------------------------
+
+    def _ensure_running(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="quote-hub", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """업스트림 스레드 종료"""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5)
+        self.mode = "idle"
+
+    def _websocket_available(self) -> bool:
+        if not self.use_websocket:
+            return False
+        try:
+            import websockets  # noqa: F401
+        except ImportError:
+            return False
+        # Finnhub은 토큰이 필요, 로컬 스텁 등 직접 지정한 URL은 토큰 없이 허용
+        return bool(self.api_key) or self.ws_url != FINNHUB_WS_URL
+
+    def _run(self) -> None:
+        next_ws_try = 0.0
+        while not self._stop.is_set():
+            if self._websocket_available() and time.time() >= next_ws_try:
+                self.mode = "websocket"
+                try:
+                    asyncio.run(self._websocket_loop())
+                except Exception as e:
+                    logger.warning(f"Quote hub websocket stopped: {e}")
+                if self._stop.is_set():
+                    break
+                next_ws_try = time.time() + WS_RETRY_SECONDS
+
+            self.mode = "polling"
+            self._poll_once()
+            self._stop.wait(self.poll_interval)
+        self.mode = "idle"
+
+    def _poll_once(self) -> None:
+        self._expire_leases()
+        symbols = sorted(self.watched_symbols())
+        if symbols:
+            # 주기적 폴링은 백그라운드 작업 (대화형 요청용 예산을 남겨둠)
+            with request_priority(BACKGROUND):
+                self._seed(symbols)
+
+    def _ws_endpoint(self) -> str:
+        if self.api_key and self.ws_url == FINNHUB_WS_URL:
+            return f"{self.ws_url}?token={self.api_key}"
+        return self.ws_url
+
+    async def _websocket_loop(self) -> None:
+        """websocket 구독 유지 (연속 실패 WS_MAX_FAILURES회 시 반환 → 폴링)"""
+        import websockets
+
+        failures = 0
+        while not self._stop.is_set() and failures < WS_MAX_FAILURES:
+            upstream: Set[str] = set()
+            try:
+                async with websockets.connect(self._ws_endpoint()) as ws:
+                    failures = 0
+                    while not self._stop.is_set():
+                        self._expire_leases()
+                        upstream = await self._sync_subscriptions(ws, upstream)
+                        try:
+                            message = await asyncio.wait_for(ws.recv(), WS_RECV_TIMEOUT)
+                        except asyncio.TimeoutError:
+                            continue
+                        self._handle_message(message)
+            except Exception as e:
+                failures += 1
+                logger.warning(f"Quote hub websocket error ({failures}): {e}")
+                await asyncio.sleep(min(2**failures, 30))
+
+    async def _sync_subscriptions(self, ws, upstream: Set[str]) -> Set[str]:
+        wanted = self.watched_symbols()
+        for symbol in sorted(wanted - upstream):
+            await ws.send(json.dumps({"type": "subscribe", "symbol": symbol}))
+        for symbol in sorted(upstream - wanted):
+            await ws.send(json.dumps({"type": "unsubscribe", "symbol": symbol}))
+        return wanted
+
+    def _handle_message(self, message) -> None:
+        try:
+            payload = json.loads(message)
+        except (TypeError, ValueError):
+            return
+        if payload.get("type") != "trade":
+            return
+
+        # 같은 메시지 안의 체결은 종목별 마지막 값만 반영
+        latest: Dict[str, Dict] = {}
+        for trade in payload.get("data") or []:
+            symbol = trade.get("s")
+            if symbol:
+                latest[symbol] = trade
+        for symbol, trade in latest.items():
+            self._publish(
+                symbol,
+                {
+                    "price": trade.get("p"),
+                    "volume": trade.get("v"),
+                    "t": int(trade["t"] / 1000) if trade.get("t") else None,
+                    "source": "finnhub-ws",
+                },
+            )
+
+    def status(self) -> Dict:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "sessions": len(self._sessions),
+                "symbols": len(self._refs),
+                "ticks": len(self._ticks),
+                "version": self._version,
+            }
+
+
+_hub: Optional[QuoteHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_quote_hub() -> QuoteHub:
+    """프로세스 공유 시세 허브"""
+    global _hub
+    with _hub_lock:
+        if _hub is None:
+            _hub = QuoteHub()
+        return _hub
@@ -4,16 +4,51 @@ Finnhub API + yfinance fallback 지원
 """
 
 import os
+import copy
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import requests
 from dotenv import load_dotenv
 
+try:
+    from utils import yf_memo
+    from utils.api_cache import get_response_cache, make_key, ttl_for
+    from utils.candle_cache import RESOLUTION_SECONDS, get_candle_cache
+    from utils.circuit_breaker import get_circuit_breaker
+    from utils.rate_limiter import get_rate_limiter
+except ImportError:
+    from src.utils import yf_memo
+    from src.utils.api_cache import get_response_cache, make_key, ttl_for
+    from src.utils.candle_cache import RESOLUTION_SECONDS, get_candle_cache
+    from src.utils.circuit_breaker import get_circuit_breaker
+    from src.utils.rate_limiter import get_rate_limiter
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# 토큰 대기 최대 시간 (초과 시 에러 dict 반환 → yfinance fallback)
+RATE_LIMIT_WAIT_SECONDS = 30
+# 남은 예산이 이보다 적으면 선택적 엔드포인트(peers, recommendations) 생략
+OPTIONAL_MIN_BUDGET = 10
+# get_quotes 병렬 요청 수 및 컬럼 순서
+QUOTE_BATCH_WORKERS = 8
+QUOTE_COLUMNS = ("symbol", "c", "d", "dp", "h", "l", "o", "pc", "t", "source")
+# Finnhub resolution -> yfinance interval
+YF_INTERVALS = {
+    "1": "1m",
+    "5": "5m",
+    "15": "15m",
+    "30": "30m",
+    "60": "60m",
+    "D": "1d",
+    "W": "1wk",
+    "M": "1mo",
+}
+
 
 class StockAPIClient:
     """
@@ -29,8 +64,13 @@ class StockAPIClient:
     BASE_URL = "https://finnhub.io/api/v1"
     FMP_BASE_URL = "https://financialmodelingprep.com/api/v3"
 
-    def __init__(self, api_key: str = None):
-        """Initialize Stock API client"""
+    def __init__(self, api_key: str = None, priority: int = None):
+        """Initialize Stock API client
+
+        Args:
+            api_key: Finnhub API 키 (기본: FINNHUB_API_KEY)
+            priority: rate limiter 우선순위 (기본: 호출 컨텍스트의 우선순위)
+        """
         self.api_key = api_key or os.getenv("FINNHUB_API_KEY")
         self.fmp_api_key = os.getenv("FMP_API_KEY")
 
@@ -50,12 +90,46 @@ class StockAPIClient:
             logger.warning("FMP_API_KEY not set. Some features may be limited.")
 
         self.session = requests.Session()
-
-    def _request(self, endpoint: str, params: dict = None) -> Optional[Dict]:
-        """Make API request"""
+        self.priority = priority
+        # 같은 API 키를 쓰는 모든 클라이언트/워커가 공유하는 호출 예산
+        self.limiter = get_rate_limiter("finnhub")
+        # 엔드포인트별 TTL 응답 캐시 (모든 클라이언트 인스턴스 공유)
+        self.cache = get_response_cache("finnhub")
+        # 프리미엄 전용/장애 엔드포인트는 쿨다운 동안 요청 없이 바로 fallback
+        self.breaker = get_circuit_breaker("finnhub")
+        # (심볼, 해상도)별 캔들 시계열 (빠진 구간만 추가 조회)
+        self.candles = get_candle_cache()
+
+    def _request(
+        self, endpoint: str, params: dict = None, optional: bool = False
+    ) -> Optional[Dict]:
+        """Make API request
+
+        Args:
+            endpoint: Finnhub 엔드포인트
+            params: 쿼리 파라미터
+            optional: True면 호출 예산이 부족할 때 요청하지 않고 바로 에러 반환
+        """
         if not self.api_key:
             return {"error": "Finnhub API key not configured"}
 
+        cache_key = make_key(endpoint, params)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            # 호출자가 결과를 수정해도 캐시 원본이 바뀌지 않도록 얕은 복사
+            return copy.copy(cached)
+
+        if optional and self.limiter.remaining() < OPTIONAL_MIN_BUDGET:
+            logger.info(f"Finnhub budget low, skipping optional endpoint: {endpoint}")
+            return {"error": "Rate limit budget low; optional endpoint skipped"}
+
+        if not self.breaker.allow(endpoint):
+            return {"error": f"Finnhub endpoint temporarily unavailable: {endpoint}"}
+
+        if not self.limiter.acquire(self.priority, timeout=RATE_LIMIT_WAIT_SECONDS):
+            logger.warning(f"Finnhub rate limit wait timed out: {endpoint}")
+            return {"error": "Rate limit wait timed out"}
+
         params = params or {}
         params["token"] = self.api_key
 
@@ -64,21 +138,40 @@ class StockAPIClient:
                 f"{self.BASE_URL}/{endpoint}", params=params, timeout=10
             )
             response.raise_for_status()
-            return response.json()
+            result = response.json()
+            self.breaker.record_success(endpoint)
+            if not (isinstance(result, dict) and "error" in result):
+                self.cache.set(cache_key, result, ttl_for(endpoint, result))
+            return copy.copy(result)
         except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 403:
+            status = e.response.status_code
+            if status == 403:
+                self.breaker.record_failure(endpoint, unavailable=True)
                 logger.warning(
                     f"Finnhub API 403 Forbidden (Premium endpoint?): {endpoint}"
                 )
                 return {
                     "error": "Prediction/Premium endpoint not available on this plan"
                 }
+            if status == 429:
+                # 다른 프로세스/키 사용분까지 반영되도록 로컬 예산도 비움
+                self.limiter.drain()
+                logger.warning(f"Finnhub API 429 Too Many Requests: {endpoint}")
+                return {"error": "Finnhub rate limit exceeded"}
+            if status >= 500:
+                self.breaker.record_failure(endpoint)
             logger.error(f"Finnhub API error: {e}")
             return {"error": str(e)}
         except requests.exceptions.RequestException as e:
+            # 타임아웃/연결 오류
+            self.breaker.record_failure(endpoint)
             logger.error(f"Finnhub API error: {e}")
             return {"error": str(e)}
 
+    def invalidate_cache(self, symbol: str = None, endpoint: str = None) -> int:
+        """응답 캐시 무효화 (symbol/endpoint 미지정 시 전체)"""
+        return self.cache.invalidate(symbol=symbol, endpoint=endpoint)
+
     # ========== 주가 데이터 ==========
 
     def get_quote(self, symbol: str) -> Dict:
@@ -91,36 +184,58 @@ class StockAPIClient:
         result = self._request("quote", {"symbol": symbol.upper()})
 
         # Finnhub 성공 시 반환 (c 값이 0보다 큰 경우)
-        if result and result.get("c", 0) > 0:
+        if is_valid_quote(result):
             return result
 
         # yfinance fallback
-        try:
-            import yfinance as yf
+        return yfinance_quote(symbol)
 
-            ticker = yf.Ticker(symbol.upper())
-            info = ticker.info
+    def get_quotes(
+        self, symbols: List[str], max_workers: int = QUOTE_BATCH_WORKERS
+    ) -> Dict[str, list]:
+        """
+        여러 종목 시세 일괄 조회 (관심 종목/대시보드용)
 
-            if not info or "symbol" not in info:
-                return {"error": "주가 데이터를 가져오지 못했습니다.", "c": 0}
+        Finnhub quote를 남은 호출 예산 안에서 병렬로 요청하고, 실패했거나 예산을
+        넘는 종목은 yf.download 1회로 한꺼번에 조회합니다.
 
-            current_price = info.get("currentPrice") or info.get(
-                "regularMarketPrice", 0
-            )
-            prev_close = info.get("previousClose", 0)
-
-            return {
-                "c": current_price,
-                "h": info.get("dayHigh", 0),
-                "l": info.get("dayLow", 0),
-                "o": info.get("open", 0),
-                "pc": prev_close,
-                "t": int(datetime.now().timestamp()),
-                "source": "yfinance",
-            }
-        except Exception as e:
-            logger.error(f"yfinance quote fallback failed: {e}")
-            return {"error": "주가 데이터를 가져오지 못했습니다.", "c": 0}
+        Returns:
+            입력 순서에 맞춘 컬럼형 dict
+            {"symbol": [...], "c": [...], "d": [...], "dp": [...], "h": [...],
+             "l": [...], "o": [...], "pc": [...], "t": [...], "source": [...]}
+            (조회 실패 종목은 값이 None)
+        """
+        symbols = list(
+            dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip())
+        )
+        quotes: Dict[str, Dict] = {}
+
+        if self.api_key and symbols:
+            # 예산을 넘는 종목은 토큰을 기다리지 않고 바로 일괄 fallback
+            finnhub_symbols = symbols[: max(0, int(self.limiter.remaining()))]
+            if finnhub_symbols:
+                workers = min(max_workers, len(finnhub_symbols))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    # 요청 우선순위(contextvar)가 워커 스레드에도 전달되도록 컨텍스트 복사
+                    futures = {
+                        symbol: executor.submit(
+                            contextvars.copy_context().run,
+                            self._request,
+                            "quote",
+                            {"symbol": symbol},
+                        )
+                        for symbol in finnhub_symbols
+                    }
+                for symbol, future in futures.items():
+                    result = future.result()
+                    if is_valid_quote(result):
+                        quotes[symbol] = {**result, "source": "finnhub"}
+
+        missing = [s for s in symbols if s not in quotes]
+        if missing:
+            quotes.update(yfinance_bulk_quotes(missing))
+
+        return quote_columns(symbols, quotes)
 
     def get_candles(
         self,
@@ -132,53 +247,33 @@ class StockAPIClient:
         """
         캔들 차트 데이터 (OHLCV)
         resolution: 1=1분, 5=5분, D=일봉, W=주봉, M=월봉
-        Finnhub 실패 시 yfinance로 fallback
+        캔들 캐시에 없는 앞/뒤 구간만 조회 (Finnhub 실패 시 yfinance로 fallback)
         """
         to_date = to_date or datetime.now()
         from_date = from_date or (to_date - timedelta(days=30))
 
+        return self.candles.get(
+            symbol,
+            resolution,
+            int(from_date.timestamp()),
+            int(to_date.timestamp()),
+            fetch=lambda start, end: self._fetch_candles(symbol, resolution, start, end),
+        )
+
+    def _fetch_candles(self, symbol: str, resolution: str, start: int, end: int) -> Dict:
+        """[start, end] 구간 캔들 조회 (캐시 미적용)"""
         # Finnhub 시도
         result = self._request(
             "stock/candle",
-            {
-                "symbol": symbol.upper(),
-                "resolution": resolution,
-                "from": int(from_date.timestamp()),
-                "to": int(to_date.timestamp()),
-            },
+            {"symbol": symbol.upper(), "resolution": resolution, "from": start, "to": end},
         )
 
-        # Finnhub 성공 시 반환
-        if result and result.get("s") == "ok":
+        # Finnhub 성공 시 반환 (no_data도 정상 응답)
+        if result and result.get("s") in ("ok", "no_data"):
             return result
 
         # yfinance fallback
-        try:
-            import yfinance as yf
-
-            # resolution을 yfinance period로 변환
-            days = (to_date - from_date).days
-            period = f"{days}d" if days <= 60 else "3mo"
-
-            ticker = yf.Ticker(symbol.upper())
-            hist = ticker.history(period=period)
-
-            if hist.empty:
-                return {"error": "주가 데이터를 가져오지 못했습니다."}
-
-            # Finnhub 형식으로 변환 (c, h, l, o, v, t)
-            return {
-                "s": "ok",
-                "c": hist["Close"].tolist(),
-                "h": hist["High"].tolist(),
-                "l": hist["Low"].tolist(),
-                "o": hist["Open"].tolist(),
-                "v": hist["Volume"].tolist(),
-                "t": [int(d.timestamp()) for d in hist.index],
-            }
-        except Exception as e:
-            logger.error(f"yfinance fallback failed: {e}")
-            return {"error": "주가 데이터를 가져오지 못했습니다."}
+        return yfinance_candles(symbol, start, end, resolution)
 
     # ========== 기업 정보 ==========
 
@@ -188,7 +283,9 @@ class StockAPIClient:
 
     def get_company_peers(self, symbol: str) -> List[str]:
         """경쟁사/유사기업 목록"""
-        result = self._request("stock/peers", {"symbol": symbol.upper()})
+        result = self._request(
+            "stock/peers", {"symbol": symbol.upper()}, optional=True
+        )
         return result if isinstance(result, list) else []
 
     # ========== 뉴스 ==========
@@ -265,46 +362,7 @@ class StockAPIClient:
             return result
 
         # yfinance fallback
-        try:
-            import yfinance as yf
-
-            ticker = yf.Ticker(symbol.upper())
-            info = ticker.info
-
-            if not info or "symbol" not in info:
-                return {"error": "재무 지표를 가져오지 못했습니다."}
-
-            return {
-                "symbol": symbol.upper(),
-                "metric": {
-                    "peBasicExclExtraTTM": info.get("trailingPE"),
-                    "peExclExtraHighTTM": info.get("forwardPE"),
-                    "pbAnnual": info.get("priceToBook"),
-                    "roeRfy": (
-                        (info.get("returnOnEquity", 0) or 0) * 100
-                        if info.get("returnOnEquity")
-                        else None
-                    ),
-                    "roaRfy": (
-                        (info.get("returnOnAssets", 0) or 0) * 100
-                        if info.get("returnOnAssets")
-                        else None
-                    ),
-                    "dividendYieldIndicatedAnnual": (
-                        (info.get("dividendYield", 0) or 0) * 100
-                        if info.get("dividendYield")
-                        else None
-                    ),
-                    "marketCapitalization": info.get("marketCap"),
-                    "52WeekHigh": info.get("fiftyTwoWeekHigh"),
-                    "52WeekLow": info.get("fiftyTwoWeekLow"),
-                    "beta": info.get("beta"),
-                },
-                "source": "yfinance",
-            }
-        except Exception as e:
-            logger.error(f"yfinance financials fallback failed: {e}")
-            return {"error": "재무 지표를 가져오지 못했습니다."}
+        return yfinance_basic_financials(symbol)
 
     def get_financials_reported(self, symbol: str, freq: str = "annual") -> Dict:
         """
@@ -324,7 +382,9 @@ class StockAPIClient:
 
     def get_recommendation_trends(self, symbol: str) -> List[Dict]:
         """애널리스트 추천 트렌드 (Buy/Hold/Sell)"""
-        result = self._request("stock/recommendation", {"symbol": symbol.upper()})
+        result = self._request(
+            "stock/recommendation", {"symbol": symbol.upper()}, optional=True
+        )
         return result if isinstance(result, list) else []
 
     def get_price_target(self, symbol: str) -> Dict:
@@ -340,24 +400,7 @@ class StockAPIClient:
             return result
 
         # yfinance fallback
-        try:
-            import yfinance as yf
-
-            ticker = yf.Ticker(symbol.upper())
-            info = ticker.info
-
-            return {
-                "symbol": symbol.upper(),
-                "targetHigh": info.get("targetHighPrice"),
-                "targetLow": info.get("targetLowPrice"),
-                "targetMean": info.get("targetMeanPrice"),
-                "targetMedian": info.get("targetMedianPrice"),
-                "lastUpdated": datetime.now().strftime("%Y-%m-%d"),
-                "numberOfAnalysts": info.get("numberOfAnalystOpinions", 0),
-            }
-        except Exception as e:
-            logger.error(f"yfinance fallback failed: {e}")
-            return {"error": "목표주가 데이터를 가져오지 못했습니다."}
+        return yfinance_price_target(symbol)
 
     def get_earnings_surprises(self, symbol: str) -> List[Dict]:
         """실적 서프라이즈 데이터"""
@@ -397,6 +440,14 @@ class StockAPIClient:
                 return data
             return []
 
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 403:
+                logger.warning(
+                    f"FMP API 403 Forbidden: 해당 기간({from_date}~{to_date})의 데이터 접근 권한이 없습니다. (무료 플랜 제한 가능성)"
+                )
+                return []
+            logger.error(f"FMP Earnings Calendar API error: {e}")
+            return []
         except Exception as e:
             logger.error(f"FMP Earnings Calendar API error: {e}")
             return []
@@ -405,19 +456,178 @@ class StockAPIClient:
 
     def format_quote_summary(self, symbol: str) -> str:
         """주가 정보를 읽기 쉬운 텍스트로 변환"""
-        quote = self.get_quote(symbol)
+        return format_quote_text(symbol, self.get_quote(symbol))
+
+    def format_news_summary(self, symbol: str, limit: int = 5) -> str:
+        """최근 뉴스를 읽기 쉬운 텍스트로 변환"""
+        return format_news_text(symbol, self.get_company_news(symbol)[:limit])
+
+# ========== yfinance fallback (동기/비동기 클라이언트 공용) ==========
+
+
+def is_valid_quote(result) -> bool:
+    """Finnhub quote 응답이 유효한 시세인지 (c 값이 0보다 큰 경우)"""
+    return isinstance(result, dict) and (result.get("c") or 0) > 0
+
+
+def yfinance_quote(symbol: str) -> Dict:
+    """yfinance 시세 (Finnhub quote 형식)"""
+    try:
+        info = yf_memo.get_info(symbol)
+
+        if not info or "symbol" not in info:
+            return {"error": "주가 데이터를 가져오지 못했습니다.", "c": 0}
+
+        current_price = info.get("currentPrice") or info.get("regularMarketPrice", 0)
+        prev_close = info.get("previousClose", 0)
+
+        return {
+            "c": current_price,
+            "h": info.get("dayHigh", 0),
+            "l": info.get("dayLow", 0),
+            "o": info.get("open", 0),
+            "pc": prev_close,
+            "t": int(datetime.now().timestamp()),
+            "source": "yfinance",
+        }
+    except Exception as e:
+        logger.error(f"yfinance quote fallback failed: {e}")
+        return {"error": "주가 데이터를 가져오지 못했습니다.", "c": 0}
+
+
+def yfinance_bulk_quotes(symbols: List[str]) -> Dict[str, Dict]:
+    """여러 종목 시세를 yf.download 1회로 조회 (실패 시 빈 dict)"""
+    try:
+        return yf_memo.download_quotes(symbols)
+    except Exception as e:
+        logger.error(f"yfinance bulk quote fallback failed: {e}")
+        return {}
+
+
+def quote_columns(symbols: List[str], quotes: Dict[str, Dict]) -> Dict[str, list]:
+    """종목별 quote dict를 입력 순서에 맞춘 컬럼형 dict로 변환 (d/dp 보완)"""
+    columns: Dict[str, list] = {key: [] for key in QUOTE_COLUMNS}
+    for symbol in symbols:
+        quote = dict(quotes.get(symbol, {}), symbol=symbol)
+        current, prev_close = quote.get("c"), quote.get("pc")
+        if quote.get("d") is None and current is not None and prev_close:
+            quote["d"] = current - prev_close
+            quote["dp"] = (current - prev_close) / prev_close * 100
+        for key in QUOTE_COLUMNS:
+            columns[key].append(quote.get(key))
+    return columns
+
+
+def yfinance_candles(symbol: str, start: int, end: int, resolution: str = "D") -> Dict:
+    """yfinance 캔들 (Finnhub stock/candle 형식, [start, end] 구간 그대로)"""
+    try:
+        interval = YF_INTERVALS.get(resolution, "1d")
+        # yfinance end는 배타적이므로 마지막 봉이 포함되도록 봉 길이만큼 늘려서 조회
+        bar_seconds = RESOLUTION_SECONDS.get(resolution, RESOLUTION_SECONDS["D"])
+        hist = yf_memo.get_history(
+            symbol,
+            start=datetime.fromtimestamp(start),
+            end=datetime.fromtimestamp(end + bar_seconds),
+            interval=interval,
+        )
+
+        if hist.empty:
+            return {"error": "주가 데이터를 가져오지 못했습니다."}
+
+        timestamps = [int(d.timestamp()) for d in hist.index]
+        rows = [i for i, ts in enumerate(timestamps) if start <= ts <= end]
+
+        # Finnhub 형식으로 변환 (c, h, l, o, v, t)
+        return {
+            "s": "ok" if rows else "no_data",
+            "c": [float(hist["Close"].iloc[i]) for i in rows],
+            "h": [float(hist["High"].iloc[i]) for i in rows],
+            "l": [float(hist["Low"].iloc[i]) for i in rows],
+            "o": [float(hist["Open"].iloc[i]) for i in rows],
+            "v": [float(hist["Volume"].iloc[i]) for i in rows],
+            "t": [timestamps[i] for i in rows],
+        }
+    except Exception as e:
+        logger.error(f"yfinance fallback failed: {e}")
+        return {"error": "주가 데이터를 가져오지 못했습니다."}
+
+
+def yfinance_basic_financials(symbol: str) -> Dict:
+    """yfinance 기본 재무 지표 (Finnhub stock/metric 형식)"""
+    try:
+        info = yf_memo.get_info(symbol)
+
+        if not info or "symbol" not in info:
+            return {"error": "재무 지표를 가져오지 못했습니다."}
+
+        return {
+            "symbol": symbol.upper(),
+            "metric": {
+                "peBasicExclExtraTTM": info.get("trailingPE"),
+                "peExclExtraHighTTM": info.get("forwardPE"),
+                "pbAnnual": info.get("priceToBook"),
+                "roeRfy": (
+                    (info.get("returnOnEquity", 0) or 0) * 100
+                    if info.get("returnOnEquity")
+                    else None
+                ),
+                "roaRfy": (
+                    (info.get("returnOnAssets", 0) or 0) * 100
+                    if info.get("returnOnAssets")
+                    else None
+                ),
+                "dividendYieldIndicatedAnnual": (
+                    (info.get("dividendYield", 0) or 0) * 100
+                    if info.get("dividendYield")
+                    else None
+                ),
+                "marketCapitalization": info.get("marketCap"),
+                "52WeekHigh": info.get("fiftyTwoWeekHigh"),
+                "52WeekLow": info.get("fiftyTwoWeekLow"),
+                "beta": info.get("beta"),
+            },
+            "source": "yfinance",
+        }
+    except Exception as e:
+        logger.error(f"yfinance financials fallback failed: {e}")
+        return {"error": "재무 지표를 가져오지 못했습니다."}
+
+
+def yfinance_price_target(symbol: str) -> Dict:
+    """yfinance 목표 주가 (Finnhub stock/price-target 형식)"""
+    try:
+        info = yf_memo.get_info(symbol)
+
+        return {
+            "symbol": symbol.upper(),
+            "targetHigh": info.get("targetHighPrice"),
+            "targetLow": info.get("targetLowPrice"),
+            "targetMean": info.get("targetMeanPrice"),
+            "targetMedian": info.get("targetMedianPrice"),
+            "lastUpdated": datetime.now().strftime("%Y-%m-%d"),
+            "numberOfAnalysts": info.get("numberOfAnalystOpinions", 0),
+        }
+    except Exception as e:
+        logger.error(f"yfinance fallback failed: {e}")
+        return {"error": "목표주가 데이터를 가져오지 못했습니다."}
 
-        if "error" in quote:
-            return f"주가 조회 실패: {quote['error']}"
 
-        current = quote.get("c", 0)
-        prev_close = quote.get("pc", 0)
-        change = current - prev_close
-        change_pct = (change / prev_close * 100) if prev_close else 0
+# ========== 텍스트 포맷 (동기/비동기 클라이언트 공용) ==========
 
-        arrow = "📈" if change >= 0 else "📉"
 
-        return f"""
+def format_quote_text(symbol: str, quote: Dict) -> str:
+    """quote dict를 읽기 쉬운 텍스트로 변환"""
+    if "error" in quote:
+        return f"주가 조회 실패: {quote['error']}"
+
+    current = quote.get("c", 0)
+    prev_close = quote.get("pc", 0)
+    change = current - prev_close
+    change_pct = (change / prev_close * 100) if prev_close else 0
+
+    arrow = "📈" if change >= 0 else "📉"
+
+    return f"""
 {arrow} **{symbol.upper()}** 실시간 시세
 - 현재가: ${current:.2f}
 - 변동: {'+' if change >= 0 else ''}{change:.2f} ({'+' if change_pct >= 0 else ''}{change_pct:.2f}%)
@@ -425,23 +635,22 @@ class StockAPIClient:
 - 전일종가: ${prev_close:.2f}
 """.strip()
 
-    def format_news_summary(self, symbol: str, limit: int = 5) -> str:
-        """최근 뉴스를 읽기 쉬운 텍스트로 변환"""
-        news = self.get_company_news(symbol)[:limit]
-
-        if not news:
-            return f"{symbol.upper()} 관련 최근 뉴스가 없습니다."
-
-        lines = [f"📰 **{symbol.upper()}** 최근 뉴스"]
-        for i, article in enumerate(news, 1):
-            headline = article.get("headline", "제목 없음")
-            source = article.get("source", "")
-            dt = datetime.fromtimestamp(article.get("datetime", 0))
-            lines.append(
-                f"{i}. [{headline}]({article.get('url', '#')}) - {source} ({dt.strftime('%m/%d')})"
-            )
 
-        return "\n".join(lines)
+def format_news_text(symbol: str, news: List[Dict]) -> str:
+    """뉴스 목록을 읽기 쉬운 텍스트로 변환"""
+    if not news:
+        return f"{symbol.upper()} 관련 최근 뉴스가 없습니다."
+
+    lines = [f"📰 **{symbol.upper()}** 최근 뉴스"]
+    for i, article in enumerate(news, 1):
+        headline = article.get("headline", "제목 없음")
+        source = article.get("source", "")
+        dt = datetime.fromtimestamp(article.get("datetime", 0))
+        lines.append(
+            f"{i}. [{headline}]({article.get('url', '#')}) - {source} ({dt.strftime('%m/%d')})"
+        )
+
+    return "\n".join(lines)
 
 
 # 싱글톤 인스턴스
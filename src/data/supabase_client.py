@@ -4,7 +4,7 @@ Supabase 데이터베이스 클라이언트
 """
 
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 import pandas as pd
 from supabase import create_client, Client
 from dotenv import load_dotenv
@@ -12,6 +12,27 @@ import hashlib
 
 load_dotenv()
 
+# PostgREST 기본 최대 응답 행 수 (초과분은 경고 없이 잘림)
+PAGE_SIZE = 1000
+
+# 연간 재무 데이터에 조인하는 기업 컬럼
+COMPANY_EMBED = "companies(ticker, company_name)"
+
+
+def _flatten_embedded(df: pd.DataFrame, embed: str = "companies") -> pd.DataFrame:
+    """조인된 companies(dict) 컬럼을 ticker/company_name 컬럼으로 벡터화 분리"""
+    if df.empty or embed not in df.columns:
+        return df
+
+    records = [x if isinstance(x, dict) else {} for x in df[embed]]
+    nested = pd.json_normalize(records).reindex(
+        columns=["ticker", "company_name"]
+    )
+    nested.index = df.index
+    df = df.drop(columns=[embed])
+    df[nested.columns] = nested
+    return df
+
 
 class SupabaseClient:
     """Supabase 데이터베이스 클라이언트"""
@@ -33,11 +54,90 @@ class SupabaseClient:
         return cls._instance
 
     @classmethod
-    def get_all_companies(cls) -> pd.DataFrame:
+    def iter_table(
+        cls,
+        table: str,
+        columns: str = "*",
+        key: str = "id",
+        filters: Optional[List[tuple]] = None,
+        page_size: int = PAGE_SIZE,
+        client: Optional[Client] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        키셋 페이지네이션으로 테이블을 배치 단위로 조회 (제너레이터)
+
+        offset 대신 마지막 키 이후(key > last)를 조회하므로 페이지가 깊어져도
+        비용이 일정하고, PostgREST 1000행 제한에 걸려 행이 잘리지 않습니다.
+
+        Args:
+            table: 테이블명
+            columns: select 컬럼 (조인 포함 가능)
+            key: 정렬/페이지 기준 유니크 컬럼
+            filters: (메서드명, 컬럼, 값) 목록, 예: [("eq", "company_id", 1)]
+            page_size: 배치 크기
+            client: Supabase 클라이언트 (기본: 싱글톤)
+
+        Yields:
+            DataFrame 배치 (조인된 companies 컬럼은 평탄화됨)
+        """
+        client = client or cls.get_client()
+        selected = [c.strip() for c in columns.split(",")]
+        if "*" not in selected and key not in selected:
+            columns = f"{key}, {columns}"
+
+        last_key = None
+        while True:
+            query = client.table(table).select(columns)
+            for method, column, value in filters or []:
+                query = getattr(query, method)(column, value)
+            if last_key is not None:
+                query = query.gt(key, last_key)
+
+            rows = query.order(key).limit(page_size).execute().data
+            if not rows:
+                break
+
+            yield _flatten_embedded(pd.DataFrame(rows))
+
+            if len(rows) < page_size:
+                break
+            last_key = rows[-1][key]
+
+    @classmethod
+    def iter_companies(cls, columns: str = "*") -> Iterator[pd.DataFrame]:
+        """기업 목록 배치 조회"""
+        return cls.iter_table("companies", columns)
+
+    @classmethod
+    def iter_annual_reports(
+        cls, company_id: str = None, ticker: str = None, columns: str = "*"
+    ) -> Iterator[pd.DataFrame]:
+        """연간 재무 데이터 배치 조회 (ticker는 조인 테이블에서 서버 측 필터)"""
+        filters = []
+        if company_id:
+            filters.append(("eq", "company_id", company_id))
+
+        embed = COMPANY_EMBED
+        if ticker:
+            embed = "companies!inner(ticker, company_name)"
+            filters.append(("eq", "companies.ticker", ticker))
+
+        return cls.iter_table("annual_reports", f"{columns}, {embed}", filters=filters)
+
+    @staticmethod
+    def _concat_batches(batches: Iterator[pd.DataFrame]) -> pd.DataFrame:
+        frames = [batch for batch in batches if not batch.empty]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    @classmethod
+    def get_all_companies(cls, columns: str = "*") -> pd.DataFrame:
         """모든 기업 정보 조회"""
-        client = cls.get_client()
-        result = client.table("companies").select("*").order("ticker").execute()
-        return pd.DataFrame(result.data)
+        df = cls._concat_batches(cls.iter_companies(columns))
+        if df.empty or "ticker" not in df.columns:
+            return df
+        return df.sort_values("ticker", ignore_index=True)
 
     @classmethod
     def get_company_by_ticker(cls, ticker: str) -> Optional[Dict]:
@@ -48,41 +148,15 @@ class SupabaseClient:
 
     @classmethod
     def get_annual_reports(
-        cls, company_id: str = None, ticker: str = None
+        cls, company_id: str = None, ticker: str = None, columns: str = "*"
     ) -> pd.DataFrame:
         """연간 재무 데이터 조회"""
-        client = cls.get_client()
-
-        query = client.table("annual_reports").select(
-            "*, companies(ticker, company_name)"
+        df = cls._concat_batches(
+            cls.iter_annual_reports(company_id=company_id, ticker=ticker, columns=columns)
         )
-
-        if company_id:
-            query = query.eq("company_id", company_id)
-
-        result = query.order("fiscal_year", desc=True).execute()
-
-        if not result.data:
-            return pd.DataFrame()
-
-        # DataFrame 생성 및 정리
-        df = pd.DataFrame(result.data)
-
-        # companies 정보 분리
-        if "companies" in df.columns:
-            df["ticker"] = df["companies"].apply(
-                lambda x: x.get("ticker") if x else None
-            )
-            df["company_name"] = df["companies"].apply(
-                lambda x: x.get("company_name") if x else None
-            )
-            df = df.drop(columns=["companies"])
-
-        # 티커 필터
-        if ticker and "ticker" in df.columns:
-            df = df[df["ticker"] == ticker]
-
-        return df
+        if df.empty or "fiscal_year" not in df.columns:
+            return df
+        return df.sort_values("fiscal_year", ascending=False, ignore_index=True)
 
     @classmethod
     def get_financial_summary(cls, ticker: str) -> Dict:
@@ -128,12 +202,7 @@ class SupabaseClient:
         if not result.data:
             return pd.DataFrame()
 
-        df = pd.DataFrame(result.data)
-        df["ticker"] = df["companies"].apply(lambda x: x.get("ticker") if x else None)
-        df["company_name"] = df["companies"].apply(
-            lambda x: x.get("company_name") if x else None
-        )
-        df = df.drop(columns=["companies"])
+        df = _flatten_embedded(pd.DataFrame(result.data))
 
         return df
 
@@ -154,12 +223,7 @@ class SupabaseClient:
         if not result.data:
             return pd.DataFrame()
 
-        df = pd.DataFrame(result.data)
-        df["ticker"] = df["companies"].apply(lambda x: x.get("ticker") if x else None)
-        df["company_name"] = df["companies"].apply(
-            lambda x: x.get("company_name") if x else None
-        )
-        df = df.drop(columns=["companies"])
+        df = _flatten_embedded(pd.DataFrame(result.data))
 
         return df
 
@@ -123,7 +123,7 @@ class AnalystChatbot(RAGBase):
 
         logger.info(f"Building context for query: {query}, ticker: {ticker}")
         all_data = self.data_retriever.get_company_context_parallel(
-            ticker, include_finnhub=True, include_rag=True
+            ticker, include_finnhub=True, include_rag=True, include_indicators=True
         )
 
         context_parts = []
@@ -169,6 +169,12 @@ class AnalystChatbot(RAGBase):
             for article in news[:3]:
                 context_parts.append(f"- {article.get('headline', '')[:80]}")
 
+        # 3-1. 기술적 지표 (DataRetriever가 다른 조회와 병렬로 계산)
+        indicator_text = all_data.get("indicators", "")
+        if indicator_text:
+            context_parts.append("\n## 기술적 지표")
+            context_parts.append(indicator_text)
+
         # 4. RAG Context (10-K)
         rag_text = all_data.get("rag_context", "")
         if rag_text:
@@ -399,6 +405,32 @@ class AnalystChatbot(RAGBase):
             logger.error(f"Tool execution failed: {e}")
             return json.dumps({"error": str(e)})
 
+    def _screen_companies(self, args: Dict) -> str:
+        """재무 조건 스크리닝 도구 실행"""
+        from utils.screening import screen_companies
+
+        result = screen_companies(
+            args.get("criteria", []),
+            year=args.get("year"),
+            sector=args.get("sector"),
+            limit=min(int(args.get("limit", 20)), 50),
+        )
+        if result.empty:
+            return json.dumps(
+                {"count": 0, "message": "조건을 만족하는 기업이 없습니다."},
+                ensure_ascii=False,
+            )
+        return json.dumps(
+            {
+                "count": len(result),
+                "companies": json.loads(
+                    result.round(4).to_json(orient="records", force_ascii=False)
+                ),
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+
     def _handle_tool_call(self, tool_call) -> str:
         """도구 호출(Tool Call)을 실행하고 결과를 반환합니다."""
         function_name = tool_call.function.name
@@ -500,6 +532,19 @@ class AnalystChatbot(RAGBase):
                 except ImportError:
                     return "즐겨찾기 관리 모듈을 찾을 수 없습니다."
 
+            elif function_name == "screen_companies":
+                return self._screen_companies(function_args)
+
+            elif function_name == "get_peer_ranking":
+                from utils.screening import get_peer_ranking
+
+                res = get_peer_ranking(
+                    function_args.get("ticker", ""),
+                    year=function_args.get("year"),
+                    scope=function_args.get("scope", "sector"),
+                )
+                return json.dumps(res, ensure_ascii=False, default=str)
+
             return json.dumps({"error": f"Unknown function: {function_name}"})
         except Exception as e:
             logger.error(f"Error executing {function_name}: {e}")
@@ -679,83 +724,38 @@ class AnalystChatbot(RAGBase):
         try:
             from rag.report_generator import ReportGenerator
             from utils.pdf_utils import create_pdf
-            from utils.chart_utils import (
-                generate_line_chart,
-                generate_candlestick_chart,
-                generate_volume_chart,
-                generate_financial_chart,
-            )
+            from utils.chart_renderer import render_report_charts
 
             generator = ReportGenerator()
             report_md = ""
+            target_tickers = tickers if tickers else [target_ticker]
 
             # --- 비교 분석 레포트 (2개 이상) ---
             if len(target_tickers) > 1:
                 # 비교 분석 리포트 생성
                 report_md = generator.generate_comparison_report(target_tickers)
 
-                # 비교 분석용 차트 생성 (Line, Volume, Financial)
-                chart_buffers = []
-                try:
-                    c1 = generate_line_chart(target_tickers)
-                    if c1:
-                        chart_buffers.append(c1)
-
-                    c2 = generate_volume_chart(target_tickers)
-                    if c2:
-                        chart_buffers.append(c2)
-
-                    c3 = generate_financial_chart(target_tickers)
-                    if c3:
-                        chart_buffers.append(c3)
-                except Exception as e:
-                    logger.warning(f"Comparison charts generation failed: {e}")
-
-                # PDF 생성
-                try:
-                    pdf_bytes = create_pdf(report_md, chart_images=chart_buffers)
-                    return pdf_bytes, "pdf"
-                except Exception:
-                    return report_md, "md"
-
             # --- 단일 기업 분석 레포트 ---
             else:
                 target_ticker = target_tickers[0]
-
-                # 1. Generate Report Content
                 report_md = generator.generate_report(target_ticker)
 
-                # 2. Generate All Charts
-                chart_buffers = []
-                try:
-                    # Line Chart
-                    c1 = generate_line_chart([target_ticker])
-                    if c1:
-                        chart_buffers.append(c1)
-
-                    # Candlestick
-                    c2 = generate_candlestick_chart([target_ticker])
-                    if c2:
-                        chart_buffers.append(c2)
-
-                    # Volume
-                    c3 = generate_volume_chart([target_ticker])
-                    if c3:
-                        chart_buffers.append(c3)
-
-                    # Financial
-                    c4 = generate_financial_chart([target_ticker])
-                    if c4:
-                        chart_buffers.append(c4)
-                except Exception as e:
-                    logger.warning(f"Chart generation failed: {e}")
+            # 차트 생성 (비교: Line/Volume/Financial, 단일: +Candlestick)
+            # 프로세스 풀에서 병렬 렌더링
+            chart_buffers = []
+            try:
+                chart_buffers = render_report_charts(target_tickers)
+            except Exception as e:
+                logger.warning(f"Chart generation failed: {e}")
 
-                # 3. Create PDF with Charts
-                try:
-                    pdf_bytes = create_pdf(report_md, chart_images=chart_buffers)
-                    return pdf_bytes, "pdf"
-                except Exception:
-                    return report_md, "md"
+            # PDF 생성
+            try:
+                pdf_bytes = create_pdf(
+                    report_md, chart_images=chart_buffers, image_format="png"
+                )
+                return pdf_bytes, "pdf"
+            except Exception:
+                return report_md, "md"
 
         except Exception as e:
             logger.warning(f"Report generation failed: {e}")
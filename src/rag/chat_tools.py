@@ -2,6 +2,11 @@
 AnalystChatbot에서 사용하는 도구(Tool) 정의 및 스키마 관리
 """
 
+try:
+    from utils.screen_metrics import SCREEN_METRICS
+except ImportError:
+    from src.utils.screen_metrics import SCREEN_METRICS
+
 
 def get_chat_tools():
     """챗봇이 사용할 수 있는 도구 목록 반환"""
@@ -183,4 +188,81 @@ def get_chat_tools():
                 },
             },
         },
+        {
+            "type": "function",
+            "function": {
+                "name": "screen_companies",
+                "description": "Screen S&P 500 companies by financial criteria (margins, ROE, leverage, growth) with sector/industry percentile ranks. Use for questions like 'top decile ROE with D/E < 1 and revenue growth > 10%'. Ratios are fractions (0.1 = 10%).",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "criteria": {
+                            "type": "array",
+                            "description": "All criteria must match.",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "metric": {
+                                        "type": "string",
+                                        "enum": list(SCREEN_METRICS),
+                                    },
+                                    "op": {
+                                        "type": "string",
+                                        "enum": [">", ">=", "<", "<=", "=="],
+                                    },
+                                    "value": {
+                                        "type": "number",
+                                        "description": "Raw metric value, or percentile score 0~1 when percentile is true (0.9 = top 10%).",
+                                    },
+                                    "percentile": {
+                                        "type": "boolean",
+                                        "description": "Compare the peer percentile score instead of the raw value. Scores are higher-is-better (low D/E scores high).",
+                                        "default": False,
+                                    },
+                                    "scope": {
+                                        "type": "string",
+                                        "enum": ["sector", "industry", "all"],
+                                        "default": "sector",
+                                    },
+                                },
+                                "required": ["metric", "op", "value"],
+                            },
+                        },
+                        "year": {
+                            "type": "integer",
+                            "description": "Fiscal year (default: latest).",
+                        },
+                        "sector": {
+                            "type": "string",
+                            "description": "Restrict to one sector (e.g. Technology).",
+                        },
+                        "limit": {"type": "integer", "default": 20},
+                    },
+                    "required": ["criteria"],
+                },
+            },
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "get_peer_ranking",
+                "description": "Get where a company ranks versus its sector/industry peers (percentile 0~1, higher is better) on margins, growth, returns and leverage.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": {"type": "string"},
+                        "scope": {
+                            "type": "string",
+                            "enum": ["sector", "industry", "all"],
+                            "default": "sector",
+                        },
+                        "year": {
+                            "type": "integer",
+                            "description": "Fiscal year (default: latest).",
+                        },
+                    },
+                    "required": ["ticker"],
+                },
+            },
+        },
     ]
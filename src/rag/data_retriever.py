@@ -3,6 +3,7 @@ Data Retriever - 기업 데이터 통합 수집 모듈 (병렬 처리 최적화)
 Supabase, VectorStore, GraphRAG, Finnhub 데이터를 병렬로 수집하여 성능을 극대화합니다.
 """
 
+import contextvars
 import logging
 from typing import Dict, List, Optional
 from concurrent.futures import ThreadPoolExecutor
@@ -23,12 +24,24 @@ class DataRetriever:
         self.graph_rag = graph_rag
         self.finnhub = finnhub
 
+    @staticmethod
+    def _submit(executor: ThreadPoolExecutor, fn, *args, **kwargs):
+        """호출 스레드의 contextvars(요청 우선순위 등)를 작업 스레드로 전달해 제출"""
+        ctx = contextvars.copy_context()
+        return executor.submit(ctx.run, fn, *args, **kwargs)
+
     def get_company_context_parallel(
-        self, ticker: str, include_finnhub: bool = True, include_rag: bool = True
+        self,
+        ticker: str,
+        include_finnhub: bool = True,
+        include_rag: bool = True,
+        include_indicators: bool = False,
     ) -> Dict:
         """
         여러 소스에서 기업 데이터를 병렬로 수집합니다.
         기존 순차 호출 방식보다 수 초 이상 빠릅니다.
+        include_indicators=True이면 기술적 지표 요약(주가 캐시 미스 시 다운로드 포함)도
+        같은 풀에서 함께 계산합니다.
         """
         ticker = ticker.upper()
         results = {}
@@ -36,13 +49,14 @@ class DataRetriever:
         # 병렬 실행을 위한 작업 정의
         with ThreadPoolExecutor(max_workers=10) as executor:
             # 1. 기본 기업 정보 및 관계 (GraphRAG 또는 DB)
-            info_future = executor.submit(self._fetch_company_info, ticker)
-            rel_future = executor.submit(self._fetch_relationships, ticker)
+            info_future = self._submit(executor, self._fetch_company_info, ticker)
+            rel_future = self._submit(executor, self._fetch_relationships, ticker)
 
             # 2. RAG 컨텍스트 (VectorStore)
             rag_future = None
             if include_rag and self.vector_store:
-                rag_future = executor.submit(
+                rag_future = self._submit(
+                    executor,
                     self.vector_store.hybrid_search,
                     f"Latest business overview and risks for {ticker}",
                     k=3,
@@ -57,16 +71,29 @@ class DataRetriever:
             peers_future = None
 
             if include_finnhub and self.finnhub:
-                quote_future = executor.submit(self.finnhub.get_quote, ticker)
-                rec_future = executor.submit(
-                    self.finnhub.get_recommendation_trends, ticker
+                quote_future = self._submit(executor, self.finnhub.get_quote, ticker)
+                rec_future = self._submit(
+                    executor, self.finnhub.get_recommendation_trends, ticker
+                )
+                target_future = self._submit(
+                    executor, self.finnhub.get_price_target, ticker
+                )
+                news_future = self._submit(
+                    executor, self.finnhub.get_company_news, ticker
+                )
+                metrics_future = self._submit(
+                    executor, self.finnhub.get_basic_financials, ticker
                 )
-                target_future = executor.submit(self.finnhub.get_price_target, ticker)
-                news_future = executor.submit(self.finnhub.get_company_news, ticker)
-                metrics_future = executor.submit(
-                    self.finnhub.get_basic_financials, ticker
+                peers_future = self._submit(
+                    executor, self.finnhub.get_company_peers, ticker
+                )
+
+            # 4. 기술적 지표 (주가 다운로드가 필요할 수 있어 다른 조회와 병렬 실행)
+            indicator_future = None
+            if include_indicators:
+                indicator_future = self._submit(
+                    executor, self._fetch_indicator_summary, ticker
                 )
-                peers_future = executor.submit(self.finnhub.get_company_peers, ticker)
 
             # 결과 수집
             results["company"] = info_future.result()
@@ -93,6 +120,9 @@ class DataRetriever:
                     "peers": peers_future.result() if peers_future else [],
                 }
 
+            if indicator_future:
+                results["indicators"] = indicator_future.result()
+
             # 재무 데이터 (ID가 필요하므로 info 결과 대기 후 필요시 호출)
             if results["company"] and "id" in results["company"]:
                 company_id = results["company"]["id"]
@@ -103,6 +133,28 @@ class DataRetriever:
 
         return results
 
+    def _fetch_indicator_summary(self, ticker: str) -> str:
+        """이동평균/RSI/MACD 등 기술적 지표 요약 (실패 시 빈 문자열)"""
+        try:
+            try:
+                from utils.technical_indicators import (
+                    format_indicator_summary,
+                    get_indicators,
+                    latest_snapshot,
+                )
+            except ImportError:
+                from src.utils.technical_indicators import (
+                    format_indicator_summary,
+                    get_indicators,
+                    latest_snapshot,
+                )
+
+            indicators = get_indicators([ticker])
+            return format_indicator_summary(ticker, latest_snapshot(indicators, ticker))
+        except Exception as e:
+            logger.warning(f"Indicator summary failed for {ticker}: {e}")
+            return ""
+
     def _fetch_company_info(self, ticker: str) -> Optional[Dict]:
         """기본 정보 수집"""
         if self.graph_rag:
@@ -165,15 +217,18 @@ class DataRetriever:
                 return []
 
         with ThreadPoolExecutor(max_workers=3) as executor:
-            ann_f = executor.submit(
-                lambda: _safe_query("annual_reports", ["fiscal_year"])
+            ann_f = self._submit(
+                executor, lambda: _safe_query("annual_reports", ["fiscal_year"])
             )
-            qrt_f = executor.submit(
+            qrt_f = self._submit(
+                executor,
                 lambda: _safe_query(
                     "quarterly_reports", ["fiscal_year", "fiscal_quarter"]
                 )
             )
-            prc_f = executor.submit(lambda: _safe_query("stock_prices", ["price_date"]))
+            prc_f = self._submit(
+                executor, lambda: _safe_query("stock_prices", ["price_date"])
+            )
 
             return {
                 "annual": ann_f.result() or [],
@@ -92,6 +92,13 @@ class ReportGenerator(RAGBase):
                 parts.append(f"- ROE: {report.get('roe', 'N/A')}")
                 parts.append(f"- 영업이익률: {report.get('profit_margin', 'N/A')}")
 
+        ratio_text = self._get_ratio_summary((company or {}).get("ticker"))
+        if ratio_text:
+            parts.append(
+                f"\n## 재무비율 및 성장률 [Source: 사전 계산 비율 테이블 | 10-K/10-Q 기준]"
+            )
+            parts.append(ratio_text)
+
         quarterly = data.get("quarterly_reports", [])
         if quarterly:
             parts.append(f"\n## 최근 분기 실적 [Source: Supabase DB | 10-Q 공시 기준]")
@@ -131,6 +138,18 @@ class ReportGenerator(RAGBase):
 
         return "\n".join(parts) if parts else "데이터 없음"
 
+    def _get_ratio_summary(self, ticker: Optional[str]) -> str:
+        """financial_ratios 스냅샷의 비율/YoY/CAGR/TTM 요약 (실패 시 빈 문자열)"""
+        if not ticker:
+            return ""
+        try:
+            from utils.ratio_engine import get_company_ratios, format_ratio_summary
+
+            return format_ratio_summary(get_company_ratios(ticker, years=3))
+        except Exception as e:
+            logger.warning(f"Ratio summary failed for {ticker}: {e}")
+            return ""
+
     def _get_finnhub_data(self, ticker: str, raw_finnhub: Optional[Dict] = None) -> str:
         """Get real-time data from Finnhub (Refactored to use pre-fetched data)"""
         # Finnhub 없으면 yfinance 폴백 사용
@@ -227,14 +246,18 @@ class ReportGenerator(RAGBase):
     def _get_yfinance_fallback(self, ticker: str) -> str:
         """yfinance를 사용한 실시간 데이터 폴백"""
         try:
-            import yfinance as yf
             import pytz
 
+            try:
+                from utils.yf_memo import get_info
+            except ImportError:
+                from src.utils.yf_memo import get_info
+
             kst = pytz.timezone("Asia/Seoul")
             now_kst = datetime.now(kst).strftime("%Y-%m-%d %H:%M KST")
 
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            # stock_api_client fallback과 같은 메모를 공유 (중복 .info 다운로드 방지)
+            info = get_info(ticker)
 
             if not info or "symbol" not in info:
                 return ""
@@ -0,0 +1,412 @@
+"""
+DuckDB analytical mirror of Supabase financial tables
+
+Snapshots the core Supabase tables into per-table Parquet files so that
+TextToSQL (and other analytical readers) can query them locally without
+per-query Supabase traffic.
+
+- Incremental refresh by `updated_at` / `created_at` watermarks
+- Snapshot files are swapped atomically (write temp file -> os.replace),
+  so readers in other sessions/processes never see a half-written table
+- Readers attach the snapshots as read-only views on their own connection
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import duckdb
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_MIRROR_DIR = Path(
+    os.getenv("DUCKDB_MIRROR_DIR", PROJECT_ROOT / "data" / "duckdb_mirror")
+)
+
+# table -> candidate watermark columns (first one present in the data wins)
+MIRROR_TABLES: Dict[str, tuple] = {
+    "companies": ("updated_at", "created_at"),
+    "annual_reports": ("updated_at", "created_at"),
+    "quarterly_reports": ("updated_at", "created_at"),
+    "stock_prices": ("updated_at", "created_at"),
+    "company_relationships": ("updated_at", "created_at"),
+}
+
+# Tables computed locally from the mirrored ones (e.g. utils.ratio_engine)
+DERIVED_TABLES = ("financial_ratios",)
+
+# Columns converted to proper types before writing (Supabase returns ISO strings)
+TIMESTAMP_COLUMNS = ("created_at", "updated_at")
+DATE_COLUMNS = ("period_ended", "price_date", "filing_date")
+
+PAGE_SIZE = 1000  # Supabase REST max rows per request
+MANIFEST_FILE = "manifest.json"
+DEFAULT_MAX_AGE_SECONDS = 6 * 3600
+
+
+class DuckDBMirror:
+    """
+    On-disk Parquet mirror of Supabase tables with incremental sync
+
+    Usage:
+        mirror = DuckDBMirror()
+        mirror.sync()                  # writer (script / scheduler)
+        mirror.attach(conn)            # reader (TextToSQL etc.)
+    """
+
+    def __init__(self, mirror_dir: Optional[Path] = None):
+        self.mirror_dir = Path(mirror_dir or DEFAULT_MIRROR_DIR)
+        self._sync_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Paths / manifest
+    # ------------------------------------------------------------------
+
+    def table_path(self, table: str) -> Path:
+        """Parquet snapshot path for a mirrored table"""
+        return self.mirror_dir / f"{table}.parquet"
+
+    def _manifest_path(self) -> Path:
+        return self.mirror_dir / MANIFEST_FILE
+
+    def load_manifest(self) -> Dict:
+        """Read sync state ({table: {watermark, watermark_column, rows, synced_at}})"""
+        try:
+            with open(self._manifest_path(), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_manifest(self, manifest: Dict) -> None:
+        tmp = self._manifest_path().with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, self._manifest_path())
+
+    def available_tables(self) -> List[str]:
+        """Tables (mirrored and derived) that have a snapshot on disk"""
+        names = list(MIRROR_TABLES) + list(DERIVED_TABLES)
+        return [t for t in names if self.table_path(t).exists()]
+
+    def is_stale(self, max_age_seconds: int = DEFAULT_MAX_AGE_SECONDS) -> bool:
+        """True if any table is missing or older than max_age_seconds"""
+        manifest = self.load_manifest()
+        now = time.time()
+        for table in MIRROR_TABLES:
+            state = manifest.get(table)
+            if not state or not self.table_path(table).exists():
+                return True
+            if now - state.get("synced_at", 0) > max_age_seconds:
+                return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Sync (writer)
+    # ------------------------------------------------------------------
+
+    def sync(
+        self,
+        tables: Optional[List[str]] = None,
+        full: bool = False,
+        client=None,
+    ) -> Dict[str, int]:
+        """
+        Pull new/changed rows from Supabase and merge them into the snapshots
+
+        Args:
+            tables: Tables to sync (default: all MIRROR_TABLES)
+            full: Ignore watermarks and rebuild snapshots from scratch
+                  (also picks up rows deleted upstream)
+            client: Supabase client (default: SupabaseClient singleton)
+
+        Returns:
+            {table: number of rows fetched from Supabase}
+        """
+        if client is None:
+            try:
+                from data.supabase_client import SupabaseClient
+            except ImportError:
+                from src.data.supabase_client import SupabaseClient
+            client = SupabaseClient.get_client()
+
+        self.mirror_dir.mkdir(parents=True, exist_ok=True)
+        fetched: Dict[str, int] = {}
+
+        with self._sync_lock:
+            manifest = self.load_manifest()
+            for table in tables or list(MIRROR_TABLES):
+                try:
+                    state = {} if full else manifest.get(table, {})
+                    fetched[table], manifest[table] = self._sync_table(
+                        client, table, state
+                    )
+                    self._save_manifest(manifest)
+                except Exception as e:
+                    logger.error(f"Mirror sync failed for {table}: {e}")
+                    fetched[table] = -1
+
+        return fetched
+
+    def _sync_table(self, client, table: str, state: Dict) -> tuple:
+        """Sync one table; returns (fetched_rows, new_manifest_state)"""
+        wm_col = state.get("watermark_column") or self._detect_watermark_column(
+            client, table
+        )
+        watermark = state.get("watermark")
+
+        incoming = self._fetch_since(client, table, wm_col, watermark)
+        path = self.table_path(table)
+
+        if incoming.empty:
+            rows = self._row_count(path) if path.exists() else 0
+        else:
+            incoming = _normalize_frame(incoming)
+            rows = self._merge_snapshot(
+                path, incoming, replace=not (wm_col and watermark)
+            )
+
+        new_state = {
+            "watermark_column": wm_col,
+            "watermark": watermark,
+            "rows": rows,
+            "synced_at": time.time(),
+        }
+        if wm_col and not incoming.empty and wm_col in incoming.columns:
+            latest = pd.to_datetime(incoming[wm_col], utc=True).max()
+            if pd.notna(latest):
+                new_state["watermark"] = latest.isoformat()
+
+        logger.info(
+            f"Mirror {table}: fetched {len(incoming)} rows, "
+            f"{rows} total (watermark {new_state['watermark']})"
+        )
+        return len(incoming), new_state
+
+    @staticmethod
+    def _detect_watermark_column(client, table: str) -> Optional[str]:
+        """Pick the first watermark candidate that exists in the table"""
+        result = client.table(table).select("*").limit(1).execute()
+        if not result.data:
+            return MIRROR_TABLES[table][-1]
+        columns = result.data[0].keys()
+        for col in MIRROR_TABLES[table]:
+            if col in columns:
+                return col
+        return None
+
+    @staticmethod
+    def _fetch_since(
+        client, table: str, wm_col: Optional[str], watermark: Optional[str]
+    ) -> pd.DataFrame:
+        """
+        Fetch rows with wm_col >= watermark (all rows without a watermark)
+
+        Pages with SupabaseClient.iter_table (keyset on id), so deep pages stay
+        cheap and rows updated during the sync do not shift page boundaries.
+        `>=` (not `>`) so rows sharing the watermark timestamp are not missed;
+        duplicates are resolved by id during the merge.
+        """
+        try:
+            from data.supabase_client import SupabaseClient
+        except ImportError:
+            from src.data.supabase_client import SupabaseClient
+
+        filters = [("gte", wm_col, watermark)] if wm_col and watermark else None
+        batches = [
+            batch
+            for batch in SupabaseClient.iter_table(
+                table, filters=filters, page_size=PAGE_SIZE, client=client
+            )
+            if not batch.empty
+        ]
+        if not batches:
+            return pd.DataFrame()
+        return pd.concat(batches, ignore_index=True)
+
+    @staticmethod
+    def _row_count(path: Path) -> int:
+        con = duckdb.connect()
+        try:
+            return con.execute(
+                "SELECT COUNT(*) FROM read_parquet(?)", [str(path)]
+            ).fetchone()[0]
+        finally:
+            con.close()
+
+    @staticmethod
+    def _merge_snapshot(path: Path, incoming: pd.DataFrame, replace: bool) -> int:
+        """
+        Upsert incoming rows (by id) into the Parquet snapshot and swap it in
+
+        Returns:
+            Row count of the new snapshot
+        """
+        tmp = path.with_suffix(".parquet.tmp")
+        con = duckdb.connect()
+        try:
+            con.register("incoming", incoming)
+
+            if replace or not path.exists():
+                source = "SELECT * FROM incoming"
+            else:
+                # Cast incoming columns to the existing snapshot types so the
+                # union does not widen columns to VARCHAR
+                existing = dict(
+                    con.execute(
+                        "SELECT column_name, column_type FROM "
+                        "(DESCRIBE SELECT * FROM read_parquet(?))",
+                        [str(path)],
+                    ).fetchall()
+                )
+                select_cols = ", ".join(
+                    f'TRY_CAST("{c}" AS {existing[c]}) AS "{c}"'
+                    if c in existing
+                    else f'"{c}"'
+                    for c in incoming.columns
+                )
+                source = (
+                    f"SELECT * FROM read_parquet('{_sql_path(path)}') "
+                    "WHERE id NOT IN (SELECT id FROM incoming) "
+                    f"UNION ALL BY NAME SELECT {select_cols} FROM incoming"
+                )
+
+            con.execute(
+                f"COPY ({source}) TO '{_sql_path(tmp)}' (FORMAT PARQUET, COMPRESSION ZSTD)"
+            )
+            rows = con.execute(
+                "SELECT COUNT(*) FROM read_parquet(?)", [str(tmp)]
+            ).fetchone()[0]
+        finally:
+            con.close()
+
+        os.replace(tmp, path)
+        return rows
+
+    def write_derived(self, table: str, df: pd.DataFrame) -> int:
+        """Atomically replace a derived table snapshot with the given frame"""
+        if table not in DERIVED_TABLES:
+            raise ValueError(f"Unknown derived table: {table}")
+        self.mirror_dir.mkdir(parents=True, exist_ok=True)
+        return self._merge_snapshot(self.table_path(table), df, replace=True)
+
+    # ------------------------------------------------------------------
+    # Readers
+    # ------------------------------------------------------------------
+
+    def read_tables(self, tables: List[str]) -> Dict[str, pd.DataFrame]:
+        """Load snapshots into pandas (missing tables are omitted)"""
+        frames: Dict[str, pd.DataFrame] = {}
+        con = duckdb.connect()
+        try:
+            for table in tables:
+                path = self.table_path(table)
+                if path.exists():
+                    frames[table] = con.execute(
+                        "SELECT * FROM read_parquet(?)", [str(path)]
+                    ).fetchdf()
+        finally:
+            con.close()
+        return frames
+
+    def attach(self, conn: duckdb.DuckDBPyConnection) -> List[str]:
+        """
+        Expose mirrored tables as read-only views on an existing connection
+
+        Views read the Parquet files lazily, so a connection picks up new
+        snapshots written by `sync()` without re-attaching.
+
+        Returns:
+            Names of attached tables
+        """
+        attached = []
+        for table in self.available_tables():
+            # an existing view (re-attach) is replaced below; only a table must go
+            if relation_kind(conn, table) == "TABLE":
+                conn.execute(f"DROP TABLE {table}")
+            conn.execute(
+                f"CREATE OR REPLACE VIEW {table} AS "
+                f"SELECT * FROM read_parquet('{_sql_path(self.table_path(table))}')"
+            )
+            attached.append(table)
+        return attached
+
+    def status(self) -> pd.DataFrame:
+        """Per-table sync status (for CLI / diagnostics)"""
+        manifest = self.load_manifest()
+        records = []
+        for table in MIRROR_TABLES:
+            state = manifest.get(table, {})
+            synced_at = state.get("synced_at")
+            records.append(
+                {
+                    "table": table,
+                    "rows": state.get("rows"),
+                    "watermark_column": state.get("watermark_column"),
+                    "watermark": state.get("watermark"),
+                    "synced_at": (
+                        datetime.fromtimestamp(synced_at, tz=timezone.utc).isoformat()
+                        if synced_at
+                        else None
+                    ),
+                    "exists": self.table_path(table).exists(),
+                }
+            )
+        return pd.DataFrame(records)
+
+
+def relation_kind(conn: duckdb.DuckDBPyConnection, name: str) -> Optional[str]:
+    """"TABLE", "VIEW" or None for a name in the connection's current schema"""
+    row = conn.execute(
+        "SELECT 'TABLE' FROM duckdb_tables() "
+        "WHERE database_name = current_database() AND schema_name = current_schema() "
+        "AND table_name = ? "
+        "UNION ALL SELECT 'VIEW' FROM duckdb_views() "
+        "WHERE database_name = current_database() AND schema_name = current_schema() "
+        "AND view_name = ? AND NOT internal",
+        [name, name],
+    ).fetchone()
+    return row[0] if row else None
+
+
+def drop_relation(conn: duckdb.DuckDBPyConnection, name: str) -> None:
+    """Drop a table or view by name (DROP TABLE on a view raises a Catalog Error)"""
+    kind = relation_kind(conn, name)
+    if kind is not None:
+        conn.execute(f"DROP {kind} {name}")
+
+
+def _sql_path(path: Path) -> str:
+    """Path literal safe for embedding in DuckDB SQL"""
+    return str(path).replace("\\", "/").replace("'", "''")
+
+
+def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert Supabase ISO strings to typed timestamp/date columns"""
+    df = df.copy()
+    for col in TIMESTAMP_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], utc=True, errors="coerce")
+    for col in DATE_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors="coerce").dt.date
+    return df
+
+
+_default_mirror: Optional[DuckDBMirror] = None
+_default_lock = threading.Lock()
+
+
+def get_mirror() -> DuckDBMirror:
+    """Process-wide mirror instance (shared by all sessions)"""
+    global _default_mirror
+    with _default_lock:
+        if _default_mirror is None:
+            _default_mirror = DuckDBMirror()
+        return _default_mirror
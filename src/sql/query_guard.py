@@ -0,0 +1,341 @@
+"""
+Guarded execution of generated SQL on DuckDB
+
+LLM-generated SQL is untrusted: a cross join or a missing LIMIT can pin a CPU
+and block every other user of the connection. QueryGuard runs each query with:
+
+- read-only check (single SELECT/WITH statement, no file-reading table functions)
+- EXPLAIN first; plans whose estimated cardinality exceeds a threshold are rejected
+- default LIMIT injected when the query has none
+- wall-clock timeout that interrupts the running DuckDB query
+- memory cap (DuckDB memory_limit sized per concurrent query)
+- a pool of cursors so concurrent users do not serialize on one connection
+- file/network access disabled outside the mirror directory (restrict_file_access)
+"""
+
+import json
+import logging
+import os
+import queue
+import re
+import threading
+from typing import Dict, List
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+MAX_RESULT_ROWS = int(os.getenv("SQL_MAX_RESULT_ROWS", 1000))
+MAX_PLAN_ROWS = int(os.getenv("SQL_MAX_PLAN_ROWS", 50_000_000))
+QUERY_TIMEOUT_SECONDS = float(os.getenv("SQL_QUERY_TIMEOUT", 10))
+MEMORY_LIMIT_PER_QUERY_MB = int(os.getenv("SQL_MEMORY_LIMIT_MB", 512))
+CURSOR_POOL_SIZE = int(os.getenv("SQL_CURSOR_POOL_SIZE", 4))
+ACQUIRE_TIMEOUT_SECONDS = 5.0
+
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"")
+_READ_ONLY_START = re.compile(r"^\s*(select|with|from|values|\()", re.IGNORECASE)
+_WRITE_KEYWORDS = re.compile(
+    r"\b(insert|update|delete|drop|create|alter|copy|attach|detach|install|load|"
+    r"pragma|set|call|export|import|checkpoint|vacuum)\b",
+    re.IGNORECASE,
+)
+
+# DuckDB table functions that read local/remote files (read_csv, parquet_scan, glob, ...)
+_FILE_FUNCTION_RE = re.compile(
+    r"\b(read_\w+|parquet_\w+|\w+_scan|glob|sniff_csv|st_read|iceberg_\w+|delta_\w+)\s*\(",
+    re.IGNORECASE,
+)
+# Tokens for the table-position scan (comments removed, literals kept whole)
+_TOKEN_RE = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|\w+|\S")
+# Comments outside literals (literals are matched first and kept)
+_COMMENT_OUTSIDE_LITERAL_RE = re.compile(
+    r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")|--[^\n]*|/\*.*?\*/", re.DOTALL
+)
+# Keywords that end a FROM list at the same nesting level
+_FROM_LIST_END = {
+    "where", "group", "having", "order", "limit", "offset", "qualify", "window",
+    "union", "except", "intersect", "on", "using", "select", "returning",
+}
+# Words before "(" that open a subquery / derived table rather than a function call
+_NON_FUNCTION_WORDS = {
+    "from", "join", "in", "exists", "as", "lateral", "any", "all", "some",
+}
+
+
+class QueryRejected(Exception):
+    """Query refused before execution (not read-only, too expensive, ...)"""
+
+
+def _strip_sql(sql: str) -> str:
+    """Remove comments and blank out literals (keeps positions irrelevant)"""
+    sql = _COMMENT_RE.sub(" ", sql)
+    return _LITERAL_RE.sub("''", sql)
+
+
+def _strip_comments(sql: str) -> str:
+    """Remove comments but keep literals intact (so '--' inside a string survives)"""
+    return _COMMENT_OUTSIDE_LITERAL_RE.sub(lambda m: m.group(1) or " ", sql)
+
+
+def _is_path_literal(token: str) -> bool:
+    if token.startswith("'"):
+        return True
+    # a double-quoted name is an identifier unless it looks like a path
+    return token.startswith('"') and bool(re.search(r"[./\\:]", token))
+
+
+def _scans_path(sql: str) -> bool:
+    """
+    True if a string literal sits where a table is expected (replacement scan)
+
+    Only FROM/JOIN at query level and commas in a FROM list count; FROM inside a
+    function call (EXTRACT(year FROM '2024-01-01'), SUBSTRING(x FROM '..')) and
+    IS DISTINCT FROM 'x' are ordinary expressions.
+    """
+    # one frame per parenthesis level: [is_function_call, in_from_list, expect_table]
+    stack = [[False, False, False]]
+    prev = ""
+    for token in _TOKEN_RE.findall(_strip_comments(sql)):
+        word = token.lower()
+        frame = stack[-1]
+        is_function, in_from, expect_table = frame
+        if token == "(":
+            is_call = bool(re.match(r"\w", prev)) and prev not in _NON_FUNCTION_WORDS
+            frame[2] = False
+            stack.append([is_call, False, False])
+        elif token == ")":
+            if len(stack) > 1:
+                stack.pop()
+            stack[-1][2] = False
+        elif is_function:
+            # a subquery passed straight to a function: ARRAY(SELECT .. FROM ..)
+            if word == "select":
+                frame[0] = False
+        elif token[0] in "'\"":
+            if expect_table and _is_path_literal(token):
+                return True
+            frame[2] = False
+        elif word in ("from", "join") and prev != "distinct":
+            frame[1], frame[2] = True, True
+        elif token == ",":
+            frame[2] = in_from
+        else:
+            if word in _FROM_LIST_END:
+                frame[1] = False
+            frame[2] = False
+        prev = word
+    return False
+
+
+def check_read_only(sql: str) -> None:
+    """Raise QueryRejected unless sql is a single read-only statement"""
+    bare = _strip_sql(sql).strip().rstrip(";").strip()
+    if not bare:
+        raise QueryRejected("Empty query")
+    if ";" in bare:
+        raise QueryRejected("Multiple statements are not allowed")
+    if not _READ_ONLY_START.match(bare) or _WRITE_KEYWORDS.search(bare):
+        raise QueryRejected("Only read-only SELECT queries are allowed")
+    if _FILE_FUNCTION_RE.search(bare) or _scans_path(sql):
+        raise QueryRejected("File access from queries is not allowed")
+
+
+def has_top_level_limit(sql: str) -> bool:
+    """True if the outermost query already has a LIMIT clause"""
+    bare = _strip_sql(sql)
+    depth = 0
+    for m in re.finditer(r"\(|\)|\blimit\b", bare, re.IGNORECASE):
+        token = m.group(0)
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+        elif depth == 0:
+            return True
+    return False
+
+
+def apply_default_limit(sql: str, limit: int) -> str:
+    """Append LIMIT when the query has none (comments and trailing ";" removed first)"""
+    sql = _strip_comments(sql).strip()
+    while sql.endswith(";"):
+        sql = sql[:-1].rstrip()
+    if has_top_level_limit(sql):
+        return sql
+    return f"{sql}\nLIMIT {limit}"
+
+
+def _plan_rows(node: Dict) -> float:
+    """
+    Largest estimated cardinality in the plan tree
+
+    Cross products without an estimate are scored as the product of their inputs.
+    """
+    children = node.get("children", [])
+    child_rows = [_plan_rows(c) for c in children]
+    estimate = node.get("extra_info", {}).get("Estimated Cardinality")
+    try:
+        rows = float(str(estimate).lstrip("~"))
+    except (TypeError, ValueError):
+        rows = 0.0
+    if node.get("name") == "CROSS_PRODUCT" and len(child_rows) == 2:
+        rows = max(rows, child_rows[0] * child_rows[1])
+    return max([rows] + child_rows)
+
+
+class QueryGuard:
+    """Executes untrusted SQL on a pool of cursors of one DuckDB database"""
+
+    def __init__(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        pool_size: int = CURSOR_POOL_SIZE,
+        max_rows: int = MAX_RESULT_ROWS,
+        max_plan_rows: int = MAX_PLAN_ROWS,
+        timeout: float = QUERY_TIMEOUT_SECONDS,
+        memory_limit_mb: int = MEMORY_LIMIT_PER_QUERY_MB,
+    ):
+        self.conn = conn
+        self.pool_size = max(1, pool_size)
+        self.max_rows = max_rows
+        self.max_plan_rows = max_plan_rows
+        self.timeout = timeout
+
+        # DuckDB's memory limit is per database; size it so pool_size
+        # concurrent queries each get at most memory_limit_mb.
+        try:
+            conn.execute(f"SET memory_limit = '{memory_limit_mb * self.pool_size}MB'")
+        except Exception as e:
+            logger.warning(f"Could not set DuckDB memory_limit: {e}")
+
+        self._cursors: "queue.Queue[duckdb.DuckDBPyConnection]" = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def restrict_file_access(self, allowed_dirs: List[str] = ()) -> bool:
+        """
+        Disable DuckDB file/network access (except allowed_dirs) and lock settings
+
+        Call after the mirror views are attached; the views keep reading their
+        Parquet files through allowed_directories. Python objects must then be
+        loaded with conn.register() since replacement scans are disabled too.
+
+        Returns:
+            True if the connection is locked down
+        """
+        try:
+            if allowed_dirs:
+                dirs = ", ".join(
+                    "'" + os.path.join(str(d), "").replace("'", "''") + "'"
+                    for d in allowed_dirs
+                )
+                self.conn.execute(f"SET allowed_directories = [{dirs}]")
+            self.conn.execute("SET enable_external_access = false")
+            self.conn.execute("SET lock_configuration = true")
+            return True
+        except duckdb.Error as e:
+            # older DuckDB without allowed_directories: keep views working and
+            # rely on check_read_only rejecting file-reading functions
+            logger.warning(f"Could not restrict DuckDB file access: {e}")
+            return False
+
+    # ------------------------------------------------------------------
+    # Cursor pool
+    # ------------------------------------------------------------------
+
+    def _acquire(self) -> duckdb.DuckDBPyConnection:
+        try:
+            return self._cursors.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.pool_size:
+                self._created += 1
+                return self.conn.cursor()
+        try:
+            return self._cursors.get(timeout=ACQUIRE_TIMEOUT_SECONDS)
+        except queue.Empty:
+            raise QueryRejected("All query slots are busy, please retry")
+
+    def _release(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        self._cursors.put(cursor)
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def estimate_rows(self, cursor: duckdb.DuckDBPyConnection, sql: str) -> float:
+        """Largest estimated intermediate cardinality from EXPLAIN"""
+        rows = cursor.execute(f"EXPLAIN (FORMAT json) {sql}").fetchall()
+        if not rows:
+            return 0.0
+        plan = json.loads(rows[0][1])
+        nodes: List[Dict] = plan if isinstance(plan, list) else [plan]
+        return max((_plan_rows(n) for n in nodes), default=0.0)
+
+    def execute(self, sql: str) -> Dict:
+        """
+        Validate, cost-check and run a query
+
+        Returns:
+            {"success", "data", "row_count", "columns", "truncated", "sql", "error"}
+        """
+        try:
+            check_read_only(sql)
+        except QueryRejected as e:
+            return {"success": False, "error": str(e), "data": None, "sql": sql}
+
+        limited_sql = apply_default_limit(sql, self.max_rows + 1)
+        injected = limited_sql != sql.strip().rstrip(";").strip()
+
+        try:
+            cursor = self._acquire()
+        except QueryRejected as e:
+            return {"success": False, "error": str(e), "data": None, "sql": sql}
+
+        timer = None
+        try:
+            estimated = self.estimate_rows(cursor, limited_sql)
+            if estimated > self.max_plan_rows:
+                raise QueryRejected(
+                    f"Query too expensive (~{estimated:,.0f} estimated rows, "
+                    f"limit {self.max_plan_rows:,})"
+                )
+
+            timer = threading.Timer(self.timeout, cursor.interrupt)
+            timer.daemon = True
+            timer.start()
+            result_df = cursor.execute(limited_sql).fetchdf()
+
+            truncated = injected and len(result_df) > self.max_rows
+            if truncated:
+                result_df = result_df.head(self.max_rows)
+
+            return {
+                "success": True,
+                "data": result_df,
+                "row_count": len(result_df),
+                "columns": list(result_df.columns),
+                "truncated": truncated,
+                "sql": limited_sql,
+            }
+
+        except QueryRejected as e:
+            logger.warning(f"Query rejected: {e}")
+            return {"success": False, "error": str(e), "data": None, "sql": sql}
+        except duckdb.InterruptException:
+            logger.warning(f"Query interrupted after {self.timeout}s: {sql}")
+            return {
+                "success": False,
+                "error": f"Query timed out after {self.timeout:.0f}s",
+                "data": None,
+                "sql": sql,
+            }
+        except Exception as e:
+            logger.error(f"Error executing query: {str(e)}")
+            return {"success": False, "error": str(e), "data": None, "sql": sql}
+        finally:
+            if timer is not None:
+                timer.cancel()
+            self._release(cursor)
@@ -0,0 +1,346 @@
+"""
+Schema catalog for TextToSQL prompts
+
+Keeps table/column descriptions, sample values and basic statistics for the
+DuckDB database and renders only the tables/columns relevant to a question.
+Each column line is rendered once when the catalog is built; per-question
+prompts are assembled from these cached fragments.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+MAX_SAMPLE_DISTINCT = 50  # only low-cardinality text columns get sample values
+SAMPLE_VALUES = 5
+MAX_TABLES_PER_PROMPT = 4
+MIN_RELATIVE_SCORE = 0.5  # drop tables scoring below half of the best match
+MIN_MATCHED_COLUMNS = 3  # below this, the whole table is rendered
+
+# Tables that must accompany others for ticker/name filters and joins
+JOIN_TABLES = {"companies"}
+KEY_COLUMNS = {
+    "id",
+    "company_id",
+    "ticker",
+    "company_name",
+    "fiscal_year",
+    "fiscal_quarter",
+    "period_ended",
+    "price_date",
+    "source_ticker",
+    "target_ticker",
+}
+
+TABLE_DESCRIPTIONS = {
+    "companies": "Company master data (ticker, name, sector, industry, market cap)",
+    "annual_reports": "Yearly financial statements and ratios per company (fiscal_year)",
+    "quarterly_reports": "Quarterly financial statements per company (fiscal_year, fiscal_quarter)",
+    "stock_prices": "Daily stock prices, volume and valuation multiples per company",
+    "company_relationships": "Supplier/customer/competitor/partner links extracted from 10-K filings",
+    "document_sections": "Text sections of SEC filings",
+    "documents": "Embedded document chunks for vector search",
+    "financial_ratios": "Precomputed ratios, YoY growth, CAGR and TTM per company and year",
+}
+
+COLUMN_DESCRIPTIONS = {
+    "market_cap": "market capitalization in USD",
+    "revenue": "total revenue / sales in USD",
+    "net_income": "net income / net profit in USD",
+    "operating_income": "operating income / operating profit in USD",
+    "gross_profit": "gross profit in USD",
+    "eps": "earnings per share",
+    "profit_margin": "net income / revenue",
+    "roe": "return on equity",
+    "roa": "return on assets",
+    "debt_to_equity": "total liabilities / stockholders equity (leverage)",
+    "current_ratio": "current assets / current liabilities (liquidity)",
+    "operating_cash_flow": "cash flow from operations in USD",
+    "close_price": "daily closing price",
+    "adjusted_close": "split/dividend adjusted closing price",
+    "pe_ratio": "price / earnings valuation multiple",
+    "revenue_growth": "year-over-year revenue growth (0.1 = +10%)",
+    "net_income_growth": "year-over-year net income growth",
+    "revenue_cagr_3y": "3-year revenue CAGR",
+    "ttm_revenue": "trailing twelve months revenue (sum of last 4 quarters)",
+    "relationship_type": "supplier, customer, competitor, subsidiary, partner, mentioned",
+    "confidence": "extraction confidence 0~1",
+}
+
+# question word -> schema words (English + Korean)
+SYNONYMS = {
+    "sales": ["revenue"],
+    "turnover": ["revenue"],
+    "profit": ["net_income", "profit_margin", "gross_profit", "operating_income"],
+    "earnings": ["net_income", "eps"],
+    "margin": ["profit_margin", "gross_profit"],
+    "leverage": ["debt_to_equity"],
+    "debt": ["debt_to_equity", "total_liabilities"],
+    "liquidity": ["current_ratio"],
+    "cash": ["operating_cash_flow", "investing_cash_flow", "financing_cash_flow"],
+    "price": ["stock_prices", "close_price"],
+    "stock": ["stock_prices"],
+    "share": ["stock_prices"],
+    "valuation": ["pe_ratio", "pb_ratio", "ps_ratio", "market_cap"],
+    "quarter": ["quarterly_reports", "fiscal_quarter"],
+    "quarterly": ["quarterly_reports"],
+    "annual": ["annual_reports"],
+    "year": ["fiscal_year", "annual_reports"],
+    "yearly": ["annual_reports"],
+    "growth": ["financial_ratios", "revenue"],
+    "supplier": ["company_relationships"],
+    "customer": ["company_relationships"],
+    "competitor": ["company_relationships"],
+    "partner": ["company_relationships"],
+    "sector": ["sector"],
+    "industry": ["industry"],
+    "tech": ["sector", "industry"],
+    "매출": ["revenue"],
+    "순이익": ["net_income"],
+    "영업이익": ["operating_income"],
+    "이익률": ["profit_margin"],
+    "부채": ["debt_to_equity", "total_liabilities"],
+    "자산": ["total_assets"],
+    "주가": ["stock_prices", "close_price"],
+    "시가총액": ["market_cap"],
+    "분기": ["quarterly_reports"],
+    "연간": ["annual_reports"],
+    "성장률": ["financial_ratios"],
+    "섹터": ["sector"],
+    "산업": ["industry"],
+    "경쟁사": ["company_relationships"],
+    "공급사": ["company_relationships"],
+    "고객사": ["company_relationships"],
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+|[가-힣]+")
+_STOPWORDS = {
+    "a", "an", "and", "the", "of", "in", "on", "for", "to", "by", "per", "is",
+    "are", "was", "what", "which", "who", "show", "me", "list", "all", "with",
+    "from", "e", "g", "usd", "vs",
+}
+
+
+def tokenize(text: str) -> Set[str]:
+    """Lower-case word tokens with naive plural stripping"""
+    tokens = set()
+    for tok in _TOKEN_RE.findall(text.lower()):
+        if tok in _STOPWORDS:
+            continue
+        tokens.add(tok)
+        if len(tok) > 3 and tok.endswith("s"):
+            tokens.add(tok[:-1])
+    return tokens
+
+
+def _token_match(a: str, b: str) -> bool:
+    """Exact match, or prefix match for longer words ("tech" ~ "technology")"""
+    if a == b:
+        return True
+    return min(len(a), len(b)) >= 4 and (a.startswith(b) or b.startswith(a))
+
+
+@dataclass
+class ColumnInfo:
+    name: str
+    data_type: str
+    description: str = ""
+    samples: List[str] = field(default_factory=list)
+    min_value: Optional[str] = None
+    max_value: Optional[str] = None
+    fragment: str = ""
+    tokens: Set[str] = field(default_factory=set)
+
+    def render(self) -> str:
+        line = f"  - {self.name}: {self.data_type}"
+        notes = []
+        if self.description:
+            notes.append(self.description)
+        if self.samples:
+            notes.append("e.g. " + ", ".join(f"'{s}'" for s in self.samples))
+        elif self.min_value is not None and self.max_value is not None:
+            notes.append(f"range {self.min_value} ~ {self.max_value}")
+        if notes:
+            line += " -- " + "; ".join(notes)
+        return line
+
+
+@dataclass
+class TableInfo:
+    name: str
+    description: str = ""
+    row_count: Optional[int] = None
+    columns: Dict[str, ColumnInfo] = field(default_factory=dict)
+    header: str = ""
+    tokens: Set[str] = field(default_factory=set)
+
+
+class SchemaCatalog:
+    """Cached schema metadata with relevance-pruned rendering"""
+
+    def __init__(self, tables: Dict[str, TableInfo]):
+        self.tables = tables
+        self._full_text = self._render_tables(
+            {name: list(t.columns) for name, t in tables.items()}
+        )
+
+    @classmethod
+    def from_connection(
+        cls, conn: duckdb.DuckDBPyConnection, with_stats: bool = True
+    ) -> "SchemaCatalog":
+        """Build the catalog from information_schema (+ SUMMARIZE statistics)"""
+        rows = conn.execute(
+            """
+            SELECT table_name, column_name, data_type
+            FROM information_schema.columns
+            WHERE table_schema = 'main'
+            ORDER BY table_name, ordinal_position
+        """
+        ).fetchall()
+
+        tables: Dict[str, TableInfo] = {}
+        for table_name, column_name, data_type in rows:
+            table = tables.setdefault(
+                table_name,
+                TableInfo(table_name, TABLE_DESCRIPTIONS.get(table_name, "")),
+            )
+            table.columns[column_name] = ColumnInfo(
+                column_name, data_type, COLUMN_DESCRIPTIONS.get(column_name, "")
+            )
+
+        for table in tables.values():
+            if with_stats:
+                _collect_stats(conn, table)
+            _prepare_fragments(table)
+
+        return cls(tables)
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+
+    def _render_tables(self, selection: Dict[str, List[str]]) -> str:
+        parts = ["Database Schema:\n"]
+        for name, columns in selection.items():
+            table = self.tables[name]
+            parts.append(table.header)
+            parts.extend(table.columns[c].fragment for c in columns)
+            parts.append("")
+        return "\n".join(parts)
+
+    def render(self) -> str:
+        """Full schema text (all tables, all columns)"""
+        return self._full_text
+
+    def structure_text(self) -> str:
+        """Table/column names and types only (no samples or statistics)"""
+        return "\n".join(
+            f"{name}.{col.name}:{col.data_type}"
+            for name, table in sorted(self.tables.items())
+            for col in table.columns.values()
+        )
+
+    def select(self, question: str) -> Dict[str, List[str]]:
+        """
+        Pick relevant tables/columns for a question
+
+        Returns:
+            {table: [columns]} in catalog order; empty if nothing matched
+        """
+        q_tokens = tokenize(question)
+        expanded = set(q_tokens)
+        for tok in q_tokens:
+            for syn in SYNONYMS.get(tok, []):
+                expanded.update(tokenize(syn.replace("_", " ")))
+                expanded.add(syn)
+
+        def _hits(tokens: Set[str]) -> int:
+            return sum(1 for t in tokens if any(_token_match(t, q) for q in expanded))
+
+        table_scores: Dict[str, float] = {}
+        matched_columns: Dict[str, List[str]] = {}
+        for name, table in self.tables.items():
+            score = (2.0 if name in expanded else 0.0) + 0.5 * _hits(table.tokens)
+            cols = []
+            for col in table.columns.values():
+                if col.name in expanded or _hits(col.tokens):
+                    cols.append(col.name)
+                    score += 1.0
+            if score > 0:
+                table_scores[name] = score
+                matched_columns[name] = cols
+
+        if not table_scores:
+            return {}
+
+        ranked = sorted(table_scores, key=table_scores.get, reverse=True)
+        cutoff = table_scores[ranked[0]] * MIN_RELATIVE_SCORE
+        chosen = {t for t in ranked[:MAX_TABLES_PER_PROMPT] if table_scores[t] >= cutoff}
+        chosen.update(t for t in JOIN_TABLES if t in self.tables)
+
+        selection: Dict[str, List[str]] = {}
+        for name, table in self.tables.items():
+            if name not in chosen:
+                continue
+            cols = set(matched_columns.get(name, []))
+            if len(cols) < MIN_MATCHED_COLUMNS and name not in JOIN_TABLES:
+                selection[name] = list(table.columns)
+                continue
+            cols.update(c for c in table.columns if c in KEY_COLUMNS)
+            selection[name] = [c for c in table.columns if c in cols]
+        return selection
+
+    def render_for_question(self, question: str) -> str:
+        """Schema text restricted to the tables/columns relevant to the question"""
+        selection = self.select(question)
+        if not selection:
+            return self._full_text
+        return self._render_tables(selection)
+
+
+def _collect_stats(conn: duckdb.DuckDBPyConnection, table: TableInfo) -> None:
+    """Row count, min/max and sample values via SUMMARIZE (best effort)"""
+    try:
+        summary = conn.execute(f'SUMMARIZE "{table.name}"').fetchall()
+    except Exception as e:
+        logger.debug(f"SUMMARIZE failed for {table.name}: {e}")
+        return
+
+    for column_name, column_type, min_v, max_v, approx_unique, *rest in summary:
+        col = table.columns.get(column_name)
+        if col is None:
+            continue
+        table.row_count = rest[-2] if len(rest) >= 2 else table.row_count
+        if column_type == "VARCHAR":
+            if approx_unique and approx_unique <= MAX_SAMPLE_DISTINCT:
+                try:
+                    col.samples = [
+                        str(v)[:30]
+                        for (v,) in conn.execute(
+                            f'SELECT "{column_name}" FROM "{table.name}" '
+                            f'WHERE "{column_name}" IS NOT NULL '
+                            f'GROUP BY 1 ORDER BY COUNT(*) DESC LIMIT {SAMPLE_VALUES}'
+                        ).fetchall()
+                    ]
+                except Exception:
+                    pass
+        elif not column_type.endswith("[]") and column_type not in ("UUID", "JSON"):
+            col.min_value, col.max_value = min_v, max_v
+
+
+def _prepare_fragments(table: TableInfo) -> None:
+    """Render and tokenize each column once"""
+    rows = f", rows: {table.row_count:,}" if table.row_count is not None else ""
+    desc = f" -- {table.description}" if table.description else ""
+    table.header = f"Table: {table.name}{desc}{rows}"
+    table.tokens = tokenize(table.name.replace("_", " ") + " " + table.description)
+    for col in table.columns.values():
+        col.fragment = col.render()
+        col.tokens = tokenize(
+            " ".join([col.name.replace("_", " "), col.description] + col.samples)
+        )
@@ -0,0 +1,375 @@
+"""
+SQL plan cache for TextToSQL
+
+Skips the LLM for questions that were already answered successfully:
+
+- Exact cache: normalized question + schema version -> SQL
+- Template cache: literals (companies, years, numbers) in the question are
+  replaced with slots, e.g. "revenue for Apple in 2023" and
+  "revenue for Microsoft in 2022" both become "revenue for <company> in <year>".
+  The SQL that answered the first one is stored with the same slots and
+  re-filled with the new literals.
+
+Templates are only stored after the SQL executed successfully and only when
+every question literal maps unambiguously onto the SQL, so a cached template
+never silently drops or misplaces a literal.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_EXACT_ENTRIES = 512
+MAX_TEMPLATE_ENTRIES = 256
+
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+_NUMBER_RE = re.compile(r"(?<![\w.])\d+(?:\.\d+)?(?![\w.])")
+_TICKER_RE = re.compile(r"\b[A-Z]{2,5}\b")
+_SQL_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_SLOT_RE = re.compile(r"\{\{(\w+)\.(\w+)(?:\.(lower|upper))?\}\}")
+
+# Upper-case words that are also tickers but usually mean something else
+_TICKER_STOPWORDS = {
+    "AI", "IT", "ON", "ALL", "ARE", "NOW", "SO", "OR", "AN", "BE", "GO", "IS",
+    "BY", "TO", "US", "USA", "CEO", "CFO", "EPS", "ROE", "ROA", "YOY", "TTM",
+    "SQL", "GDP", "ETF", "IPO", "PE", "PB", "PS",
+}
+
+# Corporate suffixes stripped to build a short alias ("Apple Inc." -> "Apple")
+_NAME_SUFFIXES = re.compile(
+    r"[,.]?\s+(inc|corp|corporation|co|company|ltd|limited|plc|holdings?|group|"
+    r"class [a-c]|n\.?v|s\.?a|ag|lp|llc)\.?$",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class Entity:
+    """Company that can fill a <company> slot"""
+
+    ticker: str
+    name: str
+    short: str
+
+    def forms(self) -> Dict[str, str]:
+        """Surface forms the SQL may use, longest first"""
+        return {"name": self.name, "short": self.short, "ticker": self.ticker}
+
+
+@dataclass
+class Slot:
+    kind: str  # "company" | "year" | "num"
+    value: object  # Entity for company, str for year/num
+
+
+def short_name(company_name: str) -> str:
+    """Strip corporate suffixes repeatedly ("Alphabet Inc. Class A" -> "Alphabet")"""
+    name = company_name.strip()
+    while True:
+        stripped = _NAME_SUFFIXES.sub("", name).strip()
+        if stripped == name or not stripped:
+            return name
+        name = stripped
+
+
+def build_entities(rows: Sequence[Tuple[str, str]]) -> List[Entity]:
+    """(ticker, company_name) rows -> Entity list"""
+    entities = []
+    for ticker, name in rows:
+        if not ticker:
+            continue
+        name = name or ticker
+        entities.append(Entity(ticker.upper(), name, short_name(name)))
+    return entities
+
+
+def schema_version(schema_text: str) -> str:
+    """Short hash identifying the schema the SQL was generated against"""
+    return hashlib.sha1((schema_text or "").encode("utf-8")).hexdigest()[:12]
+
+
+def normalize_question(question: str) -> str:
+    """
+    Lower-case, collapse whitespace and strip trailing "?!."
+
+    Operators, signs and decimal points are kept: "> 5%", "> -5%" and ">= 5%"
+    must not share a cache key.
+    """
+    text = re.sub(r"\s+", " ", question.lower()).strip()
+    return text.rstrip("?!. ")
+
+
+class _EntityMatcher:
+    """Finds company mentions (short names, full names, tickers) in text"""
+
+    def __init__(self, entities: Sequence[Entity]):
+        self.by_ticker = {e.ticker: e for e in entities}
+        aliases: Dict[str, Entity] = {}
+        for e in entities:
+            for alias in (e.name, e.short):
+                if len(alias) >= 3:
+                    aliases.setdefault(alias.lower(), e)
+        self.aliases = aliases
+        if aliases:
+            pattern = "|".join(
+                re.escape(a) for a in sorted(aliases, key=len, reverse=True)
+            )
+            self.alias_re = re.compile(rf"\b(?:{pattern})\b", re.IGNORECASE)
+        else:
+            self.alias_re = None
+
+    def find(self, text: str) -> List[Tuple[int, int, Entity]]:
+        spans = []
+        if self.alias_re is not None:
+            for m in self.alias_re.finditer(text):
+                spans.append((m.start(), m.end(), self.aliases[m.group(0).lower()]))
+        for m in _TICKER_RE.finditer(text):
+            token = m.group(0)
+            if token in self.by_ticker and token not in _TICKER_STOPWORDS:
+                spans.append((m.start(), m.end(), self.by_ticker[token]))
+
+        # keep the earliest/longest non-overlapping spans
+        spans.sort(key=lambda s: (s[0], -(s[1] - s[0])))
+        result, last_end = [], -1
+        for span in spans:
+            if span[0] >= last_end:
+                result.append(span)
+                last_end = span[1]
+        return result
+
+
+def extract_template(
+    question: str, matcher: Optional[_EntityMatcher]
+) -> Tuple[str, List[Slot]]:
+    """
+    Replace literals in the question with slots
+
+    Returns:
+        (normalized template text, slots in order of appearance)
+    """
+    spans: List[Tuple[int, int, Slot]] = []
+    if matcher is not None:
+        spans.extend((s, e, Slot("company", ent)) for s, e, ent in matcher.find(question))
+
+    def _free(start: int, end: int) -> bool:
+        return all(end <= s or start >= e for s, e, _ in spans)
+
+    for m in _YEAR_RE.finditer(question):
+        if _free(m.start(), m.end()):
+            spans.append((m.start(), m.end(), Slot("year", m.group(0))))
+    for m in _NUMBER_RE.finditer(question):
+        if _free(m.start(), m.end()):
+            spans.append((m.start(), m.end(), Slot("num", m.group(0))))
+
+    spans.sort(key=lambda s: s[0])
+    parts, pos = [], 0
+    for start, end, slot in spans:
+        parts.append(question[pos:start])
+        parts.append(f" <{slot.kind}> ")
+        pos = end
+    parts.append(question[pos:])
+    return normalize_question("".join(parts)), [s for _, _, s in spans]
+
+
+def _sql_escape(value: str) -> str:
+    return value.replace("'", "''")
+
+
+def _case_suffix(text: str, value: str) -> Optional[str]:
+    """Case applied to an entity form in the SQL ("" as-is, ".lower", ".upper")"""
+    if text == value:
+        return ""
+    if text == value.lower():
+        return ".lower"
+    if text == value.upper():
+        return ".upper"
+    return None
+
+
+def sql_to_template(sql: str, slots: List[Slot]) -> Optional[str]:
+    """
+    Replace slot literals in the SQL with {{slot_i.form[.case]}} markers
+
+    The literal's case (as-is, lower, upper) is kept in the marker so that
+    LOWER(col) LIKE '%apple%' renders as '%microsoft%' for another company.
+    Returns None when any literal cannot be placed unambiguously.
+    """
+    template = sql
+    for i, slot in enumerate(slots):
+        name = f"slot_{i}"
+        if slot.kind == "company":
+            replaced = 0
+            mixed_case = False
+
+            def _sub_literal(m: "re.Match") -> str:
+                nonlocal replaced, mixed_case
+                literal = m.group(0)
+                for form, value in slot.value.forms().items():
+                    escaped = _sql_escape(value)
+                    pattern = re.compile(
+                        rf"(?<![\w]){re.escape(escaped)}(?![\w])", re.IGNORECASE
+                    )
+
+                    def _marker(hit: "re.Match") -> str:
+                        nonlocal mixed_case
+                        suffix = _case_suffix(hit.group(0), escaped)
+                        if suffix is None:
+                            mixed_case = True
+                            return hit.group(0)
+                        return f"{{{{{name}.{form}{suffix}}}}}"
+
+                    literal, n = pattern.subn(_marker, literal)
+                    replaced += n
+                    if n:
+                        break
+                return literal
+
+            template = _SQL_LITERAL_RE.sub(_sub_literal, template)
+            if not replaced or mixed_case:
+                return None
+        else:
+            pattern = re.compile(rf"(?<![\w.]){re.escape(slot.value)}(?![\w.])")
+            outside = _SQL_LITERAL_RE.sub(lambda m: " " * len(m.group(0)), template)
+            if len(pattern.findall(outside)) != 1 or len(pattern.findall(template)) != 1:
+                return None
+            template = pattern.sub(f"{{{{{name}.value}}}}", template)
+    return template
+
+
+def render_template(template: str, slots: List[Slot]) -> Optional[str]:
+    """Fill {{slot_i.form[.case]}} markers with the new question's literals"""
+
+    def _fill(m: "re.Match") -> str:
+        index = int(m.group(1).split("_")[1])
+        slot = slots[index]
+        if slot.kind == "company":
+            value = _sql_escape(slot.value.forms()[m.group(2)])
+            if m.group(3) == "lower":
+                return value.lower()
+            if m.group(3) == "upper":
+                return value.upper()
+            return value
+        return str(slot.value)
+
+    try:
+        return _SLOT_RE.sub(_fill, template)
+    except (IndexError, KeyError, ValueError):
+        return None
+
+
+class SQLPlanCache:
+    """Process-wide cache of validated SQL for TextToSQL"""
+
+    def __init__(
+        self,
+        max_exact: int = MAX_EXACT_ENTRIES,
+        max_templates: int = MAX_TEMPLATE_ENTRIES,
+    ):
+        self.max_exact = max_exact
+        self.max_templates = max_templates
+        self._exact: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._templates: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._matchers: Dict[Tuple[str, Tuple[Entity, ...]], _EntityMatcher] = {}
+        self._lock = threading.Lock()
+        self.hits = {"exact": 0, "template": 0, "miss": 0}
+
+    def _matcher(self, version: str, entities: Sequence[Entity]) -> Optional[_EntityMatcher]:
+        if not entities:
+            return None
+        # companies can be added without a schema change, so key on both
+        key = (version, tuple(entities))
+        with self._lock:
+            matcher = self._matchers.get(key)
+        if matcher is None:
+            matcher = _EntityMatcher(entities)
+            with self._lock:
+                self._matchers = {key: matcher}  # only the current schema/entity set
+        return matcher
+
+    @staticmethod
+    def _put(store: OrderedDict, key, value, limit: int) -> None:
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > limit:
+            store.popitem(last=False)
+
+    def lookup(
+        self, question: str, version: str, entities: Sequence[Entity] = ()
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Returns:
+            (sql, "exact" | "template") or None on miss
+        """
+        exact_key = (version, normalize_question(question))
+        with self._lock:
+            sql = self._exact.get(exact_key)
+            if sql is not None:
+                self._exact.move_to_end(exact_key)
+                self.hits["exact"] += 1
+                return sql, "exact"
+
+        template_text, slots = extract_template(question, self._matcher(version, entities))
+        if slots:
+            with self._lock:
+                template = self._templates.get((version, template_text))
+                if template is not None:
+                    self._templates.move_to_end((version, template_text))
+            if template is not None:
+                sql = render_template(template, slots)
+                if sql is not None:
+                    with self._lock:
+                        self.hits["template"] += 1
+                    return sql, "template"
+
+        with self._lock:
+            self.hits["miss"] += 1
+        return None
+
+    def store(
+        self, question: str, sql: str, version: str, entities: Sequence[Entity] = ()
+    ) -> None:
+        """Cache SQL that executed successfully for this question"""
+        with self._lock:
+            self._put(
+                self._exact, (version, normalize_question(question)), sql, self.max_exact
+            )
+
+        template_text, slots = extract_template(question, self._matcher(version, entities))
+        if not slots:
+            return
+        template = sql_to_template(sql, slots)
+        if template is None:
+            logger.debug(f"SQL not templatable for question: {question}")
+            return
+        with self._lock:
+            self._put(
+                self._templates, (version, template_text), template, self.max_templates
+            )
+
+    def invalidate(self, question: str, version: str, entities: Sequence[Entity] = ()) -> None:
+        """Drop cached SQL for a question (e.g. after it failed to execute)"""
+        template_text, _ = extract_template(question, self._matcher(version, entities))
+        with self._lock:
+            self._exact.pop((version, normalize_question(question)), None)
+            self._templates.pop((version, template_text), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._exact.clear()
+            self._templates.clear()
+            self._matchers.clear()
+            self.hits = {"exact": 0, "template": 0, "miss": 0}
+
+
+_plan_cache = SQLPlanCache()
+
+
+def get_plan_cache() -> SQLPlanCache:
+    """Process-wide plan cache shared by all TextToSQL instances"""
+    return _plan_cache
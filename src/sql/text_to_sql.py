@@ -11,6 +11,22 @@ from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 from sqlalchemy import create_engine
 
+try:
+    from sql.duckdb_mirror import DuckDBMirror, drop_relation, get_mirror
+    from sql.query_guard import QueryGuard
+    from sql.schema_catalog import SchemaCatalog
+    from sql.sql_cache import SQLPlanCache, build_entities, get_plan_cache, schema_version
+except ImportError:
+    from src.sql.duckdb_mirror import DuckDBMirror, drop_relation, get_mirror
+    from src.sql.query_guard import QueryGuard
+    from src.sql.schema_catalog import SchemaCatalog
+    from src.sql.sql_cache import (
+        SQLPlanCache,
+        build_entities,
+        get_plan_cache,
+        schema_version,
+    )
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +41,9 @@ class TextToSQL:
         database_url: str = "duckdb:///:memory:",
         llm_model: str = "gpt-4-turbo-preview",
         api_key: Optional[str] = None,
+        mirror: Optional[DuckDBMirror] = None,
+        use_mirror: bool = True,
+        plan_cache: Optional[SQLPlanCache] = None,
     ):
         """
         Initialize Text-to-SQL engine
@@ -33,17 +52,53 @@ class TextToSQL:
             database_url: Database connection string
             llm_model: LLM model for SQL generation
             api_key: OpenAI API key
+            mirror: Local Supabase mirror (default: shared process-wide mirror)
+            use_mirror: Attach mirrored Supabase tables if snapshots exist
+            plan_cache: Cache of validated SQL (default: shared process-wide cache)
         """
         self.database_url = database_url
         self.llm = ChatOpenAI(model=llm_model, temperature=0, openai_api_key=api_key)
 
         # Initialize database connection
+        self.guard: Optional[QueryGuard] = None
         if "duckdb" in database_url:
             self.conn = duckdb.connect(database=":memory:")
+            self.guard = QueryGuard(self.conn)
         else:
             self.engine = create_engine(database_url)
 
         self.schema_info = None
+        self.catalog: Optional[SchemaCatalog] = None
+        self.schema_version = schema_version("")
+        self.entities = []
+        self.mirror = mirror or get_mirror()
+        self.plan_cache = plan_cache or get_plan_cache()
+
+        if use_mirror and "duckdb" in database_url:
+            self.attach_mirror()
+        if self.guard is not None:
+            # generated SQL may only read the attached tables, never arbitrary files
+            self.guard.restrict_file_access([str(self.mirror.mirror_dir)])
+
+    def attach_mirror(self) -> List[str]:
+        """
+        Attach the local Supabase mirror (Parquet snapshots) as read-only views
+
+        Queries then run locally without Supabase traffic. Snapshots are
+        refreshed out of band by `scripts/sync_duckdb_mirror.py`.
+        """
+        try:
+            attached = self.mirror.attach(self.conn)
+        except Exception as e:
+            logger.error(f"Error attaching DuckDB mirror: {str(e)}")
+            return []
+
+        if attached:
+            logger.info(f"Attached mirrored tables: {', '.join(attached)}")
+            self._update_schema_info()
+        else:
+            logger.info("No DuckDB mirror snapshots found; run sync_duckdb_mirror.py")
+        return attached
 
     def create_financial_tables(self):
         """Create standard financial tables (Supabase Schema Mirror)"""
@@ -198,42 +253,59 @@ class TextToSQL:
     def _update_schema_info(self):
         """Update schema information for the LLM"""
         try:
-            tables_info = self.conn.execute(
-                """
-                SELECT table_name, column_name, data_type 
-                FROM information_schema.columns 
-                WHERE table_schema = 'main'
-                ORDER BY table_name, ordinal_position
-            """
-            ).fetchdf()
-
-            schema_text = "Database Schema:\n\n"
-
-            for table in tables_info["table_name"].unique():
-                schema_text += f"Table: {table}\n"
-                table_cols = tables_info[tables_info["table_name"] == table]
-
-                for _, row in table_cols.iterrows():
-                    schema_text += f"  - {row['column_name']}: {row['data_type']}\n"
-
-                schema_text += "\n"
-
-            self.schema_info = schema_text
+            self.catalog = SchemaCatalog.from_connection(self.conn)
+            self.schema_info = self.catalog.render()
 
         except Exception as e:
             logger.error(f"Error updating schema info: {str(e)}")
+            self.catalog = None
             self.schema_info = "Schema information not available"
 
-    def natural_language_to_sql(self, question: str) -> Dict:
+        # samples/statistics change on every mirror sync; only structure invalidates plans
+        self.schema_version = schema_version(
+            self.catalog.structure_text() if self.catalog is not None else self.schema_info
+        )
+        self._load_entities()
+
+    def _load_entities(self):
+        """Load company names/tickers used to match <company> slots in questions"""
+        try:
+            rows = self.conn.execute(
+                "SELECT ticker, company_name FROM companies WHERE ticker IS NOT NULL"
+            ).fetchall()
+            self.entities = build_entities(rows)
+        except Exception:
+            self.entities = []
+
+    def _schema_for(self, question: str) -> str:
+        """Schema text pruned to the tables/columns relevant to the question"""
+        if self.catalog is not None:
+            return self.catalog.render_for_question(question)
+        return self.schema_info or "Schema not available"
+
+    def natural_language_to_sql(self, question: str, use_cache: bool = True) -> Dict:
         """
         Convert natural language question to SQL
 
         Args:
             question: Natural language question
+            use_cache: Reuse validated SQL for repeated/templated questions
 
         Returns:
             Dictionary with SQL query and explanation
         """
+        if use_cache:
+            cached = self.plan_cache.lookup(question, self.schema_version, self.entities)
+            if cached:
+                sql_query, cache_kind = cached
+                logger.info(f"SQL plan cache hit ({cache_kind}): {question}")
+                return {
+                    "question": question,
+                    "sql": sql_query,
+                    "success": True,
+                    "cached": cache_kind,
+                }
+
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
@@ -265,7 +337,7 @@ class TextToSQL:
             chain = prompt | self.llm
             response = chain.invoke(
                 {
-                    "schema": self.schema_info or "Schema not available",
+                    "schema": self._schema_for(question),
                     "question": question,
                 }
             )
@@ -279,7 +351,12 @@ class TextToSQL:
                     sql_query = sql_query[3:]
                 sql_query = sql_query.strip()
 
-            return {"question": question, "sql": sql_query, "success": True}
+            return {
+                "question": question,
+                "sql": sql_query,
+                "success": True,
+                "cached": None,
+            }
 
         except Exception as e:
             logger.error(f"Error generating SQL: {str(e)}")
@@ -291,7 +368,15 @@ class TextToSQL:
             }
 
     def execute_query(self, sql: str) -> Dict:
-        """Execute SQL query and return results"""
+        """
+        Execute SQL query and return results
+
+        Generated SQL runs through QueryGuard (read-only check, EXPLAIN cost
+        limit, default LIMIT, timeout, cursor pool).
+        """
+        if self.guard is not None:
+            return self.guard.execute(sql)
+
         try:
             result_df = self.conn.execute(sql).fetchdf()
 
@@ -315,20 +400,41 @@ class TextToSQL:
 
         execution_result = self.execute_query(sql_result["sql"])
 
+        # Cached SQL no longer valid (e.g. data changed shape) -> ask the LLM again
+        if not execution_result["success"] and sql_result.get("cached"):
+            self.plan_cache.invalidate(question, self.schema_version, self.entities)
+            sql_result = self.natural_language_to_sql(question, use_cache=False)
+            if not sql_result["success"]:
+                return sql_result
+            execution_result = self.execute_query(sql_result["sql"])
+
+        if execution_result["success"]:
+            self.plan_cache.store(
+                question, sql_result["sql"], self.schema_version, self.entities
+            )
+
         return {
             "question": question,
             "sql": sql_result["sql"],
+            "cached": sql_result.get("cached"),
             "success": execution_result["success"],
             "data": execution_result.get("data"),
             "row_count": execution_result.get("row_count"),
+            "truncated": execution_result.get("truncated", False),
             "error": execution_result.get("error"),
         }
 
     def load_data_from_dataframe(self, df: pd.DataFrame, table_name: str):
         """Load data from pandas DataFrame into database"""
         try:
-            self.conn.execute(f"DROP TABLE IF EXISTS {table_name}")
-            self.conn.execute(f"CREATE TABLE {table_name} AS SELECT * FROM df")
+            # the name may be a mirror view, so drop whichever kind exists
+            drop_relation(self.conn, table_name)
+            # replacement scans are disabled once file access is restricted
+            self.conn.register("_load_df", df)
+            try:
+                self.conn.execute(f"CREATE TABLE {table_name} AS SELECT * FROM _load_df")
+            finally:
+                self.conn.unregister("_load_df")
             logger.info(f"Loaded {len(df)} rows into {table_name}")
             self._update_schema_info()
 
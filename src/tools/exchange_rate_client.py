@@ -1,13 +1,17 @@
 """
 Exchange Rate Client - 한국 거주자 맞춤형 환율 클라이언트
 Open Exchange Rates API (Base: KRW 또는 USD)를 사용하여 한국 시간(KST) 기반 정보를 제공합니다.
+- 캐시 만료 전에 백그라운드에서 미리 갱신 (최근 조회된 기준 통화만)
+- 캐시가 없을 때 동시에 들어온 요청은 1회 조회로 합침 (single-flight)
+- 만료되었거나 API 장애 시에도 마지막 정상 값을 즉시 반환 (stale 표시)
 """
 
-import os
 import logging
+import threading
 import requests
+from concurrent.futures import Future
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from typing import Dict, Optional
 from dotenv import load_dotenv
 import pytz
 
@@ -18,6 +22,9 @@ logger = logging.getLogger(__name__)
 # 무료 API 엔드포인트
 EXCHANGE_RATE_API_URL = "https://open.er-api.com/v6/latest"
 
+REFRESH_AHEAD_RATIO = 0.8  # 캐시 수명의 80%가 지나면 백그라운드 갱신
+FAILURE_RETRY_SECONDS = 60  # 조회 실패 후 재시도까지의 간격
+
 
 class ExchangeRateClient:
     """한국 기준(KRW 중심) 환율 정보 API 클라이언트"""
@@ -25,22 +32,24 @@ class ExchangeRateClient:
     def __init__(self):
         """Initialize exchange rate client"""
         self._cache = {}
-        self._cache_time = None
         self._cache_duration = timedelta(minutes=30)  # 30분 캐시
         self.kst = pytz.timezone("Asia/Seoul")
-        logger.info("ExchangeRateClient (Korean Standard) initialized")
+        self.session = requests.Session()
 
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cache is still valid for a specific key"""
-        if cache_key not in self._cache:
-            return False
-        timestamp, _ = self._cache[cache_key]
-        return datetime.now() - timestamp < self._cache_duration
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}  # cache_key -> 진행 중인 조회
+        self._failed_at: Dict[str, datetime] = {}
+        self._last_access: Dict[str, datetime] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        logger.info("ExchangeRateClient (Korean Standard) initialized")
 
     def get_latest_rates(self, base: str = "USD") -> Dict:
         """
         최신 환율 정보 가져오기
 
+        캐시 값이 있으면 만료 여부와 관계없이 즉시 반환하고(만료 시 "stale": True),
+        갱신은 백그라운드에서 수행합니다. 캐시가 없을 때만 조회를 기다립니다.
+
         Args:
             base: 기준 통화 (기본: USD)
 
@@ -48,12 +57,100 @@ class ExchangeRateClient:
             Dict with exchange rates and KST timestamp
         """
         cache_key = f"latest_{base}"
+        now = datetime.now()
+
+        with self._lock:
+            self._last_access[cache_key] = now
+            entry = self._cache.get(cache_key)
+
+        if entry is not None:
+            timestamp, result = entry
+            age = now - timestamp
+            if age >= self._cache_duration * REFRESH_AHEAD_RATIO:
+                self._refresh_in_background(base)
+            if age >= self._cache_duration:
+                return {**result, "stale": True}
+            return result
+
+        # 최근 실패했다면 API 장애 중이므로 바로 에러 반환
+        with self._lock:
+            failed_at = self._failed_at.get(cache_key)
+        if failed_at and (now - failed_at).total_seconds() < FAILURE_RETRY_SECONDS:
+            return {"error": "환율 정보를 가져올 수 없습니다.", "rates": {}}
+
+        result = self._fetch_single_flight(base)
+        if result is None:
+            return {"error": "환율 정보를 가져올 수 없습니다.", "rates": {}}
+        return result
+
+    def _fetch_single_flight(self, base: str) -> Optional[Dict]:
+        """같은 기준 통화 동시 조회를 1회로 합침 (실패 시 None)"""
+        cache_key = f"latest_{base}"
+        with self._lock:
+            future = self._inflight.get(cache_key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[cache_key] = future
+
+        if not owner:
+            return future.result()
+
+        result = None
+        try:
+            result = self._fetch_latest_rates(base)
+        finally:
+            with self._lock:
+                del self._inflight[cache_key]
+                if result is not None:
+                    self._cache[cache_key] = (datetime.now(), result)
+                    self._failed_at.pop(cache_key, None)
+                else:
+                    self._failed_at[cache_key] = datetime.now()
+            future.set_result(result)
 
-        if self._is_cache_valid(cache_key):
-            return self._cache[cache_key][1]
+        if result is not None:
+            self._schedule_refresh(base)
+        return result
 
+    def _refresh_in_background(self, base: str) -> None:
+        """진행 중인 조회가 없으면 백그라운드 스레드에서 갱신"""
+        cache_key = f"latest_{base}"
+        with self._lock:
+            if cache_key in self._inflight:
+                return
+            failed_at = self._failed_at.get(cache_key)
+        if failed_at and (datetime.now() - failed_at).total_seconds() < FAILURE_RETRY_SECONDS:
+            return
+        threading.Thread(
+            target=self._fetch_single_flight, args=(base,), daemon=True
+        ).start()
+
+    def _schedule_refresh(self, base: str) -> None:
+        """만료 전에 갱신 예약 (최근 캐시 수명 안에 조회된 기준 통화만 계속 유지)"""
+        cache_key = f"latest_{base}"
+        delay = self._cache_duration.total_seconds() * REFRESH_AHEAD_RATIO
+
+        def refresh():
+            with self._lock:
+                last_access = self._last_access.get(cache_key)
+                self._timers.pop(cache_key, None)
+            if last_access and datetime.now() - last_access < self._cache_duration:
+                self._refresh_in_background(base)
+
+        timer = threading.Timer(delay, refresh)
+        timer.daemon = True
+        with self._lock:
+            previous = self._timers.pop(cache_key, None)
+            self._timers[cache_key] = timer
+        if previous is not None:
+            previous.cancel()
+        timer.start()
+
+    def _fetch_latest_rates(self, base: str) -> Optional[Dict]:
+        """환율 API 조회 (캐시 미적용, 실패 시 None)"""
         try:
-            response = requests.get(f"{EXCHANGE_RATE_API_URL}/{base}", timeout=10)
+            response = self.session.get(f"{EXCHANGE_RATE_API_URL}/{base}", timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
@@ -71,21 +168,24 @@ class ExchangeRateClient:
                 else:
                     update_time_kst = "최근 정보"
 
-                result = {
+                rates = data.get("rates", {})
+                if not rates:
+                    logger.error(f"Exchange rate API returned no rates for {base}")
+                    return None
+
+                return {
                     "base": base,
                     "update_time_kst": update_time_kst,
-                    "rates": data.get("rates", {}),
+                    "rates": rates,
                     "source": "Global Open Exchange",
                     "note": "한국 시간(KST) 기준",
                 }
 
-                self._cache[cache_key] = (datetime.now(), result)
-                return result
-
+            logger.error(f"Exchange rate API HTTP {response.status_code}")
         except Exception as e:
             logger.error(f"Exchange rate API error: {e}")
 
-        return {"error": "환율 정보를 가져올 수 없습니다.", "rates": {}}
+        return None
 
     def get_rate(self, from_currency: str, to_currency: str) -> Optional[float]:
         """두 통화간 환율 가져오기 (예: USD, KRW)"""
@@ -159,11 +259,13 @@ class ExchangeRateClient:
 
 # Singleton instance
 _exchange_client = None
+_exchange_client_lock = threading.Lock()
 
 
 def get_exchange_client() -> ExchangeRateClient:
     """Get singleton exchange rate client"""
     global _exchange_client
-    if _exchange_client is None:
-        _exchange_client = ExchangeRateClient()
-    return _exchange_client
+    with _exchange_client_lock:
+        if _exchange_client is None:
+            _exchange_client = ExchangeRateClient()
+        return _exchange_client
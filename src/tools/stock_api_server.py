@@ -1,11 +1,16 @@
 """
 Stock API MCP Server
 주식 시장 데이터를 제공하는 MCP 서버입니다. (Finnhub + yfinance)
+- 모든 도구는 비동기 클라이언트로 처리 (하나의 이벤트 루프에서 동시 요청)
+- 응답 캐시/호출 예산은 앱의 동기 클라이언트와 공유 (STOCK_API_CACHE_DIR 설정 시 프로세스 간 공유)
+- 여러 종목을 한 번에 조회하는 일괄 도구 제공 (get_stock_quotes, get_company_profiles)
 """
 
+import asyncio
 import sys
 import os
-from typing import Optional, List, Dict, Any
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Tuple
 from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
 
@@ -14,7 +19,7 @@ start_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if start_path not in sys.path:
     sys.path.append(start_path)
 
-from data.stock_api_client import get_stock_api_client
+from data.async_stock_api_client import get_async_stock_api_client
 
 # 환경 변수 로드
 load_dotenv()
@@ -22,22 +27,39 @@ load_dotenv()
 # API 키 확인
 API_KEY = os.getenv("FINNHUB_API_KEY")
 
-# Stock API 클라이언트 초기화 (Singleton)
-stock_client = get_stock_api_client()
+# 일괄 도구 1회 호출당 최대 종목 수
+MAX_BATCH_SYMBOLS = 50
+# 캔들 가격 반올림 자릿수 (응답 크기 축소)
+CANDLE_PRICE_DECIMALS = 4
+
+# 비동기 Stock API 클라이언트 (Singleton)
+stock_client = get_async_stock_api_client()
 
 # MCP 서버 초기화
 mcp = FastMCP("Stock Data API")
 
 
-@mcp.tool()
-def get_stock_quote(symbol: str) -> Dict[str, Any]:
+def _normalize_symbols(symbols: List[str]) -> Tuple[List[str], List[str]]:
     """
-    특정 주식 티커의 실시간 시세 정보를 조회합니다.
+    중복/공백 제거한 대문자 티커 목록
+
+    Returns:
+        (조회할 티커 최대 MAX_BATCH_SYMBOLS개, 한도를 넘어 제외된 티커)
     """
-    quote = stock_client.get_quote(symbol)
+    unique = list(
+        dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip())
+    )
+    return unique[:MAX_BATCH_SYMBOLS], unique[MAX_BATCH_SYMBOLS:]
+
+
+def _format_quote(symbol: str, quote: Dict[str, Any]) -> Dict[str, Any]:
+    """내부 quote 형식 -> 도구 응답 형식"""
     if "error" in quote:
         return {"error": quote["error"], "symbol": symbol}
+    return _quote_fields(symbol, quote)
+
 
+def _quote_fields(symbol: str, quote: Dict[str, Any]) -> Dict[str, Any]:
     # 키 매핑 (내부 클라이언트 반환값에 맞춤)
     return {
         "symbol": symbol,
@@ -53,30 +75,120 @@ def get_stock_quote(symbol: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_company_profile(symbol: str) -> Dict[str, Any]:
+async def get_stock_quote(symbol: str) -> Dict[str, Any]:
+    """
+    특정 주식 티커의 실시간 시세 정보를 조회합니다.
+    """
+    return _format_quote(symbol, await stock_client.get_quote(symbol))
+
+
+@mcp.tool()
+async def get_stock_quotes(symbols: List[str]) -> Dict[str, Any]:
+    """
+    여러 티커의 실시간 시세를 한 번에 조회합니다. (최대 50개)
+    응답: {"quotes": [get_stock_quote와 같은 항목...], "truncated": [한도 초과로 제외된 티커]}
+    조회에 실패한 티커도 quotes에 포함되며, current_price 등 시세 값이 null이고 error 메시지가 붙습니다.
+    """
+    symbols, truncated = _normalize_symbols(symbols)
+    columns = await stock_client.get_quotes(symbols)
+    quotes = []
+    for i, symbol in enumerate(columns["symbol"]):
+        row = {key: values[i] for key, values in columns.items()}
+        quote = _quote_fields(symbol, row)
+        if quote["current_price"] is None:
+            quote["error"] = "주가 데이터를 가져오지 못했습니다."
+        quotes.append(quote)
+    return {"quotes": quotes, "truncated": truncated}
+
+
+@mcp.tool()
+async def get_company_profile(symbol: str) -> Dict[str, Any]:
     """기업의 기본 프로필 정보 조회"""
-    return stock_client.get_company_profile(symbol)
+    return await stock_client.get_company_profile(symbol)
+
+
+@mcp.tool()
+async def get_company_profiles(symbols: List[str]) -> Dict[str, Any]:
+    """
+    여러 기업의 프로필을 한 번에 조회합니다. (최대 50개)
+    응답: {"profiles": {티커: 프로필}, "truncated": [한도 초과로 제외된 티커]}
+    """
+    symbols, truncated = _normalize_symbols(symbols)
+    profiles = await asyncio.gather(
+        *(stock_client.get_company_profile(symbol) for symbol in symbols)
+    )
+    return {"profiles": dict(zip(symbols, profiles)), "truncated": truncated}
+
+
+@mcp.tool()
+async def get_stock_candles(
+    symbol: str,
+    resolution: str = "D",
+    days: int = 30,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    주가 캔들(OHLCV)을 컬럼 배열로 조회합니다.
+    resolution: 1, 5, 15, 30, 60(분), D(일), W(주), M(월)
+    from_date/to_date(YYYY-MM-DD)를 지정하지 않으면 최근 days일 (to_date는 그날 23:59:59까지 포함)
+    응답: {"symbol", "resolution", "t": [unix초], "o", "h", "l", "c", "v"}
+    """
+    symbol = symbol.strip().upper()
+    try:
+        end = (
+            # 날짜만 주어지면 자정이 아니라 그날의 끝까지 포함
+            datetime.strptime(to_date, "%Y-%m-%d").replace(
+                hour=23, minute=59, second=59
+            )
+            if to_date
+            else datetime.now()
+        )
+        # 오늘/미래 날짜의 23:59:59는 아직 없는 구간 -> 현재 시각까지로 제한
+        # (CandleCache가 당일 구간을 짧은 TTL의 live tail로 처리하도록)
+        end = min(end, datetime.now())
+        start = (
+            datetime.strptime(from_date, "%Y-%m-%d")
+            if from_date
+            else end - timedelta(days=days)
+        )
+    except ValueError:
+        return {"error": "날짜 형식은 YYYY-MM-DD 입니다.", "symbol": symbol}
+
+    candles = await stock_client.get_candles(symbol, resolution, start, end)
+    if candles.get("s") != "ok":
+        return {
+            "error": candles.get("error", "해당 기간의 주가 데이터가 없습니다."),
+            "symbol": symbol,
+        }
+
+    result = {"symbol": symbol, "resolution": resolution, "t": candles["t"]}
+    for key in ("o", "h", "l", "c"):
+        result[key] = [round(v, CANDLE_PRICE_DECIMALS) for v in candles[key]]
+    result["v"] = [int(v) for v in candles["v"]]
+    return result
 
 
 @mcp.tool()
-def get_price_target(symbol: str) -> Dict[str, Any]:
+async def get_price_target(symbol: str) -> Dict[str, Any]:
     """애널리스트 목표 주가 조회"""
-    return stock_client.get_price_target(symbol)
+    return await stock_client.get_price_target(symbol)
 
 
 @mcp.tool()
-def get_company_news(
+async def get_company_news(
     symbol: str, from_date: str = None, to: str = None
 ) -> List[Dict[str, Any]]:
     """기업 뉴스 조회 (최근 7일 기본)"""
     # 내부 클라이언트는 to -> to_date 파라미터 사용
-    return stock_client.get_company_news(symbol, from_date=from_date, to_date=to)[:5]
+    news = await stock_client.get_company_news(symbol, from_date=from_date, to_date=to)
+    return news[:5]
 
 
 @mcp.tool()
-def get_market_news(category: str = "general") -> List[Dict[str, Any]]:
+async def get_market_news(category: str = "general") -> List[Dict[str, Any]]:
     """시장 전체 뉴스 조회"""
-    return stock_client.get_market_news(category)[:5]
+    return (await stock_client.get_market_news(category))[:5]
 
 
 if __name__ == "__main__":
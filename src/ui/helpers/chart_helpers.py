@@ -11,24 +11,28 @@ import streamlit as st
 CHART_CONFIGS = [
     {
         "key": "chart_line",
+        "chart_type": "line",
         "default": True,
         "plotly_func": "generate_line_chart_plotly",
         "mpl_func": "generate_line_chart",
     },
     {
         "key": "chart_candle",
+        "chart_type": "candlestick",
         "default": False,
         "plotly_func": "generate_candlestick_chart_plotly",
         "mpl_func": "generate_candlestick_chart",
     },
     {
         "key": "chart_volume",
+        "chart_type": "volume",
         "default": False,
         "plotly_func": "generate_volume_chart_plotly",
         "mpl_func": "generate_volume_chart",
     },
     {
         "key": "chart_financial",
+        "chart_type": "financial",
         "default": False,
         "plotly_func": "generate_financial_chart_plotly",
         "mpl_func": "generate_financial_chart",
@@ -36,6 +40,30 @@ CHART_CONFIGS = [
 ]
 
 
+def _selected_configs() -> List[dict]:
+    """체크박스로 선택된 차트 설정 목록"""
+    return [
+        config
+        for config in CHART_CONFIGS
+        if st.session_state.get(config["key"], config["default"])
+    ]
+
+
+def _render_mpl_batch(tickers: List[str], mpl_funcs: dict, configs: List[dict]):
+    """
+    선택된 matplotlib 차트를 일괄 렌더링 (chart_renderer 프로세스 풀 사용)
+
+    mpl_funcs에 "render_charts"가 없으면 None을 반환하여 개별 렌더링으로 fallback
+    """
+    batch_func = mpl_funcs.get("render_charts")
+    if not batch_func or not configs:
+        return None
+    try:
+        return batch_func(tickers, [c["chart_type"] for c in configs])
+    except Exception:
+        return None
+
+
 def render_chart_selection():
     """차트 선택 옵션 렌더링"""
     st.markdown("### 📊 차트 선택")
@@ -66,11 +94,12 @@ def render_charts_plotly(
         PDF용 차트 이미지 BytesIO 목록
     """
     chart_images = []
+    configs = _selected_configs()
 
-    for config in CHART_CONFIGS:
-        if not st.session_state.get(config["key"], config["default"]):
-            continue
+    # PDF용 matplotlib 이미지는 프로세스 풀에서 병렬 생성
+    batch = _render_mpl_batch(tickers, mpl_funcs, configs) if mpl_funcs else None
 
+    for i, config in enumerate(configs):
         # Plotly 차트 표시
         plotly_func = plotly_funcs.get(config["plotly_func"])
         if plotly_func:
@@ -79,7 +108,10 @@ def render_charts_plotly(
                 st.plotly_chart(fig, use_container_width=True)
 
         # PDF용 matplotlib 이미지 생성
-        if mpl_funcs:
+        if batch is not None:
+            if batch[i]:
+                chart_images.append(batch[i])
+        elif mpl_funcs:
             mpl_func = mpl_funcs.get(config["mpl_func"])
             if mpl_func:
                 buf = mpl_func(tickers)
@@ -104,18 +136,19 @@ def render_charts_matplotlib(
         차트 이미지 BytesIO 목록
     """
     chart_images = []
+    configs = _selected_configs()
+    batch = _render_mpl_batch(tickers, mpl_funcs, configs)
 
-    for config in CHART_CONFIGS:
-        if not st.session_state.get(config["key"], config["default"]):
-            continue
-
-        mpl_func = mpl_funcs.get(config["mpl_func"])
-        if mpl_func:
-            buf = mpl_func(tickers)
-            if buf:
-                st.image(buf, use_container_width=True)
-                buf.seek(0)
-                chart_images.append(buf)
+    for i, config in enumerate(configs):
+        if batch is not None:
+            buf = batch[i]
+        else:
+            mpl_func = mpl_funcs.get(config["mpl_func"])
+            buf = mpl_func(tickers) if mpl_func else None
+        if buf:
+            st.image(buf, use_container_width=True)
+            buf.seek(0)
+            chart_images.append(buf)
 
     return chart_images
 
@@ -190,7 +223,9 @@ def create_download_button(
         pdf_create_func: PDF 생성 함수
     """
     try:
-        pdf_bytes = pdf_create_func(report, chart_images=chart_images)
+        pdf_bytes = pdf_create_func(
+            report, chart_images=chart_images, image_format="png"
+        )
         st.download_button(
             label="📥 레포트 다운로드 (PDF)",
             data=pdf_bytes,
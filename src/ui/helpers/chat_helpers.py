@@ -24,6 +24,12 @@ try:
 except ImportError:
     pass
 
+# 서버 측 다운샘플링 (분봉 등 대량 포인트 축소)
+try:
+    from utils.downsampling import downsample_line
+except ImportError:
+    downsample_line = None
+
 
 def render_chart_from_data(chart_data: Dict) -> bool:
     """
@@ -45,6 +51,11 @@ def render_chart_from_data(chart_data: Dict) -> bool:
         ticker = chart_data.get("ticker", "Stock")
         closes = chart_data["c"]
         timestamps = chart_data["t"]
+        n_points = len(closes)
+
+        # 차트 폭에 맞게 축소한 뒤 날짜 변환 (변환 비용도 함께 절감)
+        if downsample_line:
+            timestamps, closes = downsample_line(timestamps, closes)
         dates = [datetime.fromtimestamp(t) for t in timestamps]
 
         st.subheader(f"📈 {ticker} 주가 추이")
@@ -77,7 +88,7 @@ def render_chart_from_data(chart_data: Dict) -> bool:
             df.set_index("Date", inplace=True)
             st.line_chart(df)
 
-        st.caption(f"최근 {len(closes)}일/구간 데이터 ({ticker})")
+        st.caption(f"최근 {n_points}일/구간 데이터 ({ticker})")
         return True
     except Exception:
         return False
@@ -54,13 +54,16 @@ def resolve_to_ticker(term: str) -> tuple[str, str | None]:
     if lower_term in COMPANY_MAP:
         return COMPANY_MAP[lower_term], None
 
-    # DB에서 검색 (lazy import)
+    # 로컬 기업 검색 인덱스에서 검색 (lazy import, DB 왕복 없음)
     try:
-        from src.data.supabase_client import SupabaseClient
-
-        df = SupabaseClient.search_companies(term)
-        if df is not None and not df.empty:
-            return df.iloc[0]["ticker"], None
+        try:
+            from utils.company_search import get_company_search
+        except ImportError:
+            from src.utils.company_search import get_company_search
+
+        found = get_company_search().resolve(term)
+        if found:
+            return found, None
     except Exception:
         pass
 
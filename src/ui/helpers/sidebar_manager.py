@@ -1,6 +1,9 @@
 import streamlit as st
 import logging
+import uuid
+from data.quote_hub import get_quote_hub
 from data.supabase_client import SupabaseClient
+from utils.company_search import search_companies
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +38,7 @@ def render_watchlist_sidebar():
     if add_clicked and new_ticker:
         search_term = new_ticker.strip()
         try:
-            df = SupabaseClient.search_companies(search_term)
+            df = search_companies(search_term, limit=1)
 
             if not df.empty:
                 found_ticker = df.iloc[0]["ticker"]
@@ -61,13 +64,30 @@ def render_watchlist_sidebar():
 
     st.markdown("---")
 
-    # 4. List UI (List Layout)
+    # 4. 실시간 시세 (세션 간 공유 허브, 재실행마다 구독 임대 갱신)
+    quotes = {}
+    if "quote_hub_session" not in st.session_state:
+        st.session_state.quote_hub_session = uuid.uuid4().hex
+    try:
+        hub = get_quote_hub()
+        hub.subscribe(st.session_state.quote_hub_session, watchlist)
+        quotes = hub.snapshot(watchlist)
+    except Exception as e:
+        logger.warning(f"Quote hub unavailable: {e}")
+
+    # 5. List UI (List Layout)
     if watchlist:
         st.markdown("##### ⭐ 관심 기업")
         for ticker in list(watchlist):
             col1, col2 = st.columns([3, 1])
             with col1:
-                st.markdown(f"📈 **{ticker}**")
+                tick = quotes.get(ticker)
+                if tick and tick.get("price") is not None:
+                    change = tick.get("change_pct")
+                    change_text = f" ({change:+.2f}%)" if change is not None else ""
+                    st.markdown(f"📈 **{ticker}** ${tick['price']:,.2f}{change_text}")
+                else:
+                    st.markdown(f"📈 **{ticker}**")
             with col2:
                 if st.button("x", key=f"sidebar_rm_{ticker}", help=f"{ticker} 삭제"):
                     try:
@@ -85,10 +85,32 @@ def _render_plotly_pie_chart(series: pd.Series, title: str):
     st.plotly_chart(fig, use_container_width=True)
 
 
+def _get_ratio_panel() -> pd.DataFrame:
+    """사전 계산된 재무비율 패널 (financial_ratios 스냅샷, 파일 갱신 시각 기준 캐싱)"""
+    try:
+        from utils.ratio_engine import load_ratio_panel
+
+        return load_ratio_panel()
+    except Exception:
+        return pd.DataFrame()
+
+
+def _get_dashboard_snapshot():
+    """스케줄러가 미리 계산한 홈 대시보드 집계 (없으면 None)"""
+    try:
+        from utils.dashboard_snapshot import load_dashboard_snapshot
+
+        return load_dashboard_snapshot()
+    except Exception:
+        return None
+
+
 def _get_data_period(supabase_client) -> str:
     """DB에서 실제 데이터 기간 조회"""
     try:
-        annual_df = supabase_client.get_annual_reports()
+        annual_df = _get_ratio_panel()
+        if annual_df.empty:
+            annual_df = _get_cached_annual_reports(supabase_client)
         if not annual_df.empty and "fiscal_year" in annual_df.columns:
             min_year = int(annual_df["fiscal_year"].min())
             max_year = int(annual_df["fiscal_year"].max())
@@ -109,27 +131,27 @@ def _get_last_update() -> str:
 # -----------------------------------------------------------------------------
 
 
+# 인자명 앞의 "_"는 Streamlit 캐시 키 해싱에서 클라이언트 클래스를 제외
 @st.cache_data(ttl=3600)
-def _get_cached_companies(supabase_client):
-    """모든 기업 목록 캐싱 (1시간)"""
-    return supabase_client.get_all_companies()
+def _get_cached_companies(_supabase_client):
+    """모든 기업 목록 캐싱 (1시간, 대시보드에 표시하는 컬럼만)"""
+    return _supabase_client.get_all_companies(columns="ticker, company_name, sector")
 
 
 @st.cache_data(ttl=3600)
-def _get_cached_annual_reports(supabase_client):
-    """연간 재무 데이터 캐싱 (1시간)"""
-    return supabase_client.get_annual_reports()
+def _get_cached_annual_reports(_supabase_client):
+    """연간 재무 데이터 캐싱 (1시간, 기간/건수 표시에 필요한 컬럼만)"""
+    return _supabase_client.get_annual_reports(columns="company_id, fiscal_year")
 
 
 @st.cache_data(ttl=3600)
-def _get_cached_top_revenue_companies(supabase_client, year=2024, limit=20):
+def _get_cached_top_revenue_companies(_supabase_client, year=2024, limit=20):
     """매출 상위 기업 캐싱 (1시간)"""
-    return supabase_client.get_top_companies_by_revenue(year, limit)
+    return _supabase_client.get_top_companies_by_revenue(year, limit)
 
 
-@st.cache_data(ttl=3600)
 def _get_cached_exchange_rates():
-    """환율 정보 캐싱 (1시간)"""
+    """환율 요약 (클라이언트가 메모리 캐시 + 백그라운드 갱신으로 제공)"""
     from tools.exchange_rate_client import get_exchange_client
 
     try:
@@ -172,8 +194,14 @@ def render():
         unsafe_allow_html=True,
     )
 
+    # 미리 계산된 대시보드 스냅샷이 있으면 DB/API 호출 없이 렌더링
+    snapshot = _get_dashboard_snapshot()
+
     # 데이터베이스 연결 상태
-    if SUPABASE_AVAILABLE:
+    if snapshot:
+        companies_df = pd.DataFrame(snapshot["companies_sample"])
+        company_count = snapshot["company_count"]
+    elif SUPABASE_AVAILABLE:
         try:
             # Cached Call
             companies_df = _get_cached_companies(SupabaseClient)
@@ -229,11 +257,13 @@ def render():
         st.metric(label="📈 등록된 기업", value=f"{company_count}개")
 
     with col2:
-        report_count = 0
-        if SUPABASE_AVAILABLE and company_count > 0:
+        report_count = snapshot["report_count"] if snapshot else 0
+        if not snapshot and SUPABASE_AVAILABLE and company_count > 0:
             try:
-                # Cached Call
-                annual_df = _get_cached_annual_reports(SupabaseClient)
+                # 비율 패널은 연간 재무 레코드와 1:1
+                annual_df = _get_ratio_panel()
+                if annual_df.empty:
+                    annual_df = _get_cached_annual_reports(SupabaseClient)
                 report_count = len(annual_df)
             except:
                 pass
@@ -241,9 +271,12 @@ def render():
 
     with col3:
         # 동적 데이터 기간
-        data_period = (
-            _get_data_period(SupabaseClient) if SUPABASE_AVAILABLE else "2020-2024"
-        )
+        if snapshot and snapshot.get("data_period"):
+            data_period = snapshot["data_period"]
+        else:
+            data_period = (
+                _get_data_period(SupabaseClient) if SUPABASE_AVAILABLE else "2020-2024"
+            )
         st.metric(label="📅 데이터 기간", value=data_period)
 
     with col4:
@@ -256,7 +289,7 @@ def render():
 
     if EXCHANGE_AVAILABLE:
         try:
-            # Cached Call
+            # 환율 클라이언트가 메모리에서 최신 값 제공 (스냅샷에는 환율 미포함)
             summary = _get_cached_exchange_rates()
             display_rates = summary.get("display_rates", {})
             update_time = summary.get("update_time", "N/A")
@@ -286,7 +319,13 @@ def render():
     if "home_active_tab" not in st.session_state:
         st.session_state.home_active_tab = "📊 매출 상위 기업"
 
-    tab_options = ["🏆 매출 상위 기업", "🔍 기업 검색", "💾 DB 현황", "💡 빠른 시작"]
+    tab_options = [
+        "🏆 매출 상위 기업",
+        "🎯 스크리너",
+        "🔍 기업 검색",
+        "💾 DB 현황",
+        "💡 빠른 시작",
+    ]
     selected_tab = st.radio(
         "메뉴 선택",
         tab_options,
@@ -304,7 +343,10 @@ def render():
     )
 
     if selected_tab == "🏆 매출 상위 기업":
-        _render_top_companies_tab(SUPABASE_AVAILABLE, company_count)
+        _render_top_companies_tab(SUPABASE_AVAILABLE, company_count, snapshot)
+
+    elif selected_tab == "🎯 스크리너":
+        _render_screener_tab()
 
     elif selected_tab == "🔍 기업 검색":
         _render_search_tab(
@@ -312,52 +354,122 @@ def render():
         )
 
     elif selected_tab == "💾 DB 현황":
-        _render_db_status_tab(SUPABASE_AVAILABLE, companies_df, company_count)
+        _render_db_status_tab(
+            SUPABASE_AVAILABLE or bool(snapshot), companies_df, company_count, snapshot
+        )
 
     elif selected_tab == "💡 빠른 시작":
         _render_quick_start_tab()
 
 
-def _render_top_companies_tab(supabase_available: bool, company_count: int):
+def _render_top_companies_tab(
+    supabase_available: bool, company_count: int, snapshot: dict = None
+):
     """매출 상위 기업 탭"""
-    from data.supabase_client import get_top_revenue_companies
-
-    st.markdown("### 📊 2024년 매출 상위 20개 기업")
+    year = (snapshot or {}).get("top_revenue_year") or 2024
+    st.markdown(f"### 📊 {year}년 매출 상위 20개 기업")
 
-    if supabase_available and company_count > 0:
-        try:
-            top_df = get_top_revenue_companies(year=2024, limit=20)
-
-            if not top_df.empty:
-                # 데이터 포맷팅
-                display_df = top_df[
-                    ["ticker", "company_name", "revenue", "net_income", "total_assets"]
-                ].copy()
-                display_df.columns = ["티커", "기업명", "매출", "순이익", "총자산"]
-
-                display_df["매출"] = display_df["매출"].apply(format_number)
-                display_df["순이익"] = display_df["순이익"].apply(format_number)
-                display_df["총자산"] = display_df["총자산"].apply(format_number)
-
-                st.dataframe(display_df, use_container_width=True, hide_index=True)
-
-                # Plotly 바 차트
-                st.markdown("### 📈 매출 비교 차트")
-                chart_df = top_df[["ticker", "revenue"]].dropna().head(10).copy()
-                chart_df["revenue"] = chart_df["revenue"] / 1e9  # 십억 달러 단위
-
-                _render_plotly_bar_chart(
-                    chart_df,
-                    x_col="ticker",
-                    y_col="revenue",
-                    title="매출 상위 10개 기업 (십억 USD)",
-                )
-            else:
-                st.info("2024년 데이터가 아직 없습니다.")
-        except Exception as e:
-            st.error(f"데이터 로드 오류: {e}")
+    if snapshot and snapshot.get("top_revenue"):
+        top_df = pd.DataFrame(snapshot["top_revenue"])
+    elif supabase_available and company_count > 0:
+        top_df = None
     else:
         st.info("Supabase에 연결하여 데이터를 확인하세요.")
+        return
+
+    try:
+        if top_df is None:
+            from data.supabase_client import get_top_revenue_companies
+            from utils.ratio_engine import top_companies
+
+            top_df = top_companies("revenue", year=year, limit=20)
+            if top_df.empty:
+                top_df = get_top_revenue_companies(year=year, limit=20)
+
+        if not top_df.empty:
+            # 데이터 포맷팅
+            display_df = top_df[
+                ["ticker", "company_name", "revenue", "net_income", "total_assets"]
+            ].copy()
+            display_df.columns = ["티커", "기업명", "매출", "순이익", "총자산"]
+
+            display_df["매출"] = display_df["매출"].apply(format_number)
+            display_df["순이익"] = display_df["순이익"].apply(format_number)
+            display_df["총자산"] = display_df["총자산"].apply(format_number)
+
+            st.dataframe(display_df, use_container_width=True, hide_index=True)
+
+            # Plotly 바 차트
+            st.markdown("### 📈 매출 비교 차트")
+            chart_df = top_df[["ticker", "revenue"]].dropna().head(10).copy()
+            chart_df["revenue"] = chart_df["revenue"] / 1e9  # 십억 달러 단위
+
+            _render_plotly_bar_chart(
+                chart_df,
+                x_col="ticker",
+                y_col="revenue",
+                title="매출 상위 10개 기업 (십억 USD)",
+            )
+        else:
+            st.info(f"{year}년 데이터가 아직 없습니다.")
+    except Exception as e:
+        st.error(f"데이터 로드 오류: {e}")
+
+
+def _render_screener_tab():
+    """동종업계 백분위 스크리너 탭"""
+    from utils.screening import get_engine, list_sectors
+
+    st.markdown("### 🎯 동종업계 백분위 스크리너")
+
+    engine = get_engine()
+    if engine is None:
+        st.info("재무비율 데이터가 없습니다. DuckDB 미러 동기화 후 이용하세요.")
+        return
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        year = st.selectbox("회계연도", list(reversed(engine.years)), key="screen_year")
+    with c2:
+        sector = st.selectbox("섹터", ["전체"] + list_sectors(), key="screen_sector")
+    with c3:
+        scope = st.radio(
+            "백분위 기준", ["sector", "industry", "all"], horizontal=True, key="screen_scope"
+        )
+
+    c4, c5, c6 = st.columns(3)
+    with c4:
+        roe_top = st.slider("ROE 상위 (%)", 1, 100, 10, key="screen_roe_top")
+    with c5:
+        max_de = st.number_input("최대 부채비율 (D/E)", 0.0, 20.0, 1.0, 0.1, key="screen_de")
+    with c6:
+        min_growth = st.number_input("최소 매출 성장률 (%)", -100.0, 500.0, 10.0, 1.0, key="screen_growth")
+
+    criteria = [
+        {"metric": "roe", "op": ">=", "value": 1 - roe_top / 100, "percentile": True, "scope": scope},
+        {"metric": "debt_to_equity", "op": "<", "value": max_de},
+        {"metric": "revenue_growth", "op": ">", "value": min_growth / 100},
+    ]
+    try:
+        result = engine.screen(
+            criteria, year=year, sector=None if sector == "전체" else sector, limit=50
+        )
+    except ValueError as e:
+        st.warning(str(e))
+        return
+
+    if result.empty:
+        st.warning("조건을 만족하는 기업이 없습니다.")
+        return
+
+    st.success(f"{len(result)}개 기업이 조건을 만족합니다.")
+    display_df = result.copy()
+    for col in display_df.columns:
+        if col.endswith(("_growth", "roe")) or "_pct_" in col:
+            display_df[col] = display_df[col].map(lambda v: f"{v:.1%}" if pd.notna(v) else "-")
+        elif col == "debt_to_equity":
+            display_df[col] = display_df[col].map(lambda v: f"{v:.2f}" if pd.notna(v) else "-")
+    st.dataframe(display_df, use_container_width=True, hide_index=True)
 
 
 def _render_search_tab(supabase_available: bool, SupabaseClient):
@@ -380,7 +492,9 @@ def _render_search_tab(supabase_available: bool, SupabaseClient):
 
     if search_query and supabase_available and SupabaseClient:
         try:
-            results = SupabaseClient.search_companies(search_query)
+            from utils.company_search import search_companies
+
+            results = search_companies(search_query)
 
             if not results.empty:
                 st.success(f"{len(results)}개 기업 검색됨")
@@ -456,7 +570,10 @@ def _render_search_tab(supabase_available: bool, SupabaseClient):
 
 
 def _render_db_status_tab(
-    supabase_available: bool, companies_df: pd.DataFrame, company_count: int
+    supabase_available: bool,
+    companies_df: pd.DataFrame,
+    company_count: int,
+    snapshot: dict = None,
 ):
     """DB 현황 탭"""
     st.markdown("### 💾 데이터베이스 현황")
@@ -475,7 +592,11 @@ def _render_db_status_tab(
 
         with col2:
             st.markdown("**섹터별 분포**")
-            if (
+            if snapshot and snapshot.get("sector_counts"):
+                # 스냅샷에는 이미 유효 섹터만 집계되어 있음
+                sector_counts = pd.Series(snapshot["sector_counts"])
+                _render_plotly_pie_chart(sector_counts, title="섹터별 기업 분포")
+            elif (
                 "sector" in companies_df.columns
                 and companies_df["sector"].notna().any()
             ):
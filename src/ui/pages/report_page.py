@@ -53,6 +53,21 @@ try:
 except ImportError:
     pass
 
+# PDF용 차트 병렬 렌더링 (프로세스 풀)
+try:
+    from utils import chart_renderer
+
+    MPL_FUNCS["render_charts"] = chart_renderer.render_charts
+    chart_renderer.warm_up()
+except ImportError:
+    pass
+
+# 멀티 티커 주가 일괄 수집 (차트 생성 전 캐시 채우기)
+try:
+    from utils.price_cache import prefetch_chart_data
+except ImportError:
+    prefetch_chart_data = None
+
 # 헬퍼 함수 로드
 try:
     from ui.helpers.chart_helpers import (
@@ -91,6 +106,10 @@ FORM_CSS = """
 def render_charts(tickers: list) -> list:
     """선택된 차트 렌더링 및 PDF용 이미지 수집"""
 
+    # 모든 차트가 공유할 데이터를 1회 일괄 수집 (티커 수와 무관)
+    if prefetch_chart_data and (PLOTLY_AVAILABLE or CHART_UTILS_AVAILABLE):
+        prefetch_chart_data(tickers)
+
     # 헬퍼 함수 사용
     if HELPERS_AVAILABLE:
         if PLOTLY_AVAILABLE:
@@ -315,7 +334,9 @@ def _handle_report_generation(ticker: str):
             create_download_button(report, file_prefix, chart_images, create_pdf)
         else:
             try:
-                pdf_bytes = create_pdf(report, chart_images=chart_images)
+                pdf_bytes = create_pdf(
+                    report, chart_images=chart_images, image_format="png"
+                )
                 st.download_button(
                     label="📥 레포트 다운로드 (PDF)",
                     data=pdf_bytes,
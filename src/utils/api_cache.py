@@ -0,0 +1,257 @@
+"""
+API Cache - 엔드포인트별 TTL 응답 캐시
+- 메모리 LRU + 선택적 디스크 계층 (JSON 파일, 프로세스 재시작/워커 간 공유)
+- 키: (엔드포인트, 정렬된 파라미터) → API 키 등 민감 파라미터는 제외
+- 에러 응답은 저장하지 않음
+- invalidate(symbol=..., endpoint=...)로 명시적 무효화
+"""
+
+import ast
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_MEMORY_ENTRIES = 5000
+# 설정 시 해당 디렉터리에 응답을 JSON으로 저장 (예: data/cache/finnhub)
+API_CACHE_DIR = os.getenv("STOCK_API_CACHE_DIR")
+EXCLUDED_PARAMS = ("token", "apikey")
+
+_MISS = object()
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Finnhub 엔드포인트별 TTL (초). 목록에 없는 엔드포인트는 캐싱하지 않음
+FINNHUB_TTLS = {
+    "quote": 15,
+    "stock/profile2": DAY,
+    "stock/peers": DAY,
+    "stock/recommendation": 6 * HOUR,
+    "stock/price-target": 6 * HOUR,
+    "stock/metric": 6 * HOUR,
+    "stock/financials-reported": DAY,
+    "stock/filings": HOUR,
+    "company-news": 15 * MINUTE,
+    "news": 10 * MINUTE,
+}
+
+# 분기 말 이후 실적 발표까지의 여유 (분기 91일 + 발표 지연)
+EARNINGS_REPORT_LAG_DAYS = 91 + 35
+
+
+def make_key(endpoint: str, params: Optional[Dict] = None) -> Tuple:
+    """캐시 키 (엔드포인트 + 민감 정보 제외 파라미터)"""
+    items = tuple(
+        sorted(
+            (k, str(v)) for k, v in (params or {}).items() if k not in EXCLUDED_PARAMS
+        )
+    )
+    return (endpoint, items)
+
+
+def _earnings_ttl(result: Any) -> float:
+    """실적 데이터는 다음 실적 발표 예상일까지 유지 (발표 시즌에는 6시간)"""
+    periods = []
+    for row in result if isinstance(result, list) else []:
+        try:
+            periods.append(datetime.strptime(str(row.get("period"))[:10], "%Y-%m-%d"))
+        except (AttributeError, ValueError):
+            continue
+    if not periods:
+        return 6 * HOUR
+
+    next_report = max(periods) + timedelta(days=EARNINGS_REPORT_LAG_DAYS)
+    seconds = (next_report - datetime.now()).total_seconds()
+    return min(max(seconds, 6 * HOUR), 7 * DAY)
+
+
+def ttl_for(endpoint: str, result: Any) -> float:
+    """엔드포인트와 응답 내용에 맞는 TTL (0이면 캐싱 안 함)"""
+    if endpoint == "stock/earnings":
+        return _earnings_ttl(result)
+    return FINNHUB_TTLS.get(endpoint, 0)
+
+
+class ResponseCache:
+    """메모리(LRU) + 디스크 2계층 TTL 캐시"""
+
+    def __init__(
+        self,
+        name: str,
+        disk_dir: Optional[str] = None,
+        max_entries: int = MAX_MEMORY_ENTRIES,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self.disk_dir = Path(disk_dir) / name if disk_dir else None
+        if self.disk_dir:
+            try:
+                self.disk_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"API cache dir unavailable ({self.disk_dir}): {e}")
+                self.disk_dir = None
+
+    def _disk_path(self, key: Tuple) -> Path:
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return self.disk_dir / f"{digest}.json"
+
+    def get(self, key: Tuple, default: Any = None) -> Any:
+        """유효한 캐시 값 (없거나 만료되면 default)"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._memory[key]
+
+        value = self._disk_get(key, now)
+        with self._lock:
+            if value is _MISS:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return value
+
+    def _disk_get(self, key: Tuple, now: float) -> Any:
+        if not self.disk_dir:
+            return _MISS
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return _MISS
+        if record.get("expires_at", 0) <= now:
+            return _MISS
+        # 디스크 적중 값은 메모리 계층에도 올려둠
+        self._memory_set(key, record["value"], record["expires_at"])
+        return record["value"]
+
+    def _memory_set(self, key: Tuple, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def set(self, key: Tuple, value: Any, ttl: float) -> None:
+        """ttl초 동안 값 저장 (ttl <= 0이면 저장하지 않음)"""
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl
+        self._memory_set(key, value, expires_at)
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(
+                        {"key": repr(key), "expires_at": expires_at, "value": value},
+                        f,
+                        ensure_ascii=False,
+                    )
+                os.replace(tmp, path)
+            except (OSError, TypeError, ValueError) as e:
+                logger.debug(f"API cache disk write skipped: {e}")
+
+    def invalidate(self, symbol: Optional[str] = None, endpoint: Optional[str] = None) -> int:
+        """
+        조건에 맞는 항목 삭제 (둘 다 None이면 전체)
+
+        Returns:
+            삭제된 메모리 항목 수
+        """
+        symbol = symbol.upper() if symbol else None
+
+        def matches(key: Tuple) -> bool:
+            ep, params = key
+            if endpoint and ep != endpoint:
+                return False
+            if symbol and ("symbol", symbol) not in params:
+                return False
+            return True
+
+        with self._lock:
+            keys = [k for k in self._memory if matches(k)]
+            for k in keys:
+                del self._memory[k]
+
+        if self.disk_dir:
+            if symbol is None and endpoint is None:
+                targets = self.disk_dir.glob("*.json")
+            else:
+                targets = [self._disk_path(k) for k in keys]
+                targets += self._scan_disk(matches)
+            for path in set(targets):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+        return len(keys)
+
+    def _scan_disk(self, matches) -> list:
+        """메모리에 없는 디스크 항목 중 조건에 맞는 파일"""
+        found = []
+        for path in self.disk_dir.glob("*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    key = json.load(f).get("key", "")
+                ep, params = _parse_key(key)
+            except (OSError, ValueError, SyntaxError):
+                continue
+            if matches((ep, params)):
+                found.append(path)
+        return found
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        self.invalidate()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "name": self.name,
+                "entries": len(self._memory),
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk": str(self.disk_dir) if self.disk_dir else None,
+            }
+
+
+def _parse_key(text: str) -> Tuple:
+    """디스크에 저장된 repr(key) 문자열을 키 튜플로 복원"""
+    key = ast.literal_eval(text)
+    return key[0], tuple(tuple(item) for item in key[1])
+
+
+_caches: Dict[str, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(name: str = "finnhub") -> ResponseCache:
+    """이름별 프로세스 공유 응답 캐시 (동기/비동기 클라이언트 공용)"""
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            cache = ResponseCache(name, disk_dir=API_CACHE_DIR)
+            _caches[name] = cache
+        return cache
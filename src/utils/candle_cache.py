@@ -0,0 +1,252 @@
+"""
+Candle Cache - (심볼, 해상도)별 증분 캔들 시계열 캐시
+- 이미 받은 구간(coverage)을 기억하고, 요청 구간 중 앞/뒤 빠진 부분만 가져와 병합
+- 진행 중인 마지막 봉은 확정되지 않았으므로 coverage에서 제외 → 짧은 TTL 후 꼬리만 재조회
+- 요청한 from/to 구간을 그대로 잘라서 반환 (Finnhub stock/candle 형식)
+- 봉 데이터는 array 모듈의 고정 크기 배열로 보관 (dict/list 대비 메모리 절약)
+- src/data의 동기/비동기 stock_api_client가 같은 캐시를 공유
+"""
+
+import logging
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_SERIES = 500  # (심볼, 해상도) 조합 수 (초과 시 오래 안 쓴 것부터 제거)
+MAX_BARS_PER_SERIES = 100_000
+LIVE_TAIL_TTL_SECONDS = 60  # 확정되지 않은 최근 구간 재조회 간격
+
+# 해상도별 봉 길이 (초)
+RESOLUTION_SECONDS = {
+    "1": 60,
+    "5": 5 * 60,
+    "15": 15 * 60,
+    "30": 30 * 60,
+    "60": 60 * 60,
+    "D": 24 * 60 * 60,
+    "W": 7 * 24 * 60 * 60,
+    "M": 31 * 24 * 60 * 60,
+}
+
+PRICE_FIELDS = ("o", "h", "l", "c", "v")
+
+Range = Tuple[int, int]
+Fetcher = Callable[[int, int], Dict]
+
+
+class _Series:
+    """한 (심볼, 해상도)의 정렬된 봉 배열과 수신 완료 구간"""
+
+    __slots__ = ("t", "o", "h", "l", "c", "v", "covered", "live_fetched_at")
+
+    def __init__(self):
+        self.t = array("q")
+        self.o = array("d")
+        self.h = array("d")
+        self.l = array("d")
+        self.c = array("d")
+        self.v = array("d")
+        self.covered: Optional[Range] = None
+        self.live_fetched_at = 0.0  # 현재 시점까지 조회한 마지막 시각
+
+    def merge(self, candles: Dict) -> None:
+        """새 봉 병합 (같은 시각이면 새 값으로 교체)"""
+        bars = {
+            ts: row
+            for ts, *row in zip(self.t, self.o, self.h, self.l, self.c, self.v)
+        }
+        for i, ts in enumerate(candles.get("t") or []):
+            try:
+                bars[int(ts)] = [float(candles[f][i] or 0) for f in PRICE_FIELDS]
+            except (IndexError, KeyError, TypeError, ValueError):
+                continue
+
+        ordered = sorted(bars.items())[-MAX_BARS_PER_SERIES:]
+        self.t = array("q", (ts for ts, _ in ordered))
+        for j, field in enumerate(PRICE_FIELDS):
+            setattr(self, field, array("d", (row[j] for _, row in ordered)))
+
+    def slice(self, start: int, end: int) -> Dict:
+        lo = bisect_left(self.t, start)
+        hi = bisect_right(self.t, end)
+        result = {"t": self.t[lo:hi].tolist()}
+        for field in PRICE_FIELDS:
+            result[field] = getattr(self, field)[lo:hi].tolist()
+        return result
+
+
+class CandleCache:
+    """(심볼, 해상도)별 증분 캔들 캐시"""
+
+    def __init__(self, max_series: int = MAX_SERIES):
+        self.max_series = max_series
+        self._series: "OrderedDict[Tuple[str, str], _Series]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.fetches = 0
+        self.hits = 0
+
+    def _get_series(self, key: Tuple[str, str]) -> _Series:
+        series = self._series.get(key)
+        if series is None:
+            series = _Series()
+            self._series[key] = series
+            while len(self._series) > self.max_series:
+                self._series.popitem(last=False)
+        self._series.move_to_end(key)
+        return series
+
+    def missing_ranges(
+        self, symbol: str, resolution: str, start: int, end: int
+    ) -> List[Range]:
+        """요청 구간 중 아직 받지 않은 앞/뒤 구간 (coverage가 끊기지 않도록 사이 구간 포함)"""
+        with self._lock:
+            series = self._series.get((symbol.upper(), resolution))
+            covered = series.covered if series else None
+            live_fetched_at = series.live_fetched_at if series else 0.0
+        if covered is None:
+            return [(start, end)]
+
+        lo, hi = covered
+        ranges = []
+        if start < lo:
+            ranges.append((start, lo))
+        if end > hi:
+            # 방금 현재 시점까지 받았다면 미확정 구간은 TTL 동안 캐시 값 사용
+            now = time.time()
+            fresh = now - live_fetched_at < LIVE_TAIL_TTL_SECONDS
+            if not (fresh and end <= live_fetched_at + LIVE_TAIL_TTL_SECONDS):
+                ranges.append((hi, end))
+        return ranges
+
+    def merge(
+        self,
+        symbol: str,
+        resolution: str,
+        start: int,
+        end: int,
+        candles: Dict,
+        fetched_at: Optional[float] = None,
+    ) -> None:
+        """
+        [start, end] 구간 조회 결과 저장
+
+        아직 끝나지 않은 봉이 포함될 수 있는 최근 구간(봉 길이 1개)은 coverage에서 제외합니다.
+        """
+        fetched_at = fetched_at or time.time()
+        bar_seconds = RESOLUTION_SECONDS.get(resolution, RESOLUTION_SECONDS["D"])
+        settled_end = min(end, int(fetched_at) - bar_seconds)
+
+        with self._lock:
+            series = self._get_series((symbol.upper(), resolution))
+            if candles.get("t"):
+                series.merge(candles)
+            if settled_end < end:
+                series.live_fetched_at = fetched_at
+            if settled_end < start:
+                return
+            if series.covered is None:
+                series.covered = (start, settled_end)
+            else:
+                lo, hi = series.covered
+                # 빠진 구간만 가져오므로 새 구간은 항상 기존 coverage와 맞닿음
+                if start <= hi and settled_end >= lo:
+                    series.covered = (min(lo, start), max(hi, settled_end))
+                else:
+                    series.covered = (start, settled_end)
+
+    def read(self, symbol: str, resolution: str, start: int, end: int) -> Dict:
+        """캐시에서 [start, end] 구간을 Finnhub 형식으로 반환"""
+        with self._lock:
+            series = self._series.get((symbol.upper(), resolution))
+            data = series.slice(start, end) if series else None
+        if not data or not data["t"]:
+            return {"s": "no_data"}
+        return {"s": "ok", **data}
+
+    def get(
+        self, symbol: str, resolution: str, start: int, end: int, fetch: Fetcher
+    ) -> Dict:
+        """
+        빠진 구간만 fetch(from_ts, to_ts)로 가져와 병합한 뒤 요청 구간 반환
+
+        Args:
+            fetch: Finnhub stock/candle 형식 dict를 반환하는 조회 함수
+                   (실패 시 "error" 키 포함 → coverage에 반영하지 않음)
+        """
+        error = None
+        for lo, hi in self._plan(symbol, resolution, start, end):
+            fetched_at = time.time()
+            error = self._store(symbol, resolution, lo, hi, fetch(lo, hi), fetched_at) or error
+        return self._result(symbol, resolution, start, end, error)
+
+    async def aget(
+        self, symbol: str, resolution: str, start: int, end: int, fetch
+    ) -> Dict:
+        """get()의 비동기 버전 (fetch는 코루틴 함수, 빠진 구간은 동시에 조회)"""
+        import asyncio
+
+        ranges = self._plan(symbol, resolution, start, end)
+        fetched_at = time.time()
+        results = await asyncio.gather(*(fetch(lo, hi) for lo, hi in ranges))
+        error = None
+        for (lo, hi), result in zip(ranges, results):
+            error = self._store(symbol, resolution, lo, hi, result, fetched_at) or error
+        return self._result(symbol, resolution, start, end, error)
+
+    def _plan(self, symbol: str, resolution: str, start: int, end: int) -> List[Range]:
+        ranges = self.missing_ranges(symbol, resolution, start, end)
+        with self._lock:
+            if ranges:
+                self.fetches += len(ranges)
+            else:
+                self.hits += 1
+        return ranges
+
+    def _store(self, symbol, resolution, lo, hi, result, fetched_at) -> Optional[Dict]:
+        """조회 결과 병합, 실패면 에러 dict 반환 (coverage에 반영하지 않음)"""
+        if not isinstance(result, dict) or "error" in result:
+            return result if isinstance(result, dict) else {"error": str(result)}
+        self.merge(symbol, resolution, lo, hi, result, fetched_at)
+        return None
+
+    def _result(self, symbol, resolution, start, end, error: Optional[Dict]) -> Dict:
+        data = self.read(symbol, resolution, start, end)
+        if data["s"] != "ok" and error is not None:
+            return error
+        return data
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """심볼 캐시 삭제 (미지정 시 전체)"""
+        with self._lock:
+            if symbol is None:
+                self._series.clear()
+                return
+            for key in [k for k in self._series if k[0] == symbol.upper()]:
+                del self._series[key]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "series": len(self._series),
+                "bars": sum(len(s.t) for s in self._series.values()),
+                "fetches": self.fetches,
+                "hits": self.hits,
+            }
+
+
+_cache: Optional[CandleCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_candle_cache() -> CandleCache:
+    """프로세스 공유 캔들 캐시"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = CandleCache()
+        return _cache
@@ -0,0 +1,278 @@
+"""
+Chart Renderer - 리포트 차트 병렬 렌더링 서비스
+- matplotlib은 CPU 바운드 + GIL 점유 → 프로세스 풀에서 병렬 렌더링
+- 워커 프로세스는 시작 시 폰트/스타일을 미리 로드 (warm pool)
+- PNG bytes를 (차트 타입, 티커, 데이터 지문, dpi) 키로 캐싱
+- 화면 미리보기용 저해상도 preset 지원
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    from utils import chart_utils
+    from utils.price_cache import (
+        fetch_stock_histories,
+        fetch_quarterly_financials_many,
+        prefetch_chart_data,
+        data_fingerprint,
+    )
+except ImportError:
+    from src.utils import chart_utils
+    from src.utils.price_cache import (
+        fetch_stock_histories,
+        fetch_quarterly_financials_many,
+        prefetch_chart_data,
+        data_fingerprint,
+    )
+
+logger = logging.getLogger(__name__)
+
+# 리포트 차트 순서 및 기본 조회 기간 (일)
+REPORT_CHART_TYPES = ("line", "candlestick", "volume", "financial")
+COMPARISON_CHART_TYPES = ("line", "volume", "financial")
+CHART_DAYS = {"line": 180, "candlestick": 60, "volume": 60}
+
+# 해상도 preset (None = 차트별 기본 인쇄 해상도)
+DPI_PRESETS = {
+    "print": None,
+    "preview": chart_utils.PREVIEW_DPI,
+}
+
+RENDER_WORKERS = int(os.getenv("CHART_RENDER_WORKERS", min(4, os.cpu_count() or 1)))
+MAX_CACHED_CHARTS = 64
+
+_RENDERERS = {
+    "line": chart_utils.render_line_chart,
+    "candlestick": chart_utils.render_candlestick_chart,
+    "volume": chart_utils.render_volume_chart,
+}
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+_png_cache: "OrderedDict[Tuple, bytes]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+# ============================================================
+# 워커 프로세스 (warm pool)
+# ============================================================
+
+
+def _warm_worker():
+    """워커 시작 시 matplotlib 백엔드/한글 폰트/스타일 미리 로드"""
+    try:
+        plt = chart_utils._setup_matplotlib()
+        from matplotlib import font_manager
+
+        # 폰트 캐시를 미리 만들어 첫 렌더링 지연 제거
+        font_manager.findfont(plt.rcParams["font.family"][0])
+    except Exception:
+        pass
+
+
+def _noop() -> bool:
+    return True
+
+
+def _render_task(
+    chart_type: str, tickers: List[str], data: Dict, days: int, dpi: Optional[int]
+) -> Optional[bytes]:
+    """워커에서 실행되는 단일 차트 렌더링 (데이터는 부모 프로세스가 전달)"""
+    if chart_type == "financial":
+        return chart_utils.render_financial_chart(tickers, data, dpi)
+    return _RENDERERS[chart_type](tickers, data, days, dpi)
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool
+    with _pool_lock:
+        if _pool is None and RENDER_WORKERS > 1:
+            try:
+                _pool = ProcessPoolExecutor(
+                    max_workers=RENDER_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_worker,
+                )
+            except Exception as e:
+                logger.warning(f"Chart render pool unavailable, rendering inline: {e}")
+                return None
+        return _pool
+
+
+def _reset_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def warm_up() -> None:
+    """워커 프로세스를 미리 띄워둠 (결과를 기다리지 않음)"""
+    pool = _get_pool()
+    if pool is None:
+        return
+    try:
+        for _ in range(RENDER_WORKERS):
+            pool.submit(_noop)
+    except Exception as e:
+        logger.warning(f"Chart render pool warm-up failed: {e}")
+
+
+def shutdown() -> None:
+    """프로세스 풀 종료"""
+    _reset_pool()
+
+
+# ============================================================
+# PNG 캐시
+# ============================================================
+
+
+def _cache_get(key: Tuple) -> Optional[bytes]:
+    with _cache_lock:
+        png = _png_cache.get(key)
+        if png is not None:
+            _png_cache.move_to_end(key)
+        return png
+
+
+def _cache_put(key: Tuple, png: bytes) -> None:
+    with _cache_lock:
+        _png_cache[key] = png
+        _png_cache.move_to_end(key)
+        while len(_png_cache) > MAX_CACHED_CHARTS:
+            _png_cache.popitem(last=False)
+
+
+def clear_cache() -> None:
+    """렌더링 결과 캐시 초기화"""
+    with _cache_lock:
+        _png_cache.clear()
+
+
+# ============================================================
+# PUBLIC API
+# ============================================================
+
+
+def _build_task(chart_type: str, tickers: List[str], dpi: Optional[int]) -> Tuple:
+    """차트 타입별 데이터 조회 (price_cache) 후 (캐시 키, 렌더링 인자) 생성"""
+    if chart_type == "financial":
+        days = 0
+        data = fetch_quarterly_financials_many(tickers)
+    else:
+        days = CHART_DAYS[chart_type]
+        data = fetch_stock_histories(tickers, days)
+
+    key = (chart_type, tuple(tickers), data_fingerprint(data), dpi)
+    return key, (chart_type, tickers, data, days, dpi)
+
+
+def render_charts(
+    tickers: List[str],
+    chart_types: Sequence[str] = REPORT_CHART_TYPES,
+    preset: str = "print",
+) -> List[Optional[BytesIO]]:
+    """
+    여러 차트를 프로세스 풀에서 병렬 렌더링
+
+    Args:
+        tickers: 티커 목록 (단일 문자열 허용)
+        chart_types: 렌더링할 차트 타입 ("line", "candlestick", "volume", "financial")
+        preset: 해상도 preset ("print" = PDF용 기본 해상도, "preview" = 화면용)
+
+    Returns:
+        chart_types 순서와 같은 BytesIO 목록 (실패한 차트는 None)
+    """
+    if isinstance(tickers, str):
+        tickers = [tickers]
+    tickers = list(tickers)
+    dpi = DPI_PRESETS.get(preset)
+
+    # 데이터는 부모 프로세스에서 1회 일괄 수집 (price_cache 공유)
+    prefetch_chart_data(tickers, include_financials="financial" in chart_types)
+
+    keys: List[Optional[Tuple]] = []
+    results: Dict[int, Optional[bytes]] = {}
+    pending: Dict[int, Tuple] = {}
+
+    for i, chart_type in enumerate(chart_types):
+        try:
+            key, args = _build_task(chart_type, tickers, dpi)
+        except Exception as e:
+            logger.warning(f"{chart_type} chart data failed: {e}")
+            keys.append(None)
+            results[i] = None
+            continue
+        keys.append(key)
+        png = _cache_get(key)
+        if png is not None:
+            results[i] = png
+        else:
+            pending[i] = args
+
+    if pending:
+        results.update(_render_pending(pending))
+        for i in pending:
+            # 실패(None)는 캐시하지 않음 -> 다음 요청에서 다시 렌더링
+            if results.get(i) is not None:
+                _cache_put(keys[i], results[i])
+
+    return [
+        BytesIO(results[i]) if results.get(i) else None
+        for i in range(len(chart_types))
+    ]
+
+
+def _render_pending(pending: Dict[int, Tuple]) -> Dict[int, Optional[bytes]]:
+    """캐시 미스 차트 렌더링 (풀 사용 불가 시 현재 프로세스에서 순차 렌더링)"""
+    pool = _get_pool() if len(pending) > 1 else None
+    results: Dict[int, Optional[bytes]] = {}
+
+    if pool is not None:
+        try:
+            futures = {i: pool.submit(_render_task, *args) for i, args in pending.items()}
+            for i, future in futures.items():
+                try:
+                    results[i] = future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    logger.warning(f"{pending[i][0]} chart render failed: {e}")
+                    results[i] = None
+            return results
+        except (BrokenProcessPool, RuntimeError) as e:
+            logger.warning(f"Chart render pool broken, rendering inline: {e}")
+            _reset_pool()
+            results = {}
+
+    for i, args in pending.items():
+        try:
+            results[i] = _render_task(*args)
+        except Exception as e:
+            logger.warning(f"{args[0]} chart render failed: {e}")
+            results[i] = None
+    return results
+
+
+def render_report_charts(tickers: List[str], preset: str = "print") -> List[BytesIO]:
+    """
+    리포트용 차트 일괄 생성 (단일: 4종, 비교: 라인/거래량/재무 3종)
+
+    Returns:
+        생성에 성공한 차트 이미지 BytesIO 목록
+    """
+    if isinstance(tickers, str):
+        tickers = [tickers]
+    chart_types = COMPARISON_CHART_TYPES if len(tickers) > 1 else REPORT_CHART_TYPES
+    return [buf for buf in render_charts(tickers, chart_types, preset) if buf]
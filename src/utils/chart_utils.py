@@ -8,9 +8,7 @@ Chart Utilities - 최적화된 차트 생성 모듈
 
 import logging
 from io import BytesIO
-from datetime import datetime, timedelta
-from typing import Optional, List, Tuple
-from functools import lru_cache
+from typing import Dict, Optional, List
 
 # 스타일 설정
 import matplotlib.style as mpl_style
@@ -20,6 +18,19 @@ try:
 except Exception:
     pass
 
+try:
+    from utils.price_cache import (
+        fetch_stock_histories,
+        fetch_quarterly_financials_many,
+        clear_cache as _clear_price_cache,
+    )
+except ImportError:
+    from src.utils.price_cache import (
+        fetch_stock_histories,
+        fetch_quarterly_financials_many,
+        clear_cache as _clear_price_cache,
+    )
+
 logger = logging.getLogger(__name__)
 
 # 색상 팔레트 (Professional)
@@ -29,81 +40,15 @@ DOWN_COLOR = "#FF333A"  # Bright Red (Falling)
 GRID_COLOR = "#E0E0E0"
 
 # ============================================================
-# 🔧 DATA FETCHING LAYER (캐싱 적용)
+# 🔧 DATA FETCHING LAYER (price_cache 공유 캐시)
 # ============================================================
-
-
-@lru_cache(maxsize=50)
-def _fetch_stock_history(ticker: str, days: int) -> Optional[Tuple]:
-    """주가 데이터 캐싱"""
-    try:
-        import yfinance as yf
-
-        end_d = datetime.now()
-        start_d = end_d - timedelta(days=days)
-        stock = yf.Ticker(ticker)
-        df = stock.history(start=start_d, end=end_d)
-        if df.empty:
-            return None
-        return (
-            tuple(df.index.tolist()),
-            tuple(df["Open"].tolist()),
-            tuple(df["High"].tolist()),
-            tuple(df["Low"].tolist()),
-            tuple(df["Close"].tolist()),
-            tuple(df["Volume"].tolist()),
-        )
-    except Exception as e:
-        logger.warning(f"Stock data fetch failed for {ticker}: {e}")
-        return None
-
-
-@lru_cache(maxsize=20)
-def _fetch_quarterly_financials(ticker: str) -> Optional[Tuple]:
-    """분기별 재무 데이터 캐싱"""
-    try:
-        import yfinance as yf
-
-        stock = yf.Ticker(ticker)
-        quarterly = stock.quarterly_financials
-        if quarterly.empty:
-            return None
-
-        revenue_row = net_income_row = None
-        for idx in quarterly.index:
-            idx_lower = str(idx).lower()
-            if "revenue" in idx_lower or "total revenue" in idx_lower:
-                revenue_row = idx
-            if "net income" in idx_lower:
-                net_income_row = idx
-
-        if revenue_row is None:
-            return None
-
-        quarters = quarterly.columns[:8][::-1]
-        revenue = quarterly.loc[revenue_row, quarters].values / 1e9
-        net_income = (
-            quarterly.loc[net_income_row, quarters].values / 1e9
-            if net_income_row
-            else None
-        )
-        quarter_labels = tuple(
-            q.strftime("%Y Q").replace("Q", f"Q{(q.month-1)//3+1}") for q in quarters
-        )
-        return (
-            quarter_labels,
-            tuple(revenue),
-            tuple(net_income) if net_income is not None else None,
-        )
-    except Exception as e:
-        logger.warning(f"Financial data fetch failed for {ticker}: {e}")
-        return None
+# 주가/재무 데이터 수집은 utils.price_cache에서 일괄 처리합니다.
+# (멀티 티커 1회 다운로드 + 기간별 슬라이싱, plotly_charts와 캐시 공유)
 
 
 def clear_cache():
     """모든 캐시 초기화"""
-    _fetch_stock_history.cache_clear()
-    _fetch_quarterly_financials.cache_clear()
+    _clear_price_cache()
 
 
 # ============================================================
@@ -111,16 +56,33 @@ def clear_cache():
 # ============================================================
 
 
+# 차트별 기본 해상도 (PDF 인쇄용)
+DEFAULT_DPI = {
+    "line": 150,
+    "candlestick": 150,
+    "volume": 300,
+    "financial": 300,
+}
+PREVIEW_DPI = 96  # 화면 미리보기용 저해상도
+
+_MPL_READY = False
+
+
 def _setup_matplotlib():
-    """matplotlib 백엔드 및 한글 폰트 설정"""
+    """matplotlib 백엔드 및 한글 폰트 설정 (프로세스당 1회)"""
+    global _MPL_READY
+
     import matplotlib
 
-    matplotlib.use("Agg")
+    if not _MPL_READY:
+        matplotlib.use("Agg")
     import matplotlib.pyplot as plt
 
+    if _MPL_READY:
+        return plt
+
     # 한글 폰트 설정 시도
     try:
-        from matplotlib import font_manager
         import platform
 
         if platform.system() == "Windows":
@@ -134,285 +96,321 @@ def _setup_matplotlib():
     except Exception:
         pass  # 폰트 없으면 기본 사용
 
+    _MPL_READY = True
     return plt
 
 
-def generate_line_chart(tickers: List[str], days: int = 180) -> Optional[BytesIO]:
-    """Stock Price Line Chart (Improved Layout)"""
+def _to_png(plt, fig, dpi: int, tight_bbox: bool) -> bytes:
+    """Figure -> PNG bytes (figure는 항상 닫음)"""
     try:
-        if isinstance(tickers, str):
-            tickers = [tickers]
-
-        plt = _setup_matplotlib()
-        fig, ax = plt.subplots(figsize=(10, 5))
-
-        has_data = False
-        for i, ticker in enumerate(tickers):
-            data = _fetch_stock_history(ticker, days)
-            if data:
-                dates, _, _, _, closes, _ = data
-                color = COLORS[i % len(COLORS)]
-                # Add Shadow/Glow effect by plotting lines twice if possible, or just thicker line
-                ax.plot(
-                    dates,
-                    closes,
-                    label=f"{ticker}",
-                    linewidth=2,
-                    color=color,
-                    alpha=0.9,
-                )
-                ax.fill_between(
-                    dates, closes, min(closes), color=color, alpha=0.1
-                )  # Area under curve
-                has_data = True
-
-        if not has_data:
-            plt.close(fig)
-            return None
-
-        title = (
-            f"주가 추이 ({', '.join(tickers)})"
-            if len(tickers) > 1
-            else f"{tickers[0]} 주가 추이 (최근 {days}일)"
-        )
-        ax.set_title(title, fontsize=16, fontweight="bold", pad=20)
-        ax.set_ylabel("가격 (USD)", fontsize=12)
-        ax.legend(loc="upper left", frameon=True, fontsize=10)
-        ax.grid(True, color=GRID_COLOR, linestyle="-", linewidth=0.5)
+        buf = BytesIO()
+        if tight_bbox:
+            fig.savefig(
+                buf, format="png", dpi=dpi, bbox_inches="tight", facecolor="white"
+            )
+        else:
+            fig.savefig(buf, format="png", dpi=dpi, facecolor="white")
+        return buf.getvalue()
+    finally:
+        plt.close(fig)
 
-        # Remove top and right spines
-        ax.spines["top"].set_visible(False)
-        ax.spines["right"].set_visible(False)
 
-        fig.autofmt_xdate()
-        plt.tight_layout()
+def render_line_chart(
+    tickers: List[str], histories: Dict, days: int = 180, dpi: int = None
+) -> Optional[bytes]:
+    """Stock Price Line Chart 렌더링 (데이터 -> PNG bytes)"""
+    plt = _setup_matplotlib()
+    fig, ax = plt.subplots(figsize=(10, 5))
 
-        buf = BytesIO()
-        fig.savefig(buf, format="png", dpi=150, bbox_inches="tight", facecolor="white")
-        buf.seek(0)
+    has_data = False
+    for i, ticker in enumerate(tickers):
+        data = histories.get(ticker.upper())
+        if data:
+            dates, _, _, _, closes, _ = data
+            color = COLORS[i % len(COLORS)]
+            # Add Shadow/Glow effect by plotting lines twice if possible, or just thicker line
+            ax.plot(
+                dates,
+                closes,
+                label=f"{ticker}",
+                linewidth=2,
+                color=color,
+                alpha=0.9,
+            )
+            ax.fill_between(
+                dates, closes, min(closes), color=color, alpha=0.1
+            )  # Area under curve
+            has_data = True
+
+    if not has_data:
         plt.close(fig)
-        return buf
-    except Exception as e:
-        logger.warning(f"Line chart failed: {e}")
         return None
 
+    title = (
+        f"주가 추이 ({', '.join(tickers)})"
+        if len(tickers) > 1
+        else f"{tickers[0]} 주가 추이 (최근 {days}일)"
+    )
+    ax.set_title(title, fontsize=16, fontweight="bold", pad=20)
+    ax.set_ylabel("가격 (USD)", fontsize=12)
+    ax.legend(loc="upper left", frameon=True, fontsize=10)
+    ax.grid(True, color=GRID_COLOR, linestyle="-", linewidth=0.5)
+
+    # Remove top and right spines
+    ax.spines["top"].set_visible(False)
+    ax.spines["right"].set_visible(False)
+
+    fig.autofmt_xdate()
+    plt.tight_layout()
+
+    return _to_png(plt, fig, dpi or DEFAULT_DPI["line"], tight_bbox=True)
+
+
+def render_candlestick_chart(
+    tickers: List[str], histories: Dict, days: int = 60, dpi: int = None
+) -> Optional[bytes]:
+    """Candlestick Chart 렌더링 (데이터 -> PNG bytes)"""
+    plt = _setup_matplotlib()
+    from matplotlib.patches import Rectangle
+
+    n_tickers = len(tickers)
+    # Dynamic height based on number of tickers
+    fig, axes = plt.subplots(n_tickers, 1, figsize=(12, 6 * n_tickers), squeeze=False)
+    has_any_data = False
+
+    for idx, ticker in enumerate(tickers):
+        ax = axes[idx, 0]
+        data = histories.get(ticker.upper())
+
+        if not data:
+            continue
+
+        has_any_data = True
+        dates, opens, highs, lows, closes, volumes = data
+
+        # Draw Candles
+        width = 0.6
+
+        for i in range(len(dates)):
+            open_p, high, low, close = opens[i], highs[i], lows[i], closes[i]
+            color = UP_COLOR if close >= open_p else DOWN_COLOR
+
+            # High-Low Line
+            ax.plot([i, i], [low, high], color=color, linewidth=1)
+
+            # Open-Close Body
+            body_bottom = min(open_p, close)
+            body_height = abs(close - open_p)
+            if body_height == 0:
+                body_height = 0.01
+
+            rect = Rectangle(
+                (i - width / 2, body_bottom),
+                width,
+                body_height,
+                facecolor=color,
+                edgecolor=color,
+            )
+            ax.add_patch(rect)
+
+        # Settings
+        ax.set_title(
+            f"{ticker} 캔들스틱 (최근 {days}일)",
+            fontsize=14,
+            fontweight="bold",
+            pad=10,
+        )
+        ax.set_ylabel("주가 (USD)")
+        ax.grid(True, color=GRID_COLOR, linestyle="--", linewidth=0.5)
+        ax.set_xlim(-1, len(dates))
 
-def generate_candlestick_chart(tickers: List[str], days: int = 60) -> Optional[BytesIO]:
-    """Candlestick Chart (Improved Layout)"""
-    try:
-        if isinstance(tickers, str):
-            tickers = [tickers]
+        # X-axis formatting
+        step = max(1, len(dates) // 8)
+        tick_pos = list(range(0, len(dates), step))
+        ax.set_xticks(tick_pos)
+        ax.set_xticklabels([dates[i].strftime("%m/%d") for i in tick_pos], rotation=0)
 
-        plt = _setup_matplotlib()
-        from matplotlib.patches import Rectangle
+    if not has_any_data:
+        plt.close(fig)
+        return None
 
-        n_tickers = len(tickers)
-        # Dynamic height based on number of tickers
-        fig, axes = plt.subplots(
-            n_tickers, 1, figsize=(12, 6 * n_tickers), squeeze=False
+    plt.tight_layout()
+    return _to_png(plt, fig, dpi or DEFAULT_DPI["candlestick"], tight_bbox=True)
+
+
+def render_volume_chart(
+    tickers: List[str], histories: Dict, days: int = 60, dpi: int = None
+) -> Optional[bytes]:
+    """Trading Volume Chart 렌더링 (comparison: overlay lines)"""
+    plt = _setup_matplotlib()
+    fig, ax = plt.subplots(figsize=(10, 4))  # PDF용 컴팩트 사이즈
+    has_data = False
+
+    for i, ticker in enumerate(tickers):
+        data = histories.get(ticker.upper())
+        if not data:
+            continue
+
+        has_data = True
+        dates, _, _, _, _, volumes = data
+        color = COLORS[i % len(COLORS)]
+
+        # 라인 차트로 비교용 거래량 표시
+        ax.plot(
+            range(len(dates)),
+            [v / 1e6 for v in volumes],
+            label=ticker,
+            linewidth=1.5,
+            color=color,
+            alpha=0.8,
         )
-        has_any_data = False
-
-        for idx, ticker in enumerate(tickers):
-            ax = axes[idx, 0]
-            data = _fetch_stock_history(ticker, days)
-
-            if not data:
-                continue
-
-            has_any_data = True
-            dates, opens, highs, lows, closes, volumes = data
-
-            # Draw Candles
-            width = 0.6
-            width2 = 0.1
-
-            for i in range(len(dates)):
-                open_p, high, low, close = opens[i], highs[i], lows[i], closes[i]
-                color = UP_COLOR if close >= open_p else DOWN_COLOR
-
-                # High-Low Line
-                ax.plot([i, i], [low, high], color=color, linewidth=1)
-
-                # Open-Close Body
-                body_bottom = min(open_p, close)
-                body_height = abs(close - open_p)
-                if body_height == 0:
-                    body_height = 0.01
-
-                rect = Rectangle(
-                    (i - width / 2, body_bottom),
-                    width,
-                    body_height,
-                    facecolor=color,
-                    edgecolor=color,
-                )
-                ax.add_patch(rect)
-
-            # Settings
-            ax.set_title(
-                f"{ticker} 캔들스틱 (최근 {days}일)",
-                fontsize=14,
-                fontweight="bold",
-                pad=10,
-            )
-            ax.set_ylabel("주가 (USD)")
-            ax.grid(True, color=GRID_COLOR, linestyle="--", linewidth=0.5)
-            ax.set_xlim(-1, len(dates))
-
-            # X-axis formatting
-            step = max(1, len(dates) // 8)
-            tick_pos = list(range(0, len(dates), step))
-            ax.set_xticks(tick_pos)
-            ax.set_xticklabels(
-                [dates[i].strftime("%m/%d") for i in tick_pos], rotation=0
-            )
-
-        if not has_any_data:
-            plt.close(fig)
-            return None
 
-        plt.tight_layout()
-        buf = BytesIO()
-        fig.savefig(buf, format="png", dpi=150, bbox_inches="tight", facecolor="white")
-        buf.seek(0)
+    if not has_data:
         plt.close(fig)
-        return buf
-    except Exception as e:
-        logger.warning(f"Candlestick chart failed: {e}")
         return None
 
+    # X축 설정
+    if data:
+        n = len(dates)
+        step = max(1, n // 8)
+        tick_pos = list(range(0, n, step))
+        ax.set_xticks(tick_pos)
+        ax.set_xticklabels(
+            [dates[i].strftime("%m/%d") for i in tick_pos], rotation=45, fontsize=8
+        )
 
-def generate_volume_chart(tickers: List[str], days: int = 60) -> Optional[BytesIO]:
-    """Trading Volume Chart (comparison: overlay lines)"""
-    try:
-        # 단일 티커 문자열이 들어올 경우 리스트로 변환
-        if isinstance(tickers, str):
-            tickers = [tickers]
-
-        plt = _setup_matplotlib()
-        fig, ax = plt.subplots(figsize=(10, 4))  # PDF용 컴팩트 사이즈
-        has_data = False
+    title = (
+        f"거래량 비교 ({', '.join(tickers)})"
+        if len(tickers) > 1
+        else f"{tickers[0]} 거래량"
+    )
+    ax.set_title(title, fontsize=13, fontweight="bold", pad=12)
+    ax.set_ylabel("거래량 (백만)", fontsize=11)
+    ax.legend(loc="upper right", fontsize=10)
+    ax.grid(True, alpha=0.3, linestyle="--")
 
-        for i, ticker in enumerate(tickers):
-            data = _fetch_stock_history(ticker, days)
-            if not data:
-                continue
+    # Title 잘림 방지
+    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
 
-            has_data = True
-            dates, _, _, _, _, volumes = data
-            color = COLORS[i % len(COLORS)]
+    return _to_png(plt, fig, dpi or DEFAULT_DPI["volume"], tight_bbox=False)
 
-            # 라인 차트로 비교용 거래량 표시
-            ax.plot(
-                range(len(dates)),
-                [v / 1e6 for v in volumes],
-                label=ticker,
-                linewidth=1.5,
-                color=color,
-                alpha=0.8,
-            )
 
-        if not has_data:
-            plt.close(fig)
-            return None
+def render_financial_chart(
+    tickers: List[str], financials: Dict, dpi: int = None
+) -> Optional[bytes]:
+    """Quarterly Financial Chart 렌더링 (comparison: grouped bars)"""
+    plt = _setup_matplotlib()
+    import numpy as np
 
-        # X축 설정
+    all_data = {}
+    for ticker in tickers:
+        data = financials.get(ticker.upper())
         if data:
-            n = len(dates)
-            step = max(1, n // 8)
-            tick_pos = list(range(0, n, step))
-            ax.set_xticks(tick_pos)
-            ax.set_xticklabels(
-                [dates[i].strftime("%m/%d") for i in tick_pos], rotation=45, fontsize=8
-            )
+            all_data[ticker] = data
 
-        title = (
-            f"거래량 비교 ({', '.join(tickers)})"
-            if len(tickers) > 1
-            else f"{tickers[0]} 거래량"
-        )
-        ax.set_title(title, fontsize=13, fontweight="bold", pad=12)
-        ax.set_ylabel("거래량 (백만)", fontsize=11)
-        ax.legend(loc="upper right", fontsize=10)
-        ax.grid(True, alpha=0.3, linestyle="--")
+    if not all_data:
+        return None
 
-        # Title 잘림 방지
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+    # 공통 분기 수 결정 (가장 적은 분기 수 사용)
+    min_quarters = min(len(data[0]) for data in all_data.values())
 
-        buf = BytesIO()
-        fig.savefig(buf, format="png", dpi=300, facecolor="white")
-        buf.seek(0)
-        plt.close(fig)
-        return buf
+    # 첫 번째 티커의 분기 레이블 사용 (공통 분기 수만큼)
+    first_ticker = list(all_data.keys())[0]
+    quarter_labels = all_data[first_ticker][0][:min_quarters]
+    n_quarters = len(quarter_labels)
+    n_tickers = len(all_data)
+
+    fig, ax = plt.subplots(figsize=(10, 4))  # PDF용 컴팩트 사이즈
+    x = np.arange(n_quarters)
+    width = 0.8 / n_tickers  # 티커 수에 따라 막대 너비 조정
+
+    for i, (ticker, (_, revenue, _)) in enumerate(all_data.items()):
+        # 분기 수 맞추기
+        revenue_trimmed = revenue[:min_quarters]
+        offset = (i - n_tickers / 2 + 0.5) * width
+        color = COLORS[i % len(COLORS)]
+        ax.bar(x + offset, revenue_trimmed, width, label=ticker, color=color, alpha=0.8)
+
+    ax.set_xticks(x)
+    ax.set_xticklabels(quarter_labels, rotation=45, ha="right", fontsize=9)
+
+    title = (
+        f"분기별 매출 비교 ({', '.join(tickers)})"
+        if n_tickers > 1
+        else f"{first_ticker} 분기별 매출"
+    )
+    ax.set_title(title, fontsize=13, fontweight="bold", pad=12)
+    ax.set_ylabel("매출 (십억 USD)", fontsize=11)
+    ax.legend(loc="upper left", fontsize=10)
+    ax.grid(True, alpha=0.3, axis="y", linestyle="--")
+
+    # Title 잘림 방지
+    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+
+    return _to_png(plt, fig, dpi or DEFAULT_DPI["financial"], tight_bbox=False)
+
+
+# ============================================================
+# 📦 PUBLIC API (데이터 조회 + 렌더링)
+# ============================================================
+
+
+def _as_list(tickers) -> List[str]:
+    # 단일 티커 문자열이 들어올 경우 리스트로 변환
+    return [tickers] if isinstance(tickers, str) else list(tickers)
+
+
+def generate_line_chart(
+    tickers: List[str], days: int = 180, dpi: int = None
+) -> Optional[BytesIO]:
+    """Stock Price Line Chart (Improved Layout)"""
+    try:
+        tickers = _as_list(tickers)
+        png = render_line_chart(tickers, fetch_stock_histories(tickers, days), days, dpi)
+        return BytesIO(png) if png else None
     except Exception as e:
-        logger.warning(f"Volume chart failed: {e}")
+        logger.warning(f"Line chart failed: {e}")
         return None
 
 
-def generate_financial_chart(tickers: List[str]) -> Optional[BytesIO]:
-    """Quarterly Financial Chart (comparison: grouped bars)"""
+def generate_candlestick_chart(
+    tickers: List[str], days: int = 60, dpi: int = None
+) -> Optional[BytesIO]:
+    """Candlestick Chart (Improved Layout)"""
     try:
-        # 단일 티커 문자열이 들어올 경우 리스트로 변환
-        if isinstance(tickers, str):
-            tickers = [tickers]
-
-        plt = _setup_matplotlib()
-        import numpy as np
-
-        # 데이터 수집
-        all_data = {}
-        for ticker in tickers:
-            data = _fetch_quarterly_financials(ticker)
-            if data:
-                all_data[ticker] = data
-
-        if not all_data:
-            return None
-
-        # 공통 분기 수 결정 (가장 적은 분기 수 사용)
-        min_quarters = min(len(data[0]) for data in all_data.values())
-
-        # 첫 번째 티커의 분기 레이블 사용 (공통 분기 수만큼)
-        first_ticker = list(all_data.keys())[0]
-        quarter_labels = all_data[first_ticker][0][:min_quarters]
-        n_quarters = len(quarter_labels)
-        n_tickers = len(all_data)
-
-        fig, ax = plt.subplots(figsize=(10, 4))  # PDF용 컴팩트 사이즈
-        x = np.arange(n_quarters)
-        width = 0.8 / n_tickers  # 티커 수에 따라 막대 너비 조정
-
-        for i, (ticker, (_, revenue, _)) in enumerate(all_data.items()):
-            # 분기 수 맞추기
-            revenue_trimmed = revenue[:min_quarters]
-            offset = (i - n_tickers / 2 + 0.5) * width
-            color = COLORS[i % len(COLORS)]
-            ax.bar(
-                x + offset, revenue_trimmed, width, label=ticker, color=color, alpha=0.8
-            )
+        tickers = _as_list(tickers)
+        png = render_candlestick_chart(
+            tickers, fetch_stock_histories(tickers, days), days, dpi
+        )
+        return BytesIO(png) if png else None
+    except Exception as e:
+        logger.warning(f"Candlestick chart failed: {e}")
+        return None
 
-        ax.set_xticks(x)
-        ax.set_xticklabels(quarter_labels, rotation=45, ha="right", fontsize=9)
 
-        title = (
-            f"분기별 매출 비교 ({', '.join(tickers)})"
-            if n_tickers > 1
-            else f"{first_ticker} 분기별 매출"
+def generate_volume_chart(
+    tickers: List[str], days: int = 60, dpi: int = None
+) -> Optional[BytesIO]:
+    """Trading Volume Chart (comparison: overlay lines)"""
+    try:
+        tickers = _as_list(tickers)
+        png = render_volume_chart(
+            tickers, fetch_stock_histories(tickers, days), days, dpi
         )
-        ax.set_title(title, fontsize=13, fontweight="bold", pad=12)
-        ax.set_ylabel("매출 (십억 USD)", fontsize=11)
-        ax.legend(loc="upper left", fontsize=10)
-        ax.grid(True, alpha=0.3, axis="y", linestyle="--")
+        return BytesIO(png) if png else None
+    except Exception as e:
+        logger.warning(f"Volume chart failed: {e}")
+        return None
 
-        # Title 잘림 방지
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
 
-        buf = BytesIO()
-        fig.savefig(buf, format="png", dpi=300, facecolor="white")
-        buf.seek(0)
-        plt.close(fig)
-        return buf
+def generate_financial_chart(tickers: List[str], dpi: int = None) -> Optional[BytesIO]:
+    """Quarterly Financial Chart (comparison: grouped bars)"""
+    try:
+        tickers = _as_list(tickers)
+        png = render_financial_chart(
+            tickers, fetch_quarterly_financials_many(tickers), dpi
+        )
+        return BytesIO(png) if png else None
     except Exception as e:
         logger.warning(f"Financial chart failed: {e}")
         return None
@@ -445,18 +443,18 @@ def render_chart_streamlit(chart_type: str, ticker: str, tickers: List[str] = No
     ticker_list = tickers or [ticker]
 
     if chart_type == "candlestick":
-        buf = generate_candlestick_chart(ticker_list)
+        buf = generate_candlestick_chart(ticker_list, dpi=PREVIEW_DPI)
         if buf:
             st.image(buf, use_container_width=True)
     elif chart_type == "volume":
-        buf = generate_volume_chart(ticker_list)
+        buf = generate_volume_chart(ticker_list, dpi=PREVIEW_DPI)
         if buf:
             st.image(buf, use_container_width=True)
     elif chart_type == "financial":
-        buf = generate_financial_chart(ticker_list)
+        buf = generate_financial_chart(ticker_list, dpi=PREVIEW_DPI)
         if buf:
             st.image(buf, use_container_width=True)
     else:  # line
-        buf = generate_line_chart(ticker_list)
+        buf = generate_line_chart(ticker_list, dpi=PREVIEW_DPI)
         if buf:
             st.image(buf, use_container_width=True)
@@ -0,0 +1,154 @@
+"""
+Circuit Breaker - 엔드포인트별 차단기
+- 403(프리미엄 전용) 응답은 즉시 차단하고 긴 쿨다운 동안 요청하지 않음
+- 타임아웃/연결 오류/5xx가 연속 N회 발생하면 차단 (쿨다운은 실패할 때마다 2배, 상한 있음)
+- 쿨다운이 지나면 half-open 상태에서 요청 1개만 시험(probe) → 성공 시 복구, 실패 시 재차단
+- 차단 중인 엔드포인트는 네트워크 왕복 없이 즉시 fallback 경로로 진행
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+FAILURE_THRESHOLD = 3  # 연속 실패 횟수
+BASE_COOLDOWN_SECONDS = 60
+MAX_COOLDOWN_SECONDS = 15 * 60
+UNAVAILABLE_COOLDOWN_SECONDS = 6 * 60 * 60  # 403 (현재 플랜에서 사용 불가)
+PROBE_TIMEOUT_SECONDS = 60  # 결과가 기록되지 않은 probe는 이후 다시 허용
+
+
+@dataclass
+class _EndpointState:
+    state: str = CLOSED
+    failures: int = 0
+    cooldown: float = BASE_COOLDOWN_SECONDS
+    opened_at: float = 0.0
+    probing: bool = False
+    probe_at: float = 0.0
+    unavailable: bool = False
+
+
+class CircuitBreaker:
+    """엔드포인트 이름별 상태를 관리하는 차단기"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        base_cooldown: float = BASE_COOLDOWN_SECONDS,
+        max_cooldown: float = MAX_COOLDOWN_SECONDS,
+        unavailable_cooldown: float = UNAVAILABLE_COOLDOWN_SECONDS,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.unavailable_cooldown = unavailable_cooldown
+        self._states: Dict[str, _EndpointState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, endpoint: str) -> _EndpointState:
+        state = self._states.get(endpoint)
+        if state is None:
+            state = _EndpointState(cooldown=self.base_cooldown)
+            self._states[endpoint] = state
+        return state
+
+    def allow(self, endpoint: str) -> bool:
+        """요청 가능 여부 (half-open에서는 probe 1개만 허용)"""
+        with self._lock:
+            st = self._state(endpoint)
+            if st.state == CLOSED:
+                return True
+            if st.state == OPEN:
+                if time.time() - st.opened_at < st.cooldown:
+                    return False
+                st.state = HALF_OPEN
+                st.probing = False
+            now = time.time()
+            if st.probing and now - st.probe_at < PROBE_TIMEOUT_SECONDS:
+                return False
+            st.probing = True
+            st.probe_at = now
+            return True
+
+    def record_success(self, endpoint: str) -> None:
+        with self._lock:
+            st = self._state(endpoint)
+            if st.state != CLOSED:
+                logger.info(f"[{self.name}] circuit closed: {endpoint}")
+            self._states[endpoint] = _EndpointState(cooldown=self.base_cooldown)
+
+    def record_failure(self, endpoint: str, unavailable: bool = False) -> None:
+        """
+        실패 기록
+
+        Args:
+            unavailable: True면 플랜 제한 등 재시도해도 실패할 오류 (즉시 긴 차단)
+        """
+        with self._lock:
+            st = self._state(endpoint)
+            st.failures += 1
+            st.probing = False
+
+            if unavailable:
+                st.unavailable = True
+                self._open(endpoint, st, self.unavailable_cooldown)
+            elif st.state == HALF_OPEN:
+                self._open(endpoint, st, min(st.cooldown * 2, self.max_cooldown))
+            elif st.failures >= self.failure_threshold:
+                self._open(endpoint, st, st.cooldown)
+
+    def _open(self, endpoint: str, st: _EndpointState, cooldown: float) -> None:
+        st.state = OPEN
+        st.opened_at = time.time()
+        st.cooldown = cooldown
+        logger.warning(
+            f"[{self.name}] circuit open for {cooldown:.0f}s: {endpoint}"
+            + (" (unavailable on this plan)" if st.unavailable else "")
+        )
+
+    def reset(self, endpoint: str = None) -> None:
+        """상태 초기화 (endpoint 미지정 시 전체)"""
+        with self._lock:
+            if endpoint is None:
+                self._states.clear()
+            else:
+                self._states.pop(endpoint, None)
+
+    def status(self) -> Dict[str, Dict]:
+        """닫혀 있지 않은 엔드포인트 상태"""
+        now = time.time()
+        with self._lock:
+            return {
+                ep: {
+                    "state": st.state,
+                    "failures": st.failures,
+                    "unavailable": st.unavailable,
+                    "retry_in": max(0.0, round(st.opened_at + st.cooldown - now, 1)),
+                }
+                for ep, st in self._states.items()
+                if st.state != CLOSED
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str = "finnhub") -> CircuitBreaker:
+    """이름별 프로세스 공유 차단기"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name)
+            _breakers[name] = breaker
+        return breaker
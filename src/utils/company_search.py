@@ -0,0 +1,239 @@
+"""
+Company Search - 로컬 기업 검색 서비스
+- companies 카탈로그 + tickers(한글명/키워드)를 메모리에 적재해 SearchIndex로 검색
+- TTL(기본 1시간)마다 재적재, 재적재 중에는 기존 인덱스로 계속 응답
+- resolve_to_ticker, 사이드바 관심기업 추가, 홈 검색 탭, 티커 검색창이 같은 인덱스를 공유
+  → 기업명 해석에 DB 왕복(ILIKE 전체 스캔)이 발생하지 않음
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+try:
+    from utils.search_index import SearchIndex
+except ImportError:
+    from src.utils.search_index import SearchIndex
+
+logger = logging.getLogger(__name__)
+
+CATALOG_TTL_SECONDS = int(os.getenv("COMPANY_SEARCH_TTL", "3600"))
+RETRY_SECONDS = 60  # 적재 실패 시 재시도 간격
+LOAD_WAIT_SECONDS = 30  # 최초 적재를 기다리는 최대 시간
+DEFAULT_LIMIT = 20
+
+_INTERNAL_KEYS = ("keywords", "in_companies")
+
+COMPANY_COLUMNS = [
+    "id",
+    "ticker",
+    "company_name",
+    "korean_name",
+    "sector",
+    "industry",
+    "exchange",
+]
+
+
+def _load_companies() -> pd.DataFrame:
+    """companies 카탈로그 조회 (Supabase 실패 시 DuckDB 미러 스냅샷)"""
+    try:
+        try:
+            from data.supabase_client import SupabaseClient
+        except ImportError:
+            from src.data.supabase_client import SupabaseClient
+        return SupabaseClient.get_all_companies(columns=", ".join(COMPANY_COLUMNS))
+    except Exception as e:
+        logger.warning(f"Company catalog load from Supabase failed: {e}")
+
+    try:
+        try:
+            from sql.duckdb_mirror import get_mirror
+        except ImportError:
+            from src.sql.duckdb_mirror import get_mirror
+        return get_mirror().read_tables(["companies"]).get("companies", pd.DataFrame())
+    except Exception as e:
+        logger.warning(f"Company catalog load from mirror failed: {e}")
+        return pd.DataFrame()
+
+
+def _load_tickers() -> List[Dict]:
+    """tickers 테이블 (한글명/검색 키워드) 조회"""
+    try:
+        try:
+            from data.supabase_client import SupabaseClient
+        except ImportError:
+            from src.data.supabase_client import SupabaseClient
+        client = SupabaseClient.get_client()
+        response = (
+            client.table("tickers").select("ticker, korean_name, keywords").execute()
+        )
+        return response.data or []
+    except Exception as e:
+        logger.warning(f"Ticker catalog load failed: {e}")
+        return []
+
+
+def _merge_catalog(companies: pd.DataFrame, tickers: List[Dict]) -> List[Dict]:
+    """companies 행에 tickers의 한글명/키워드를 합친 레코드 목록"""
+    records: Dict[str, Dict] = {}
+
+    if companies is not None and not companies.empty:
+        cols = [c for c in COMPANY_COLUMNS if c in companies.columns]
+        frame = companies[cols].astype(object).where(companies[cols].notna(), None)
+        for row in frame.to_dict("records"):
+            ticker = (row.get("ticker") or "").strip().upper()
+            if ticker:
+                row["ticker"] = ticker
+                row["in_companies"] = True
+                records[ticker] = row
+
+    for item in tickers:
+        ticker = (item.get("ticker") or "").strip().upper()
+        if not ticker:
+            continue
+        row = records.setdefault(ticker, {"ticker": ticker, "in_companies": False})
+        if item.get("korean_name") and not row.get("korean_name"):
+            row["korean_name"] = item["korean_name"]
+        row["keywords"] = item.get("keywords")
+
+    return list(records.values())
+
+
+class CompanySearchService:
+    """TTL 기반으로 갱신되는 인메모리 기업 검색 서비스"""
+
+    def __init__(self, ttl: int = CATALOG_TTL_SECONDS):
+        self.ttl = ttl
+        self._index: Optional[SearchIndex] = None
+        self._rows: Dict[str, Dict] = {}
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._loaded = threading.Event()
+
+    @property
+    def index(self) -> SearchIndex:
+        """현재 인덱스 (만료 시 갱신)"""
+        self._ensure_fresh()
+        return self._index or SearchIndex([])
+
+    def _ensure_fresh(self) -> None:
+        if self._index is not None and time.time() < self._expires_at:
+            return
+
+        with self._lock:
+            if self._index is not None and time.time() < self._expires_at:
+                return
+            first_load = self._index is None
+            refreshing = self._refreshing
+            self._refreshing = True
+
+        if refreshing:
+            # 최초 적재 중이면 완료를 기다리고, 갱신 중이면 기존 인덱스로 응답
+            if first_load:
+                self._loaded.wait(timeout=LOAD_WAIT_SECONDS)
+            return
+
+        if first_load:
+            self.refresh()
+        else:
+            threading.Thread(target=self.refresh, daemon=True).start()
+
+    def refresh(self) -> int:
+        """카탈로그 재적재 및 인덱스 재구축
+
+        Returns:
+            인덱싱된 티커 수
+        """
+        try:
+            records = _merge_catalog(_load_companies(), _load_tickers())
+            index = SearchIndex.from_records(records)
+            rows = {r["ticker"]: r for r in records}
+            ttl = self.ttl if records else RETRY_SECONDS
+        except Exception as e:
+            logger.error(f"Company search index build failed: {e}")
+            index, rows, ttl = None, None, RETRY_SECONDS
+
+        with self._lock:
+            if index is not None:
+                self._index = index
+                self._rows = rows
+            elif self._index is None:
+                self._index = SearchIndex([])
+            self._expires_at = time.time() + ttl
+            self._refreshing = False
+        self._loaded.set()
+
+        logger.info(f"Company search index: {len(self._index)} tickers")
+        return len(self._index)
+
+    def invalidate(self) -> None:
+        """다음 조회 시 재적재하도록 만료 처리"""
+        with self._lock:
+            self._expires_at = 0.0
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def search(
+        self, query: str, limit: int = DEFAULT_LIMIT, companies_only: bool = True
+    ) -> List[Dict]:
+        """점수 순 기업 검색
+
+        Args:
+            query: 티커, 영문명, 한글명 또는 키워드
+            limit: 최대 결과 수
+            companies_only: True면 companies 테이블에 있는 기업만 반환
+        """
+        index = self.index
+        # companies_only 필터 후에도 limit을 채울 수 있도록 여유 있게 조회
+        docs = index.search(query, limit=limit * 3 if companies_only else limit)
+
+        results = []
+        for doc in docs:
+            row = self._rows.get(doc.ticker)
+            if row is None or (companies_only and not row.get("in_companies")):
+                continue
+            results.append({k: v for k, v in row.items() if k not in _INTERNAL_KEYS})
+            if len(results) >= limit:
+                break
+        return results
+
+    def search_frame(self, query: str, limit: int = DEFAULT_LIMIT) -> pd.DataFrame:
+        """SupabaseClient.search_companies와 같은 형태의 DataFrame 결과"""
+        return pd.DataFrame(self.search(query, limit=limit))
+
+    def resolve(self, term: str) -> Optional[str]:
+        """기업명/티커를 가장 관련도 높은 티커로 변환 (없으면 None)"""
+        results = self.search(term, limit=1, companies_only=False)
+        return results[0]["ticker"] if results else None
+
+    def get(self, ticker: str) -> Optional[Dict]:
+        """티커로 카탈로그 행 조회"""
+        self._ensure_fresh()
+        return self._rows.get((ticker or "").upper())
+
+
+_service: Optional[CompanySearchService] = None
+_service_lock = threading.Lock()
+
+
+def get_company_search() -> CompanySearchService:
+    """프로세스 공유 기업 검색 서비스"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = CompanySearchService()
+    return _service
+
+
+def search_companies(query: str, limit: int = DEFAULT_LIMIT) -> pd.DataFrame:
+    """로컬 인덱스 기반 기업 검색 (DataFrame)"""
+    return get_company_search().search_frame(query, limit=limit)
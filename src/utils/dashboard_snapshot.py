@@ -0,0 +1,220 @@
+"""
+Dashboard Snapshot - 홈 대시보드 집계 스냅샷
+- 스케줄러/미러 동기화 직후 홈 화면의 모든 집계(기업 수, 재무 레코드 수, 데이터 기간,
+  섹터 분포, 매출 상위 기업)를 한 번 계산해 작은 JSON 파일 하나로 저장
+- 각 Streamlit 워커는 파일을 mmap으로 읽고 수정 시각 기준으로 캐싱
+  → 홈 화면 렌더링 시 DB 호출 및 pandas 재집계 없음
+- 환율은 스냅샷에 넣지 않음 (get_exchange_client()가 메모리에서 최신 값 제공)
+- built_at이 최대 보관 시간(DASHBOARD_SNAPSHOT_MAX_AGE)보다 오래되면 무시 → 실시간 경로 사용
+- 파일은 임시 파일 작성 후 os.replace로 원자적으로 교체
+"""
+
+import json
+import logging
+import mmap
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+try:
+    from sql.duckdb_mirror import get_mirror
+    from utils.ratio_engine import load_ratio_panel
+except ImportError:
+    from src.sql.duckdb_mirror import get_mirror
+    from src.utils.ratio_engine import load_ratio_panel
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = "home_dashboard.json"
+SNAPSHOT_VERSION = 2
+# 스냅샷 최대 보관 시간 (초, 기본 36시간: 일일 스케줄러가 한 번 실패해도 허용)
+MAX_SNAPSHOT_AGE_SECONDS = int(os.getenv("DASHBOARD_SNAPSHOT_MAX_AGE", str(36 * 60 * 60)))
+TOP_REVENUE_LIMIT = 20
+SAMPLE_COMPANIES = 10
+# 매출 상위 연도: 기업 수가 최대 연도의 절반 이상인 가장 최근 연도 (공시 진행 중인 연도 제외)
+MIN_YEAR_COVERAGE = 0.5
+
+TOP_REVENUE_COLUMNS = ["ticker", "company_name", "revenue", "net_income", "total_assets"]
+
+_cache: Dict[str, object] = {"snapshot": None, "key": None}
+_cache_lock = threading.Lock()
+
+
+def snapshot_path(mirror=None) -> Path:
+    """스냅샷 파일 경로 (DuckDB 미러 디렉터리)"""
+    mirror = mirror or get_mirror()
+    return mirror.mirror_dir / SNAPSHOT_FILE
+
+
+# ============================================================
+# 집계 (writer: 스케줄러 / 동기화 스크립트)
+# ============================================================
+
+
+def _is_valid_sector(sector) -> bool:
+    """숫자만 있는 값 등 오류 섹터 제외"""
+    if sector is None:
+        return False
+    text = str(sector).strip()
+    return bool(text) and not text.isdigit() and text.lower() != "nan"
+
+
+def _records(df: pd.DataFrame) -> List[Dict]:
+    """JSON 직렬화 가능한 레코드 목록 (NaN -> None)"""
+    return json.loads(df.to_json(orient="records", force_ascii=False))
+
+
+def _load_companies(mirror) -> pd.DataFrame:
+    frames = mirror.read_tables(["companies"])
+    if "companies" in frames:
+        return frames["companies"]
+    try:
+        from data.supabase_client import SupabaseClient
+    except ImportError:
+        from src.data.supabase_client import SupabaseClient
+    return SupabaseClient.get_all_companies(columns="ticker, company_name, sector")
+
+
+def _top_revenue_year(panel: pd.DataFrame) -> Optional[int]:
+    counts = panel.dropna(subset=["revenue"]).groupby("fiscal_year").size()
+    if counts.empty:
+        return None
+    covered = counts[counts >= counts.max() * MIN_YEAR_COVERAGE]
+    return int(covered.index.max())
+
+
+def build_dashboard_snapshot(mirror=None) -> Dict:
+    """홈 대시보드에 필요한 모든 집계를 계산"""
+    mirror = mirror or get_mirror()
+    companies = _load_companies(mirror)
+    panel = load_ratio_panel()
+
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "built_at": datetime.now().isoformat(timespec="seconds"),
+        "company_count": int(len(companies)),
+        "report_count": int(len(panel)),
+        "data_period": None,
+        "companies_sample": [],
+        "sector_counts": {},
+        "top_revenue_year": None,
+        "top_revenue": [],
+    }
+
+    if not companies.empty:
+        cols = [c for c in ("ticker", "company_name") if c in companies.columns]
+        sample = companies.sort_values("ticker")[cols].head(SAMPLE_COMPANIES)
+        snapshot["companies_sample"] = _records(sample)
+
+        if "sector" in companies.columns:
+            sectors = companies["sector"].value_counts()
+            sectors = sectors[[_is_valid_sector(s) for s in sectors.index]]
+            snapshot["sector_counts"] = {str(k): int(v) for k, v in sectors.items()}
+
+    if not panel.empty and "fiscal_year" in panel.columns:
+        years = panel["fiscal_year"].dropna()
+        if not years.empty:
+            snapshot["data_period"] = f"{int(years.min())}-{int(years.max())}"
+
+        if "revenue" in panel.columns:
+            year = _top_revenue_year(panel)
+            if year is not None:
+                rows = panel[(panel["fiscal_year"] == year) & panel["revenue"].notna()]
+                top = rows.nlargest(TOP_REVENUE_LIMIT, "revenue")
+                top = top.reindex(columns=TOP_REVENUE_COLUMNS)
+                snapshot["top_revenue_year"] = year
+                snapshot["top_revenue"] = _records(top)
+
+    return snapshot
+
+
+def write_dashboard_snapshot(snapshot: Dict, path: Optional[Path] = None) -> Path:
+    """스냅샷을 원자적으로 저장"""
+    path = Path(path or snapshot_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+    return path
+
+
+def refresh_dashboard_snapshot(mirror=None) -> Path:
+    """집계 계산 후 스냅샷 파일 갱신 (스케줄러/동기화 스크립트용)"""
+    start = time.perf_counter()
+    mirror = mirror or get_mirror()
+    path = write_dashboard_snapshot(build_dashboard_snapshot(mirror), snapshot_path(mirror))
+    logger.info(
+        f"Dashboard snapshot written: {path} ({path.stat().st_size} bytes, "
+        f"{time.perf_counter() - start:.2f}s)"
+    )
+    return path
+
+
+# ============================================================
+# 조회 (reader: Streamlit 워커)
+# ============================================================
+
+
+def snapshot_age_seconds(snapshot: Dict) -> Optional[float]:
+    """built_at 기준 스냅샷 경과 시간 (초, 알 수 없으면 None)"""
+    try:
+        built_at = datetime.fromisoformat(snapshot["built_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return (datetime.now() - built_at).total_seconds()
+
+
+def _is_fresh(snapshot: Dict, max_age: float) -> bool:
+    age = snapshot_age_seconds(snapshot)
+    if age is None or age > max_age:
+        logger.info(
+            f"Dashboard snapshot is stale (built_at={snapshot.get('built_at')}), "
+            "falling back to live queries"
+        )
+        return False
+    return True
+
+
+def load_dashboard_snapshot(
+    max_age: float = MAX_SNAPSHOT_AGE_SECONDS,
+) -> Optional[Dict]:
+    """
+    스냅샷 조회 (없거나 손상되었거나 max_age초보다 오래되었으면 None)
+
+    파일 수정 시각/크기가 바뀔 때만 다시 읽으므로 재실행마다 비용이 들지 않고,
+    mmap으로 읽어 여러 워커 프로세스가 같은 페이지 캐시를 공유합니다.
+    경과 시간은 캐시된 스냅샷에도 매번 확인합니다.
+    """
+    path = snapshot_path()
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        if _cache["key"] == key:
+            cached = _cache["snapshot"]
+            return cached if cached and _is_fresh(cached, max_age) else None
+
+    try:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                snapshot = json.loads(mm[:])
+    except (OSError, ValueError) as e:
+        logger.warning(f"Dashboard snapshot unreadable: {e}")
+        return None
+
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+
+    with _cache_lock:
+        _cache["snapshot"] = snapshot
+        _cache["key"] = key
+    return snapshot if _is_fresh(snapshot, max_age) else None
@@ -0,0 +1,139 @@
+"""
+Downsampling Utilities - 차트용 서버 측 데이터 축소 모듈
+- 라인 차트: LTTB (Largest-Triangle-Three-Buckets) - 시각적 형태(고점/저점) 보존
+- 캔들 차트: OHLC 버킷 집계 (시가=첫값, 고가=최대, 저가=최소, 종가=마지막, 거래량=합계)
+- 차트 픽셀 폭 기준으로 포인트 수 결정 → 브라우저 전송량 감소
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+# 차트 폭 기본값 (Streamlit wide 레이아웃 기준)
+DEFAULT_CHART_WIDTH_PX = 1000
+POINTS_PER_PIXEL = 1.0  # 라인: 픽셀당 1포인트면 시각적으로 동일
+PIXELS_PER_CANDLE = 4  # 캔들: 최소 4px 폭이어야 몸통 식별 가능
+
+
+def max_points_for_width(width_px: int = DEFAULT_CHART_WIDTH_PX) -> int:
+    """라인 차트 폭(px)에 맞는 최대 포인트 수"""
+    return max(3, int(width_px * POINTS_PER_PIXEL))
+
+
+def max_candles_for_width(width_px: int = DEFAULT_CHART_WIDTH_PX) -> int:
+    """캔들 차트 폭(px)에 맞는 최대 캔들 수"""
+    return max(1, int(width_px // PIXELS_PER_CANDLE))
+
+
+def lttb_indices(values: Sequence[float], n_out: int) -> np.ndarray:
+    """
+    LTTB로 선택할 원본 인덱스 계산
+
+    x축은 위치(인덱스)를 사용합니다. 거래일 간격은 거의 균일하므로
+    타임스탬프 대신 위치를 써도 선택 결과가 사실상 같습니다.
+
+    Args:
+        values: y 값 배열
+        n_out: 출력 포인트 수 (첫/마지막 포인트 포함)
+
+    Returns:
+        오름차순 인덱스 배열
+    """
+    y = np.asarray(values, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    bucket_size = (n - 2) / (n_out - 2)
+    # 각 버킷 경계를 한 번에 계산
+    bounds = (np.floor(np.arange(n_out) * bucket_size) + 1).astype(np.int64)
+    bounds = np.minimum(bounds, n - 1)
+
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0] = 0
+    idx[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = bounds[i], bounds[i + 1]
+        if end <= start:
+            end = start + 1
+
+        # 다음 버킷 평균점 (마지막 버킷은 마지막 포인트)
+        next_start = end
+        next_end = bounds[i + 2] if i + 2 < n_out - 1 else n
+        if next_end <= next_start:
+            avg_x, avg_y = float(n - 1), y[n - 1]
+        else:
+            avg_x = (next_start + next_end - 1) / 2.0
+            avg_y = y[next_start:next_end].mean()
+
+        # 현재 버킷에서 삼각형 면적이 최대인 포인트 선택
+        xs = np.arange(start, end, dtype=float)
+        areas = np.abs((a - avg_x) * (y[start:end] - y[a]) - (a - xs) * (avg_y - y[a]))
+        a = start + int(np.nanargmax(areas)) if np.isfinite(areas).any() else start
+        idx[i + 1] = a
+
+    return idx
+
+
+def downsample_line(
+    dates: Sequence, values: Sequence[float], width_px: int = DEFAULT_CHART_WIDTH_PX
+) -> Tuple[List, List]:
+    """
+    라인 차트 데이터 LTTB 축소
+
+    Returns:
+        (dates, values) - 포인트 수가 충분히 적으면 원본 그대로
+    """
+    n_out = max_points_for_width(width_px)
+    if len(values) <= n_out:
+        return list(dates), list(values)
+
+    idx = lttb_indices(values, n_out)
+    dates_arr = np.asarray(dates, dtype=object)
+    values_arr = np.asarray(values, dtype=float)
+    return dates_arr[idx].tolist(), values_arr[idx].tolist()
+
+
+def downsample_ohlcv(
+    dates: Sequence,
+    opens: Sequence[float],
+    highs: Sequence[float],
+    lows: Sequence[float],
+    closes: Sequence[float],
+    volumes: Sequence[float],
+    width_px: int = DEFAULT_CHART_WIDTH_PX,
+) -> Tuple[List, List, List, List, List, List]:
+    """
+    캔들 데이터 OHLC 버킷 집계
+
+    각 버킷은 연속 구간이며 날짜는 버킷 시작일을 사용합니다.
+
+    Returns:
+        (dates, opens, highs, lows, closes, volumes)
+    """
+    n = len(closes)
+    n_out = max_candles_for_width(width_px)
+    if n <= n_out:
+        return (
+            list(dates),
+            list(opens),
+            list(highs),
+            list(lows),
+            list(closes),
+            list(volumes),
+        )
+
+    edges = np.linspace(0, n, n_out + 1).astype(np.int64)
+    starts = edges[:-1]
+    last = edges[1:] - 1
+
+    o = np.asarray(opens, dtype=float)[starts]
+    h = np.maximum.reduceat(np.asarray(highs, dtype=float), starts)
+    l = np.minimum.reduceat(np.asarray(lows, dtype=float), starts)
+    c = np.asarray(closes, dtype=float)[last]
+    v = np.add.reduceat(np.nan_to_num(np.asarray(volumes, dtype=float)), starts)
+    d = np.asarray(dates, dtype=object)[starts]
+
+    return d.tolist(), o.tolist(), h.tolist(), l.tolist(), c.tolist(), v.tolist()
@@ -10,17 +10,165 @@ from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from pathlib import Path
 import os
 import re
+import logging
 from io import BytesIO
 from typing import Optional
+from functools import lru_cache
 
 
 from reportlab.lib.utils import ImageReader
 
+logger = logging.getLogger(__name__)
+
+# Get project root and fonts directory
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+FONTS_DIR = PROJECT_ROOT / "fonts"
+
+# Try to find Korean fonts (regular and bold)
+FONT_PATHS = [
+    # 1. 프로젝트 내 폰트 (우선)
+    FONTS_DIR / "NanumGothic.ttf",
+    FONTS_DIR / "MALGUN.TTF",
+    FONTS_DIR / "malgun.ttf",
+    # 2. macOS - 사용자 폰트 (Homebrew 설치 위치)
+    Path.home() / "Library" / "Fonts" / "NanumGothic.ttf",
+    Path.home() / "Library" / "Fonts" / "NanumBarunGothic.ttf",
+    # 3. macOS - 시스템 폰트
+    Path("/System/Library/Fonts/Supplemental/AppleGothic.ttf"),
+    Path("/Library/Fonts/AppleGothic.ttf"),
+    # 4. Windows
+    Path("C:/Windows/Fonts/malgun.ttf"),
+    Path("C:/Windows/Fonts/MALGUN.TTF"),
+]
+
+BOLD_FONT_PATHS = [
+    # 1. 프로젝트 내 폰트
+    FONTS_DIR / "NanumGothicBold.ttf",
+    FONTS_DIR / "MALGUNBD.TTF",
+    FONTS_DIR / "malgunbd.ttf",
+    # 2. macOS - 사용자 폰트
+    Path.home() / "Library" / "Fonts" / "NanumGothicBold.ttf",
+    Path.home() / "Library" / "Fonts" / "NanumBarunGothicBold.ttf",
+    # 3. macOS - 시스템 폰트 (Bold 없으면 Regular 사용)
+    Path("/System/Library/Fonts/Supplemental/AppleGothic.ttf"),
+    # 4. Windows
+    Path("C:/Windows/Fonts/malgunbd.ttf"),
+    Path("C:/Windows/Fonts/MALGUNBD.TTF"),
+]
+
+# 차트 이미지 재인코딩 설정
+IMAGE_FORMATS = ("png", "jpeg")
+DEFAULT_IMAGE_DPI = 200  # PDF 내 표시 크기 기준 목표 해상도
+DEFAULT_JPEG_QUALITY = 85
+CHART_DISPLAY_RATIO = 0.80  # 차트는 본문 너비의 80%로 표시
+
+
+def _register_font(name: str, candidates: list) -> Optional[str]:
+    """후보 경로 중 첫 번째로 로드 가능한 TTF를 등록"""
+    for font_path in candidates:
+        if font_path.exists():
+            try:
+                pdfmetrics.registerFont(TTFont(name, str(font_path)))
+                return name
+            except Exception:
+                continue
+    return None
+
+
+@lru_cache(maxsize=1)
+def register_korean_fonts() -> tuple:
+    """
+    한글 폰트 등록 (프로세스당 1회)
+
+    TTF 파싱은 비용이 크므로 최초 1회만 수행하고 이후 호출은 캐시된
+    폰트명을 반환합니다. ReportLab은 TTF를 문서에 사용된 글리프만
+    서브셋으로 임베딩하므로 전체 폰트가 PDF에 들어가지 않습니다.
+
+    Returns:
+        (regular_font_name, bold_font_name)
+
+    Raises:
+        RuntimeError: 한글 폰트를 찾을 수 없는 경우 (캐시되지 않음)
+    """
+    korean_font = _register_font("KoreanFont", FONT_PATHS)
+    korean_font_bold = _register_font("KoreanFontBold", BOLD_FONT_PATHS)
+
+    # Fallback: use regular font as bold if bold not found
+    if not korean_font_bold:
+        korean_font_bold = korean_font
+
+    if not korean_font:
+        raise RuntimeError(
+            f"""한글 폰트를 찾을 수 없습니다.
+
+PDF 생성을 위해:
+1. https://hangeul.naver.com/font 에서 나눔고딕 다운로드
+2. {FONTS_DIR} 폴더에 NanumGothic.ttf 파일 복사
+3. 애플리케이션 재시작
+"""
+        )
+
+    return korean_font, korean_font_bold
+
+
+def compress_chart_image(
+    image_buf: BytesIO,
+    image_format: str = "png",
+    max_width_px: Optional[int] = None,
+    jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+) -> BytesIO:
+    """
+    차트 이미지 재인코딩 (PDF 용량 절감)
+
+    Args:
+        image_buf: 원본 이미지 (PNG/JPEG)
+        image_format: "png" (256색 양자화) 또는 "jpeg"
+        max_width_px: 이 너비보다 크면 비율 유지하며 축소
+        jpeg_quality: JPEG 품질 (1-95)
+
+    Returns:
+        재인코딩된 이미지 BytesIO (실패 시 원본)
+    """
+    try:
+        from PIL import Image
+
+        image_buf.seek(0)
+        img = Image.open(image_buf)
+        img.load()
+
+        if max_width_px and img.width > max_width_px:
+            new_height = max(1, round(img.height * max_width_px / img.width))
+            img = img.resize((max_width_px, new_height), Image.LANCZOS)
+
+        # 투명 배경은 흰색으로 합성 (차트는 흰 배경)
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGBA")
+            background = Image.new("RGB", img.size, "white")
+            background.paste(img, mask=img.split()[-1])
+            img = background
+        elif img.mode != "RGB":
+            img = img.convert("RGB")
+
+        out = BytesIO()
+        if image_format == "jpeg":
+            img.save(out, format="JPEG", quality=jpeg_quality, optimize=True)
+        else:
+            img.quantize(colors=256).save(out, format="PNG", optimize=True)
+
+        out.seek(0)
+        return out
+    except Exception as e:
+        logger.warning(f"Chart image compression failed, embedding original: {e}")
+        image_buf.seek(0)
+        return image_buf
+
 
 def create_pdf(
     markdown_text: str,
     chart_image: Optional[BytesIO] = None,
     chart_images: Optional[list] = None,
+    image_format: Optional[str] = None,
+    image_dpi: int = DEFAULT_IMAGE_DPI,
 ) -> bytes:
     """Convert Markdown text to PDF using ReportLab with enhanced styling
 
@@ -28,12 +176,15 @@ def create_pdf(
         markdown_text: Markdown content
         chart_image: (Deprecated) Single chart image for backward compatibility
         chart_images: List of BytesIO objects containing chart images (PNG/JPEG)
+        image_format: 차트 재인코딩 형식 ("png" = 양자화 PNG, "jpeg", None = 원본 그대로)
+        image_dpi: 재인코딩 시 PDF 표시 크기 기준 목표 해상도
 
     Features:
         - Bold text support (**text**)
         - Heading hierarchy with proper sizing
         - Multiple chart images support
         - Reduced chart sizes for better readability
+        - 한글 폰트 1회 등록 (프로세스 캐시), 선택적 차트 이미지 압축
     """
     # Backward compatibility: merge single chart_image into list
     all_charts = []
@@ -41,79 +192,20 @@ def create_pdf(
         all_charts.extend(chart_images)
     elif chart_image:
         all_charts.append(chart_image)
-    # Get project root and fonts directory
-    project_root = Path(__file__).parent.parent.parent
-    fonts_dir = project_root / "fonts"
-
-    # Try to find Korean fonts (regular and bold)
-    font_paths = [
-        # 1. 프로젝트 내 폰트 (우선)
-        fonts_dir / "NanumGothic.ttf",
-        fonts_dir / "MALGUN.TTF",
-        fonts_dir / "malgun.ttf",
-        # 2. macOS - 사용자 폰트 (Homebrew 설치 위치)
-        Path.home() / "Library" / "Fonts" / "NanumGothic.ttf",
-        Path.home() / "Library" / "Fonts" / "NanumBarunGothic.ttf",
-        # 3. macOS - 시스템 폰트
-        Path("/System/Library/Fonts/Supplemental/AppleGothic.ttf"),
-        Path("/Library/Fonts/AppleGothic.ttf"),
-        # 4. Windows
-        Path("C:/Windows/Fonts/malgun.ttf"),
-        Path("C:/Windows/Fonts/MALGUN.TTF"),
-    ]
-
-    bold_font_paths = [
-        # 1. 프로젝트 내 폰트
-        fonts_dir / "NanumGothicBold.ttf",
-        fonts_dir / "MALGUNBD.TTF",
-        fonts_dir / "malgunbd.ttf",
-        # 2. macOS - 사용자 폰트
-        Path.home() / "Library" / "Fonts" / "NanumGothicBold.ttf",
-        Path.home() / "Library" / "Fonts" / "NanumBarunGothicBold.ttf",
-        # 3. macOS - 시스템 폰트 (Bold 없으면 Regular 사용)
-        Path("/System/Library/Fonts/Supplemental/AppleGothic.ttf"),
-        # 4. Windows
-        Path("C:/Windows/Fonts/malgunbd.ttf"),
-        Path("C:/Windows/Fonts/MALGUNBD.TTF"),
-    ]
-
-    korean_font = None
-    korean_font_bold = None
-
-    # Register regular font
-    for font_path in font_paths:
-        if font_path.exists():
-            try:
-                pdfmetrics.registerFont(TTFont("KoreanFont", str(font_path)))
-                korean_font = "KoreanFont"
-                break
-            except Exception:
-                continue
 
-    # Register bold font
-    for font_path in bold_font_paths:
-        if font_path.exists():
-            try:
-                pdfmetrics.registerFont(TTFont("KoreanFontBold", str(font_path)))
-                korean_font_bold = "KoreanFontBold"
-                break
-            except Exception:
-                continue
+    if image_format and image_format not in IMAGE_FORMATS:
+        raise ValueError(f"지원하지 않는 이미지 형식: {image_format}")
 
-    # Fallback: use regular font as bold if bold not found
-    if not korean_font_bold:
-        korean_font_bold = korean_font
+    korean_font, korean_font_bold = register_korean_fonts()
 
-    if not korean_font:
-        raise RuntimeError(
-            f"""한글 폰트를 찾을 수 없습니다.
-
-PDF 생성을 위해:
-1. https://hangeul.naver.com/font 에서 나눔고딕 다운로드
-2. {fonts_dir} 폴더에 NanumGothic.ttf 파일 복사
-3. 애플리케이션 재시작
-"""
-        )
+    if image_format and all_charts:
+        # 표시 너비(인치) x 목표 DPI 보다 큰 이미지는 축소
+        display_inches = (letter[0] - 1.5 * inch) * CHART_DISPLAY_RATIO / inch
+        max_width_px = int(display_inches * image_dpi)
+        all_charts = [
+            compress_chart_image(buf, image_format, max_width_px)
+            for buf in all_charts
+        ]
 
     # Create PDF in memory
     buffer = BytesIO()
@@ -212,7 +304,7 @@ PDF 생성을 위해:
                     aspect = img_height / float(img_width)
 
                     # 80% 너비로 표시하여 컴팩트한 레이아웃
-                    display_width = max_width * 0.80
+                    display_width = max_width * CHART_DISPLAY_RATIO
                     display_height = display_width * aspect
 
                     # 동적 높이 제한 (차트 비율에 따라 조정)
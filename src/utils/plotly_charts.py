@@ -7,9 +7,33 @@ Plotly Chart Utilities - 선명한 벡터 기반 차트 생성 모듈
 
 import logging
 from io import BytesIO
-from datetime import datetime, timedelta
-from typing import Optional, List, Tuple
-from functools import lru_cache
+from typing import Optional, List
+
+try:
+    from utils.price_cache import (
+        fetch_stock_histories,
+        fetch_quarterly_financials_many,
+        clear_cache as _clear_price_cache,
+    )
+except ImportError:
+    from src.utils.price_cache import (
+        fetch_stock_histories,
+        fetch_quarterly_financials_many,
+        clear_cache as _clear_price_cache,
+    )
+
+try:
+    from utils.downsampling import (
+        DEFAULT_CHART_WIDTH_PX,
+        downsample_line,
+        downsample_ohlcv,
+    )
+except ImportError:
+    from src.utils.downsampling import (
+        DEFAULT_CHART_WIDTH_PX,
+        downsample_line,
+        downsample_ohlcv,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -20,81 +44,15 @@ DOWN_COLOR = "#ef5350"  # 하락 - 빨강
 
 
 # ============================================================
-# DATA FETCHING LAYER (캐싱 적용)
+# DATA FETCHING LAYER (price_cache 공유 캐시)
 # ============================================================
-
-
-@lru_cache(maxsize=50)
-def _fetch_stock_history(ticker: str, days: int) -> Optional[Tuple]:
-    """주가 데이터 캐싱"""
-    try:
-        import yfinance as yf
-
-        end_d = datetime.now()
-        start_d = end_d - timedelta(days=days)
-        stock = yf.Ticker(ticker)
-        df = stock.history(start=start_d, end=end_d)
-        if df.empty:
-            return None
-        return (
-            tuple(df.index.tolist()),
-            tuple(df["Open"].tolist()),
-            tuple(df["High"].tolist()),
-            tuple(df["Low"].tolist()),
-            tuple(df["Close"].tolist()),
-            tuple(df["Volume"].tolist()),
-        )
-    except Exception as e:
-        logger.warning(f"Stock data fetch failed for {ticker}: {e}")
-        return None
-
-
-@lru_cache(maxsize=20)
-def _fetch_quarterly_financials(ticker: str) -> Optional[Tuple]:
-    """분기별 재무 데이터 캐싱"""
-    try:
-        import yfinance as yf
-
-        stock = yf.Ticker(ticker)
-        quarterly = stock.quarterly_financials
-        if quarterly.empty:
-            return None
-
-        revenue_row = net_income_row = None
-        for idx in quarterly.index:
-            idx_lower = str(idx).lower()
-            if "revenue" in idx_lower or "total revenue" in idx_lower:
-                revenue_row = idx
-            if "net income" in idx_lower:
-                net_income_row = idx
-
-        if revenue_row is None:
-            return None
-
-        quarters = quarterly.columns[:8][::-1]
-        revenue = quarterly.loc[revenue_row, quarters].values / 1e9
-        net_income = (
-            quarterly.loc[net_income_row, quarters].values / 1e9
-            if net_income_row
-            else None
-        )
-        quarter_labels = tuple(
-            q.strftime("%Y Q").replace("Q", f"Q{(q.month-1)//3+1}") for q in quarters
-        )
-        return (
-            quarter_labels,
-            tuple(revenue),
-            tuple(net_income) if net_income is not None else None,
-        )
-    except Exception as e:
-        logger.warning(f"Financial data fetch failed for {ticker}: {e}")
-        return None
+# 주가/재무 데이터 수집은 utils.price_cache에서 일괄 처리합니다.
+# (멀티 티커 1회 다운로드 + 기간별 슬라이싱, plotly_charts와 캐시 공유)
 
 
 def clear_cache():
     """모든 캐시 초기화"""
-    _fetch_stock_history.cache_clear()
-    _fetch_quarterly_financials.cache_clear()
+    _clear_price_cache()
 
 
 # ============================================================
@@ -102,18 +60,22 @@ def clear_cache():
 # ============================================================
 
 
-def generate_line_chart_plotly(tickers: List[str], days: int = 90):
-    """주가 추이 선 그래프 (Plotly 버전)"""
+def generate_line_chart_plotly(
+    tickers: List[str], days: int = 90, width_px: int = DEFAULT_CHART_WIDTH_PX
+):
+    """주가 추이 선 그래프 (Plotly 버전, 차트 폭 기준 LTTB 축소)"""
     try:
         import plotly.graph_objects as go
 
         fig = go.Figure()
         has_data = False
 
+        histories = fetch_stock_histories(tickers, days)
         for i, ticker in enumerate(tickers):
-            data = _fetch_stock_history(ticker, days)
+            data = histories.get(ticker.upper())
             if data:
                 dates, _, _, _, closes, _ = data
+                dates, closes = downsample_line(dates, closes, width_px)
                 color = COLORS[i % len(COLORS)]
                 fig.add_trace(
                     go.Scatter(
@@ -157,8 +119,10 @@ def generate_line_chart_plotly(tickers: List[str], days: int = 90):
         return None
 
 
-def generate_candlestick_chart_plotly(tickers: List[str], days: int = 60):
-    """캔들스틱 차트 (Plotly 버전)"""
+def generate_candlestick_chart_plotly(
+    tickers: List[str], days: int = 60, width_px: int = DEFAULT_CHART_WIDTH_PX
+):
+    """캔들스틱 차트 (Plotly 버전, 차트 폭 기준 OHLC 버킷 집계)"""
     try:
         import plotly.graph_objects as go
         from plotly.subplots import make_subplots
@@ -173,13 +137,16 @@ def generate_candlestick_chart_plotly(tickers: List[str], days: int = 60):
 
         has_any_data = False
 
+        histories = fetch_stock_histories(tickers, days)
         for idx, ticker in enumerate(tickers):
-            data = _fetch_stock_history(ticker, days)
+            data = histories.get(ticker.upper())
             if not data:
                 continue
 
             has_any_data = True
-            dates, opens, highs, lows, closes, _ = data
+            dates, opens, highs, lows, closes, _ = downsample_ohlcv(
+                *data, width_px=width_px
+            )
 
             fig.add_trace(
                 go.Candlestick(
@@ -214,21 +181,25 @@ def generate_candlestick_chart_plotly(tickers: List[str], days: int = 60):
         return None
 
 
-def generate_volume_chart_plotly(tickers: List[str], days: int = 60):
-    """거래량 차트 (Plotly 버전)"""
+def generate_volume_chart_plotly(
+    tickers: List[str], days: int = 60, width_px: int = DEFAULT_CHART_WIDTH_PX
+):
+    """거래량 차트 (Plotly 버전, 차트 폭 기준 LTTB 축소)"""
     try:
         import plotly.graph_objects as go
 
         fig = go.Figure()
         has_data = False
 
+        histories = fetch_stock_histories(tickers, days)
         for i, ticker in enumerate(tickers):
-            data = _fetch_stock_history(ticker, days)
+            data = histories.get(ticker.upper())
             if not data:
                 continue
 
             has_data = True
             dates, _, _, _, _, volumes = data
+            dates, volumes = downsample_line(dates, volumes, width_px)
             color = COLORS[i % len(COLORS)]
 
             fig.add_trace(
@@ -278,8 +249,9 @@ def generate_financial_chart_plotly(tickers: List[str]):
         import plotly.graph_objects as go
 
         all_data = {}
+        financials = fetch_quarterly_financials_many(tickers)
         for ticker in tickers:
-            data = _fetch_quarterly_financials(ticker)
+            data = financials.get(ticker.upper())
             if data:
                 all_data[ticker] = data
 
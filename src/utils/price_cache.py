@@ -0,0 +1,305 @@
+"""
+Price Cache - 멀티 티커 주가 데이터 일괄 수집 모듈
+- yf.download 1회 호출로 여러 티커 동시 수집 (비교 차트용)
+- 일괄 수집 실패 시 제한된 스레드 풀로 개별 수집 (fallback)
+- 가장 긴 기간을 한 번 받아두고 짧은 기간 요청은 캐시에서 잘라서 반환
+- chart_utils(matplotlib)와 plotly_charts가 같은 캐시를 공유
+"""
+
+import hashlib
+import logging
+import pickle
+import threading
+import time
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 캐시 설정
+CACHE_TTL_SECONDS = 60 * 60  # 1시간
+FAILURE_TTL_SECONDS = 30  # 수집 실패(None) 후 재시도까지의 간격
+MAX_CACHED_TICKERS = 200
+MAX_FETCH_WORKERS = 8  # 개별 수집 fallback 동시 실행 수
+DEFAULT_PREFETCH_DAYS = 180  # 리포트 차트 중 가장 긴 기간 (라인 차트)
+
+# ticker -> (fetched_at, days, (dates, opens, highs, lows, closes, volumes))
+_history_cache: Dict[str, Tuple[float, int, Tuple]] = {}
+_cache_lock = threading.Lock()
+
+
+# ============================================================
+# 내부 유틸
+# ============================================================
+
+
+def _normalize_tickers(tickers) -> List[str]:
+    """문자열/리스트 입력을 중복 없는 대문자 티커 리스트로 변환"""
+    if isinstance(tickers, str):
+        tickers = [tickers]
+    seen = []
+    for t in tickers:
+        t = (t or "").strip().upper()
+        if t and t not in seen:
+            seen.append(t)
+    return seen
+
+
+def _naive(dt):
+    """tz-aware 날짜를 naive로 변환 (기간 비교용)"""
+    return dt.replace(tzinfo=None) if getattr(dt, "tzinfo", None) else dt
+
+
+def _frame_to_tuple(df) -> Optional[Tuple]:
+    """OHLCV DataFrame -> 차트 모듈이 사용하는 튜플 형식"""
+    if df is None or df.empty:
+        return None
+    df = df.dropna(subset=["Close"])
+    if df.empty:
+        return None
+    return (
+        tuple(df.index.tolist()),
+        tuple(df["Open"].tolist()),
+        tuple(df["High"].tolist()),
+        tuple(df["Low"].tolist()),
+        tuple(df["Close"].tolist()),
+        tuple(df["Volume"].fillna(0).tolist()),
+    )
+
+
+def _slice_history(data: Tuple, days: int) -> Optional[Tuple]:
+    """캐시된 긴 기간 데이터에서 최근 N일만 잘라서 반환"""
+    cutoff = (datetime.now() - timedelta(days=days)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    dates = data[0]
+    start = 0
+    while start < len(dates) and _naive(dates[start]) < cutoff:
+        start += 1
+    if start >= len(dates):
+        return None
+    if start == 0:
+        return data
+    return tuple(col[start:] for col in data)
+
+
+def data_fingerprint(*parts) -> str:
+    """데이터 내용 기반 지문 (차트/지표 캐시 키용, 내용이 같으면 같은 값)"""
+    h = hashlib.sha1()
+    for part in parts:
+        h.update(pickle.dumps(part, protocol=4))
+    return h.hexdigest()
+
+
+def _get_cached(ticker: str, days: int) -> Tuple[bool, Optional[Tuple]]:
+    """캐시 조회 -> (hit 여부, 데이터)"""
+    with _cache_lock:
+        entry = _history_cache.get(ticker)
+    if not entry:
+        return False, None
+    fetched_at, cached_days, data = entry
+    # 데이터 없음도 짧게 캐시 (존재하지 않는 티커 반복 조회 방지, 일시 장애는 곧 재시도)
+    ttl = FAILURE_TTL_SECONDS if data is None else CACHE_TTL_SECONDS
+    if time.time() - fetched_at > ttl or cached_days < days:
+        return False, None
+    if data is None:
+        return True, None
+    return True, _slice_history(data, days)
+
+
+def _store(ticker: str, days: int, data: Optional[Tuple]) -> None:
+    with _cache_lock:
+        if len(_history_cache) >= MAX_CACHED_TICKERS and ticker not in _history_cache:
+            oldest = min(_history_cache, key=lambda k: _history_cache[k][0])
+            _history_cache.pop(oldest, None)
+        _history_cache[ticker] = (time.time(), days, data)
+
+
+# ============================================================
+# DATA FETCHING (일괄 + fallback)
+# ============================================================
+
+
+def _download_batch(tickers: List[str], days: int) -> Dict[str, Optional[Tuple]]:
+    """yf.download 1회 호출로 여러 티커 수집"""
+    import pandas as pd
+    import yfinance as yf
+
+    end_d = datetime.now()
+    start_d = end_d - timedelta(days=days)
+    df = yf.download(
+        tickers,
+        start=start_d,
+        end=end_d,
+        group_by="ticker",
+        auto_adjust=True,
+        threads=True,
+        progress=False,
+    )
+
+    results = {}
+    if df is None or df.empty:
+        return {t: None for t in tickers}
+
+    if isinstance(df.columns, pd.MultiIndex):
+        available = set(df.columns.get_level_values(0))
+        for t in tickers:
+            results[t] = _frame_to_tuple(df[t]) if t in available else None
+    else:
+        # 구버전 yfinance: 단일 티커는 평면 컬럼으로 반환
+        results[tickers[0]] = _frame_to_tuple(df)
+    return results
+
+
+def _download_single(ticker: str, days: int) -> Optional[Tuple]:
+    """단일 티커 수집 (fallback)"""
+    try:
+        import yfinance as yf
+
+        end_d = datetime.now()
+        start_d = end_d - timedelta(days=days)
+        return _frame_to_tuple(yf.Ticker(ticker).history(start=start_d, end=end_d))
+    except Exception as e:
+        logger.warning(f"Stock data fetch failed for {ticker}: {e}")
+        return None
+
+
+def fetch_stock_histories(tickers: List[str], days: int) -> Dict[str, Optional[Tuple]]:
+    """
+    여러 티커의 주가 데이터를 한 번에 조회 (캐시 우선)
+
+    캐시에 없는 티커만 모아 yf.download 1회로 수집하고, 일괄 수집이
+    실패하면 제한된 스레드 풀로 개별 수집합니다.
+
+    Args:
+        tickers: 티커 목록 (단일 문자열 허용)
+        days: 조회 기간 (일)
+
+    Returns:
+        {ticker: (dates, opens, highs, lows, closes, volumes) 또는 None}
+        (입력 티커 순서 유지)
+    """
+    tickers = _normalize_tickers(tickers)
+    results: Dict[str, Optional[Tuple]] = {}
+    missing = []
+
+    for t in tickers:
+        hit, data = _get_cached(t, days)
+        if hit:
+            results[t] = data
+        else:
+            missing.append(t)
+
+    if missing:
+        fetched: Dict[str, Optional[Tuple]] = {}
+        try:
+            fetched = _download_batch(missing, days)
+        except Exception as e:
+            logger.warning(f"Batch download failed ({', '.join(missing)}): {e}")
+
+        # 일괄 수집에서 빠진 티커는 개별 수집
+        retry = [t for t in missing if fetched.get(t) is None]
+        if retry:
+            workers = min(MAX_FETCH_WORKERS, len(retry))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for t, data in zip(
+                    retry, executor.map(lambda x: _download_single(x, days), retry)
+                ):
+                    fetched[t] = data
+
+        for t in missing:
+            data = fetched.get(t)
+            _store(t, days, data)
+            results[t] = data
+
+    return {t: results.get(t) for t in tickers}
+
+
+def fetch_stock_history(ticker: str, days: int) -> Optional[Tuple]:
+    """단일 티커 주가 데이터 조회 (캐시 공유)"""
+    ticker = ticker.strip().upper()
+    return fetch_stock_histories([ticker], days).get(ticker)
+
+
+@lru_cache(maxsize=20)
+def fetch_quarterly_financials(ticker: str) -> Optional[Tuple]:
+    """분기별 재무 데이터 캐싱"""
+    try:
+        import yfinance as yf
+
+        stock = yf.Ticker(ticker)
+        quarterly = stock.quarterly_financials
+        if quarterly.empty:
+            return None
+
+        revenue_row = net_income_row = None
+        for idx in quarterly.index:
+            idx_lower = str(idx).lower()
+            if "revenue" in idx_lower or "total revenue" in idx_lower:
+                revenue_row = idx
+            if "net income" in idx_lower:
+                net_income_row = idx
+
+        if revenue_row is None:
+            return None
+
+        quarters = quarterly.columns[:8][::-1]
+        revenue = quarterly.loc[revenue_row, quarters].values / 1e9
+        net_income = (
+            quarterly.loc[net_income_row, quarters].values / 1e9
+            if net_income_row
+            else None
+        )
+        quarter_labels = tuple(
+            q.strftime("%Y Q").replace("Q", f"Q{(q.month-1)//3+1}") for q in quarters
+        )
+        return (
+            quarter_labels,
+            tuple(revenue),
+            tuple(net_income) if net_income is not None else None,
+        )
+    except Exception as e:
+        logger.warning(f"Financial data fetch failed for {ticker}: {e}")
+        return None
+
+
+def fetch_quarterly_financials_many(tickers: List[str]) -> Dict[str, Optional[Tuple]]:
+    """여러 티커의 분기 재무 데이터를 병렬 조회 (입력 순서 유지)"""
+    tickers = _normalize_tickers(tickers)
+    if not tickers:
+        return {}
+    workers = min(MAX_FETCH_WORKERS, len(tickers))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(tickers, executor.map(fetch_quarterly_financials, tickers)))
+
+
+def prefetch_chart_data(
+    tickers: List[str], days: int = DEFAULT_PREFETCH_DAYS, include_financials: bool = True
+) -> None:
+    """
+    리포트 차트 생성 전 데이터 미리 채우기
+
+    가장 긴 기간을 1회 일괄 수집해두면 이후 라인/캔들/거래량 차트는
+    캐시에서 기간만 잘라 사용하므로 티커 수와 무관하게 다운로드가 1회로 끝납니다.
+    """
+    tickers = _normalize_tickers(tickers)
+    if not tickers:
+        return
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(fetch_stock_histories, tickers, days)]
+        if include_financials:
+            futures.append(executor.submit(fetch_quarterly_financials_many, tickers))
+        for f in futures:
+            try:
+                f.result()
+            except Exception as e:
+                logger.warning(f"Chart data prefetch failed: {e}")
+
+
+def clear_cache():
+    """주가/재무 캐시 초기화"""
+    with _cache_lock:
+        _history_cache.clear()
+    fetch_quarterly_financials.cache_clear()
@@ -0,0 +1,283 @@
+"""
+Rate Limiter - 우선순위 토큰 버킷
+- 프로세스 전역 토큰 버킷 (Finnhub 무료 플랜 60 calls/min 기준)
+- 선택적으로 SQLite 파일에 버킷 상태를 저장해 여러 워커/스케줄러가 같은 예산을 공유
+- 대화형 요청(INTERACTIVE)이 백그라운드 작업(BACKGROUND)보다 먼저 토큰을 받고,
+  백그라운드는 예약분(reserve)을 남겨두고만 소비
+- 토큰이 없으면 실패하지 않고 대기열에서 기다림 (timeout 지정 시에만 False)
+- remaining()으로 남은 예산을 조회해 선택적 엔드포인트(peers, recommendations)를 생략
+- acquire_async()로 비동기 클라이언트도 스레드 없이 같은 예산을 사용
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 (숫자가 작을수록 먼저 처리)
+INTERACTIVE = 0
+BACKGROUND = 1
+
+FINNHUB_RATE_PER_MINUTE = float(os.getenv("FINNHUB_RATE_PER_MINUTE", "60"))
+# 설정 시 해당 SQLite 파일로 버킷 공유 (예: data/rate_limit.db)
+RATE_LIMIT_DB = os.getenv("RATE_LIMIT_DB")
+BACKGROUND_RESERVE_RATIO = 0.2  # 백그라운드 작업이 건드리지 않는 예산 비율
+
+_priority: ContextVar[int] = ContextVar("request_priority", default=INTERACTIVE)
+
+
+@contextmanager
+def request_priority(level: int):
+    """with 블록 안의 API 호출 우선순위 지정 (스케줄러 등 백그라운드 작업용)"""
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> int:
+    """현재 컨텍스트의 요청 우선순위"""
+    return _priority.get()
+
+
+class TokenBucket:
+    """
+    우선순위 대기열을 가진 토큰 버킷
+
+    Args:
+        name: 버킷 이름 (SQLite 공유 시 키)
+        rate_per_minute: 분당 충전 토큰 수
+        capacity: 최대 토큰 수 (기본: rate_per_minute)
+        db_path: SQLite 파일 경로 (None이면 프로세스 메모리)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate_per_minute: float,
+        capacity: Optional[float] = None,
+        db_path: Optional[str] = None,
+    ):
+        self.name = name
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self.reserve = self.capacity * BACKGROUND_RESERVE_RATIO
+        self._tokens = self.capacity
+        self._updated = time.time()
+
+        self._cond = threading.Condition()
+        self._waiters = []  # heap of (priority, seq)
+        self._seq = itertools.count()
+
+        self._db = None
+        if db_path:
+            self._db = self._open_db(db_path)
+
+    # ------------------------------------------------------------------
+    # 상태 저장소 (메모리 / SQLite)
+    # ------------------------------------------------------------------
+
+    def _open_db(self, db_path: str) -> Optional[sqlite3.Connection]:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            # 모든 접근은 self._cond 안에서 일어나므로 연결 1개를 스레드 간 공유
+            db = sqlite3.connect(
+                db_path, timeout=5, isolation_level=None, check_same_thread=False
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS token_buckets "
+                "(name TEXT PRIMARY KEY, tokens REAL, updated REAL)"
+            )
+            db.execute(
+                "INSERT OR IGNORE INTO token_buckets VALUES (?, ?, ?)",
+                (self.name, self.capacity, time.time()),
+            )
+            return db
+        except sqlite3.Error as e:
+            logger.warning(f"Rate limit DB unavailable ({db_path}), using memory: {e}")
+            return None
+
+    def _refill(self, tokens: float, updated: float, now: float) -> float:
+        return min(self.capacity, tokens + (now - updated) * self.rate)
+
+    def _take(self, needed: float, consume: float) -> float:
+        """
+        needed개 이상 있으면 consume개 차감
+
+        Returns:
+            0이면 성공, 아니면 필요한 토큰이 쌓일 때까지의 대기 시간(초)
+        """
+        now = time.time()
+        if self._db is None:
+            tokens = self._refill(self._tokens, self._updated, now)
+            self._updated = now
+            if tokens >= needed:
+                self._tokens = tokens - consume
+                return 0.0
+            self._tokens = tokens
+            return (needed - tokens) / self.rate
+
+        try:
+            self._db.execute("BEGIN IMMEDIATE")
+            row = self._db.execute(
+                "SELECT tokens, updated FROM token_buckets WHERE name = ?", (self.name,)
+            ).fetchone()
+            tokens = self._refill(row[0], row[1], now) if row else self.capacity
+            wait = 0.0 if tokens >= needed else (needed - tokens) / self.rate
+            if wait == 0.0:
+                tokens -= consume
+            self._db.execute(
+                "INSERT OR REPLACE INTO token_buckets VALUES (?, ?, ?)",
+                (self.name, tokens, now),
+            )
+            self._db.execute("COMMIT")
+            return wait
+        except sqlite3.Error as e:
+            logger.warning(f"Rate limit DB error, falling back to memory: {e}")
+            try:
+                self._db.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            self._db = None
+            return self._take(needed, consume)
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+
+    def acquire(
+        self, priority: Optional[int] = None, timeout: Optional[float] = None
+    ) -> bool:
+        """
+        토큰 1개 획득 (없으면 우선순위 순서대로 대기)
+
+        Args:
+            priority: INTERACTIVE / BACKGROUND (기본: 현재 컨텍스트 우선순위)
+            timeout: 최대 대기 시간(초), None이면 무제한
+
+        Returns:
+            획득 성공 여부 (timeout 초과 시 False)
+        """
+        priority = current_priority() if priority is None else priority
+        deadline = None if timeout is None else time.monotonic() + timeout
+        needed = 1.0 + (self.reserve if priority > INTERACTIVE else 0.0)
+
+        with self._cond:
+            ticket = (priority, next(self._seq))
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    wait = None
+                    if self._waiters[0] == ticket:
+                        wait = self._take(needed, 1.0)
+                        if wait == 0.0:
+                            return True
+
+                    if deadline is not None:
+                        left = deadline - time.monotonic()
+                        if left <= 0:
+                            return False
+                        wait = left if wait is None else min(wait, left)
+                    self._cond.wait(wait)
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    def try_acquire(self, priority: Optional[int] = None) -> float:
+        """
+        대기 없이 토큰 1개 획득 시도
+
+        Returns:
+            0이면 성공, 아니면 다시 시도하기까지의 대기 시간(초)
+        """
+        priority = current_priority() if priority is None else priority
+        needed = 1.0 + (self.reserve if priority > INTERACTIVE else 0.0)
+        with self._cond:
+            # 같거나 높은 우선순위로 먼저 기다리는 동기 요청에 양보
+            if self._waiters and self._waiters[0][0] <= priority:
+                return 1.0 / self.rate
+            return self._take(needed, 1.0)
+
+    async def acquire_async(
+        self, priority: Optional[int] = None, timeout: Optional[float] = None
+    ) -> bool:
+        """acquire()의 비동기 버전 (이벤트 루프를 막지 않고 sleep으로 대기)"""
+        priority = current_priority() if priority is None else priority
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(priority)
+            if wait == 0.0:
+                return True
+            if deadline is not None:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return False
+                wait = min(wait, left)
+            await asyncio.sleep(wait)
+
+    def remaining(self) -> float:
+        """현재 사용 가능한 토큰 수 (대기 중인 요청 수 차감)"""
+        with self._cond:
+            self._take(float("inf"), 0.0)
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT tokens FROM token_buckets WHERE name = ?", (self.name,)
+                ).fetchone()
+                tokens = row[0] if row else self.capacity
+            else:
+                tokens = self._tokens
+            return max(0.0, tokens - len(self._waiters))
+
+    def drain(self) -> None:
+        """서버가 429를 반환했을 때 로컬 예산을 0으로 맞춤"""
+        with self._cond:
+            now = time.time()
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "UPDATE token_buckets SET tokens = 0, updated = ? WHERE name = ?",
+                        (now, self.name),
+                    )
+                    return
+                except sqlite3.Error:
+                    pass
+            self._tokens = 0.0
+            self._updated = now
+
+    def stats(self) -> Dict:
+        """상태 요약 (모니터링/로그용)"""
+        return {
+            "name": self.name,
+            "remaining": round(self.remaining(), 2),
+            "capacity": self.capacity,
+            "rate_per_minute": self.rate * 60,
+            "waiting": len(self._waiters),
+            "shared": self._db is not None,
+        }
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    name: str = "finnhub", rate_per_minute: float = FINNHUB_RATE_PER_MINUTE
+) -> TokenBucket:
+    """이름별 프로세스 공유 토큰 버킷"""
+    with _buckets_lock:
+        bucket = _buckets.get(name)
+        if bucket is None:
+            bucket = TokenBucket(name, rate_per_minute, db_path=RATE_LIMIT_DB)
+            _buckets[name] = bucket
+        return bucket
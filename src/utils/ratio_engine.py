@@ -0,0 +1,339 @@
+"""
+Ratio Engine - 전 기업 재무비율 패널 벡터화 계산 및 스냅샷 저장
+- 연간 재무 데이터 전체를 한 번에 열 단위로 계산 (iterrows 없음)
+- 수익성/안정성 비율, 전년 대비 성장률(YoY), 3년 CAGR, 분기 합산 TTM
+- 결과는 DuckDB 미러 디렉터리에 financial_ratios 테이블(Parquet)로 저장
+  → 홈 대시보드, 리포트, TextToSQL이 동일한 스냅샷을 직접 조회
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    from sql.duckdb_mirror import get_mirror
+except ImportError:
+    from src.sql.duckdb_mirror import get_mirror
+
+logger = logging.getLogger(__name__)
+
+RATIO_TABLE = "financial_ratios"
+CAGR_YEARS = 3
+TTM_QUARTERS = 4
+FALLBACK_TTL_SECONDS = 3600  # 스냅샷이 없을 때 Supabase에서 계산한 패널 유지 시간
+
+# 비율명 -> (분자, 분모) : 분모가 0 이하이면 NaN
+RATIO_DEFINITIONS = {
+    "profit_margin": ("net_income", "revenue"),
+    "operating_margin": ("operating_income", "revenue"),
+    "gross_margin": ("gross_profit", "revenue"),
+    "roe": ("net_income", "stockholders_equity"),
+    "roa": ("net_income", "total_assets"),
+    "debt_to_equity": ("total_liabilities", "stockholders_equity"),
+    "asset_turnover": ("revenue", "total_assets"),
+    "ocf_margin": ("operating_cash_flow", "revenue"),
+}
+
+GROWTH_COLUMNS = ("revenue", "operating_income", "net_income", "eps")
+CAGR_COLUMNS = ("revenue", "net_income")
+TTM_COLUMNS = ("revenue", "operating_income", "net_income", "eps", "operating_cash_flow")
+# Supabase fallback에서 조회하는 annual_reports 컬럼 (비율/성장률 계산 입력만)
+ANNUAL_INPUT_COLUMNS = ["company_id", "fiscal_year"] + sorted(
+    {col for pair in RATIO_DEFINITIONS.values() for col in pair}
+    | set(GROWTH_COLUMNS)
+    | set(CAGR_COLUMNS)
+)
+# 패널에 붙이는 기업 정보 (스크리닝 섹터/산업 필터·백분위에 필요)
+COMPANY_INFO_COLUMNS = "id, ticker, company_name, sector, industry"
+
+_cache: Dict[str, object] = {"panel": None, "key": None}
+_cache_lock = threading.Lock()
+
+
+# ============================================================
+# 벡터화 계산
+# ============================================================
+
+
+def safe_divide(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+    """분모가 0 이하 또는 결측이면 NaN (기존 스칼라 계산 규칙과 동일)"""
+    num = pd.to_numeric(numerator, errors="coerce")
+    den = pd.to_numeric(denominator, errors="coerce")
+    return num / den.where(den > 0)
+
+
+def compute_basic_ratios(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    연간 재무 행 전체에 비율 열 추가
+
+    입력에 없는 재무 항목의 비율은 건너뜁니다.
+    """
+    out = df.copy()
+    for name, (num, den) in RATIO_DEFINITIONS.items():
+        if num in out.columns and den in out.columns:
+            out[name] = safe_divide(out[num], out[den])
+    return out
+
+
+def compute_growth(df: pd.DataFrame, key: str = "company_id") -> pd.DataFrame:
+    """
+    YoY 성장률과 CAGR 계산 (기업별 연도순 정렬 후 shift)
+
+    직전 행이 정확히 전년도(또는 N년 전)일 때만 값을 채웁니다.
+    """
+    out = df.sort_values([key, "fiscal_year"]).reset_index(drop=True)
+    grouped = out.groupby(key, sort=False)
+    year = out["fiscal_year"]
+
+    prev_year = grouped["fiscal_year"].shift(1)
+    consecutive = prev_year == year - 1
+    for col in GROWTH_COLUMNS:
+        if col not in out.columns:
+            continue
+        cur = pd.to_numeric(out[col], errors="coerce")
+        prev = grouped[col].shift(1).astype(float)
+        growth = (cur - prev) / prev.abs().where(prev != 0)
+        out[f"{col}_growth"] = growth.where(consecutive)
+
+    base_year = grouped["fiscal_year"].shift(CAGR_YEARS)
+    spaced = base_year == year - CAGR_YEARS
+    for col in CAGR_COLUMNS:
+        if col not in out.columns:
+            continue
+        cur = pd.to_numeric(out[col], errors="coerce")
+        base = grouped[col].shift(CAGR_YEARS).astype(float)
+        valid = spaced & (cur > 0) & (base > 0)
+        ratio = (cur / base).where(valid)
+        out[f"{col}_cagr_{CAGR_YEARS}y"] = np.power(ratio, 1.0 / CAGR_YEARS) - 1
+
+    return out
+
+
+def compute_ttm(quarterly: pd.DataFrame, key: str = "company_id") -> pd.DataFrame:
+    """
+    분기 데이터로 TTM(최근 4개 분기 합계) 계산
+
+    연속된 4개 분기가 있을 때만 값을 채우며, 회계연도별 마지막 분기 기준 값을 반환합니다.
+
+    Returns:
+        DataFrame(key, fiscal_year, ttm_period_ended, ttm_<항목>...)
+    """
+    if quarterly is None or quarterly.empty:
+        return pd.DataFrame()
+
+    q = quarterly.copy()
+    q["_qidx"] = q["fiscal_year"].astype(int) * 4 + q["fiscal_quarter"].astype(int)
+    q = q.sort_values([key, "_qidx"]).drop_duplicates([key, "_qidx"], keep="last")
+    q = q.reset_index(drop=True)
+    grouped = q.groupby(key, sort=False)
+
+    span = q["_qidx"] - grouped["_qidx"].shift(TTM_QUARTERS - 1)
+    complete = span == TTM_QUARTERS - 1
+
+    result = q[[key, "fiscal_year"]].copy()
+    result["ttm_period_ended"] = q.get("period_ended")
+    for col in TTM_COLUMNS:
+        if col not in q.columns:
+            continue
+        values = pd.to_numeric(q[col], errors="coerce")
+        rolled = (
+            values.groupby(q[key], sort=False)
+            .rolling(TTM_QUARTERS, min_periods=TTM_QUARTERS)
+            .sum()
+            .reset_index(level=0, drop=True)
+        )
+        result[f"ttm_{col}"] = rolled.where(complete)
+
+    return result.groupby([key, "fiscal_year"], sort=False).tail(1).reset_index(drop=True)
+
+
+def compute_ratio_panel(
+    annual: pd.DataFrame,
+    quarterly: Optional[pd.DataFrame] = None,
+    companies: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """
+    전 기업 x 전 연도 재무비율 패널 계산 (1회 패스)
+
+    Args:
+        annual: annual_reports 행 (company_id, fiscal_year, 재무 항목)
+        quarterly: quarterly_reports 행 (TTM 계산용, 선택)
+        companies: companies 행 (ticker/company_name/sector/industry 부착용, 선택)
+
+    Returns:
+        (company_id, fiscal_year) 단위 DataFrame
+    """
+    if annual is None or annual.empty:
+        return pd.DataFrame()
+
+    key = "company_id" if "company_id" in annual.columns else "ticker"
+    panel = annual.drop_duplicates([key, "fiscal_year"], keep="last")
+    panel = compute_growth(compute_basic_ratios(panel), key=key)
+
+    if quarterly is not None and not quarterly.empty and key in quarterly.columns:
+        ttm = compute_ttm(quarterly, key=key)
+        if not ttm.empty:
+            panel = panel.merge(ttm, on=[key, "fiscal_year"], how="left")
+            if "ttm_revenue" in panel.columns and "ttm_net_income" in panel.columns:
+                panel["ttm_profit_margin"] = safe_divide(
+                    panel["ttm_net_income"], panel["ttm_revenue"]
+                )
+
+    if companies is not None and not companies.empty and key == "company_id":
+        info_cols = [
+            c for c in ("ticker", "company_name", "sector", "industry") if c in companies.columns
+        ]
+        info = companies[["id"] + info_cols].rename(columns={"id": "company_id"})
+        panel = panel.drop(columns=[c for c in info_cols if c in panel.columns])
+        panel = panel.merge(info, on="company_id", how="left")
+
+    drop_cols = [c for c in ("id", "created_at", "updated_at") if c in panel.columns]
+    return panel.drop(columns=drop_cols).sort_values(
+        ["fiscal_year", key], ascending=[False, True]
+    ).reset_index(drop=True)
+
+
+# ============================================================
+# 스냅샷 (materialized table)
+# ============================================================
+
+
+def materialize_ratio_panel(mirror=None) -> int:
+    """
+    DuckDB 미러의 원본 테이블로 비율 패널을 계산하여 financial_ratios 스냅샷 저장
+
+    Returns:
+        저장된 행 수 (원본 스냅샷이 없으면 0)
+    """
+    mirror = mirror or get_mirror()
+    tables = mirror.read_tables(["annual_reports", "quarterly_reports", "companies"])
+    annual = tables.get("annual_reports")
+    if annual is None or annual.empty:
+        logger.warning("annual_reports snapshot not found; ratio panel not materialized")
+        return 0
+
+    start = time.perf_counter()
+    panel = compute_ratio_panel(
+        annual, tables.get("quarterly_reports"), tables.get("companies")
+    )
+    rows = mirror.write_derived(RATIO_TABLE, panel)
+    logger.info(
+        f"Materialized {RATIO_TABLE}: {rows} rows in {time.perf_counter() - start:.2f}s"
+    )
+    clear_cache()
+    return rows
+
+
+def _load_from_supabase() -> pd.DataFrame:
+    """스냅샷이 없을 때 Supabase 연간 데이터로 직접 계산 (분기 TTM 제외, 섹터/산업 포함)"""
+    try:
+        from data.supabase_client import SupabaseClient
+    except ImportError:
+        from src.data.supabase_client import SupabaseClient
+
+    annual = SupabaseClient.get_annual_reports(columns=", ".join(ANNUAL_INPUT_COLUMNS))
+    companies = SupabaseClient.get_all_companies(columns=COMPANY_INFO_COLUMNS)
+    return compute_ratio_panel(annual, companies=companies)
+
+
+def load_ratio_panel() -> pd.DataFrame:
+    """
+    재무비율 패널 조회
+
+    financial_ratios 스냅샷이 있으면 파일 수정 시각 기준으로 캐싱하여 사용하고,
+    없으면 Supabase 데이터로 계산한 결과를 FALLBACK_TTL_SECONDS 동안 캐싱합니다.
+    """
+    mirror = get_mirror()
+    path = mirror.table_path(RATIO_TABLE)
+    try:
+        key = ("snapshot", os.path.getmtime(path))
+    except OSError:
+        key = ("supabase", int(time.time() // FALLBACK_TTL_SECONDS))
+
+    with _cache_lock:
+        if _cache["key"] == key and _cache["panel"] is not None:
+            return _cache["panel"]
+
+    try:
+        if key[0] == "snapshot":
+            panel = mirror.read_tables([RATIO_TABLE]).get(RATIO_TABLE, pd.DataFrame())
+        else:
+            panel = _load_from_supabase()
+    except Exception as e:
+        logger.warning(f"Ratio panel load failed: {e}")
+        return pd.DataFrame()
+
+    with _cache_lock:
+        _cache["panel"] = panel
+        _cache["key"] = key
+    return panel
+
+
+def clear_cache():
+    """비율 패널 메모리 캐시 초기화"""
+    with _cache_lock:
+        _cache["panel"] = None
+        _cache["key"] = None
+
+
+# ============================================================
+# 조회 헬퍼 (대시보드 / 리포트)
+# ============================================================
+
+
+def get_company_ratios(ticker: str, years: int = 3) -> List[Dict]:
+    """특정 기업의 최근 N개 연도 비율 (최신 연도 우선)"""
+    panel = load_ratio_panel()
+    if panel.empty or "ticker" not in panel.columns:
+        return []
+    rows = panel[panel["ticker"] == ticker.upper()]
+    rows = rows.sort_values("fiscal_year", ascending=False).head(years)
+    return rows.replace({np.nan: None}).to_dict("records")
+
+
+def top_companies(
+    metric: str = "revenue", year: Optional[int] = None, limit: int = 20
+) -> pd.DataFrame:
+    """특정 연도 지표 상위 기업 (year 미지정 시 최신 연도)"""
+    panel = load_ratio_panel()
+    if panel.empty or metric not in panel.columns:
+        return pd.DataFrame()
+    if year is None:
+        year = int(panel["fiscal_year"].max())
+    rows = panel[(panel["fiscal_year"] == year) & panel[metric].notna()]
+    return rows.nlargest(limit, metric).reset_index(drop=True)
+
+
+def format_ratio_summary(rows: List[Dict]) -> str:
+    """비율 행을 리포트/챗봇 컨텍스트용 텍스트로 변환"""
+
+    def _pct(value) -> str:
+        return f"{value:.1%}" if value is not None else "N/A"
+
+    def _num(value) -> str:
+        return f"{value:.2f}" if value is not None else "N/A"
+
+    lines = []
+    for row in rows:
+        lines.append(f"\n### {row.get('fiscal_year')}년")
+        lines.append(
+            f"- 순이익률: {_pct(row.get('profit_margin'))} / 영업이익률: {_pct(row.get('operating_margin'))}"
+            f" / ROE: {_pct(row.get('roe'))} / ROA: {_pct(row.get('roa'))}"
+        )
+        lines.append(
+            f"- 부채비율(D/E): {_num(row.get('debt_to_equity'))} / 자산회전율: {_num(row.get('asset_turnover'))}"
+        )
+        lines.append(
+            f"- 매출 성장률(YoY): {_pct(row.get('revenue_growth'))} / 순이익 성장률(YoY): {_pct(row.get('net_income_growth'))}"
+            f" / 매출 {CAGR_YEARS}년 CAGR: {_pct(row.get(f'revenue_cagr_{CAGR_YEARS}y'))}"
+        )
+        if row.get("ttm_revenue") is not None:
+            lines.append(
+                f"- TTM 매출: {row['ttm_revenue']:,.0f} / TTM 순이익: {row.get('ttm_net_income') or 0:,.0f}"
+            )
+    return "\n".join(lines)
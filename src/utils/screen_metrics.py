@@ -0,0 +1,22 @@
+"""
+Screen Metrics - 스크리닝 지표 목록
+- screening 엔진과 챗봇 도구 스키마(rag.chat_tools)가 함께 사용
+- 의존성 없는 상수 모듈 (스키마 생성 시 pandas/numpy import 방지)
+"""
+
+SCREEN_METRICS = (
+    "revenue",
+    "net_income",
+    "profit_margin",
+    "operating_margin",
+    "gross_margin",
+    "roe",
+    "roa",
+    "debt_to_equity",
+    "asset_turnover",
+    "revenue_growth",
+    "operating_income_growth",
+    "net_income_growth",
+    "eps_growth",
+    "revenue_cagr_3y",
+)
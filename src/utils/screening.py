@@ -0,0 +1,380 @@
+"""
+Screening Engine - S&P 500 동종업계 백분위 스크리닝
+- 재무비율 패널(ratio_engine)로 지표 x 연도 x 섹터/산업별 백분위 순위를 미리 계산
+- 그룹별 정렬 배열을 보관하여 임의 값의 백분위/중앙값을 searchsorted로 즉시 조회
+- 다중 조건 스크리닝 ("ROE 상위 10%, D/E < 1, 매출 성장률 > 10%")을 불리언 마스크로 처리
+- 백분위는 '높을수록 좋음' 기준 점수 (부채비율처럼 낮을수록 좋은 지표는 반전)
+"""
+
+import logging
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from utils.ratio_engine import load_ratio_panel
+    from utils.screen_metrics import SCREEN_METRICS
+except ImportError:
+    from src.utils.ratio_engine import load_ratio_panel
+    from src.utils.screen_metrics import SCREEN_METRICS
+
+logger = logging.getLogger(__name__)
+
+LOWER_IS_BETTER = {"debt_to_equity"}
+SCOPES = {"all": None, "sector": "sector", "industry": "industry"}
+
+METRIC_ALIASES = {
+    "d/e": "debt_to_equity",
+    "de": "debt_to_equity",
+    "leverage": "debt_to_equity",
+    "부채비율": "debt_to_equity",
+    "margin": "profit_margin",
+    "net margin": "profit_margin",
+    "순이익률": "profit_margin",
+    "operating margin": "operating_margin",
+    "영업이익률": "operating_margin",
+    "growth": "revenue_growth",
+    "revenue growth": "revenue_growth",
+    "sales growth": "revenue_growth",
+    "매출 성장률": "revenue_growth",
+    "매출성장률": "revenue_growth",
+    "earnings growth": "net_income_growth",
+    "cagr": "revenue_cagr_3y",
+    "매출": "revenue",
+    "sales": "revenue",
+}
+
+METRIC_LABELS = {
+    "revenue": "매출",
+    "net_income": "순이익",
+    "profit_margin": "순이익률",
+    "operating_margin": "영업이익률",
+    "gross_margin": "매출총이익률",
+    "roe": "ROE",
+    "roa": "ROA",
+    "debt_to_equity": "부채비율(D/E)",
+    "asset_turnover": "자산회전율",
+    "revenue_growth": "매출 성장률",
+    "operating_income_growth": "영업이익 성장률",
+    "net_income_growth": "순이익 성장률",
+    "eps_growth": "EPS 성장률",
+    "revenue_cagr_3y": "매출 3년 CAGR",
+}
+
+_OPS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "==": np.equal,
+}
+
+_engine_cache: Dict[str, object] = {"panel": None, "engine": None}
+_engine_lock = threading.Lock()
+
+
+def pct_column(metric: str, scope: str = "sector") -> str:
+    """백분위 점수 열 이름"""
+    return f"{metric}_pct_{scope}"
+
+
+class ScreeningEngine:
+    """재무비율 패널 기반 백분위/스크리닝 엔진 (생성 시 1회 사전 계산)"""
+
+    def __init__(self, panel: pd.DataFrame):
+        panel = panel.reset_index(drop=True)
+        self.metrics = [m for m in SCREEN_METRICS if m in panel.columns]
+        self._sorted: Dict[Tuple, np.ndarray] = {}
+
+        numeric = panel[self.metrics].apply(pd.to_numeric, errors="coerce")
+        pct_cols = {}
+        for scope, group_col in SCOPES.items():
+            if group_col is not None and group_col not in panel.columns:
+                continue
+            keys = ["fiscal_year"] + ([group_col] if group_col else [])
+            grouped = numeric.groupby([panel[k] for k in keys])
+            for metric in self.metrics:
+                pct_cols[pct_column(metric, scope)] = grouped[metric].rank(
+                    pct=True, ascending=metric not in LOWER_IS_BETTER
+                )
+                # 그룹별 정렬 배열 (임의 값 백분위/중앙값 조회용)
+                for key, values in grouped[metric]:
+                    arr = values.to_numpy(dtype=float)
+                    arr = np.sort(arr[~np.isnan(arr)])
+                    if arr.size:
+                        key = key if isinstance(key, tuple) else (key,)
+                        self._sorted[(scope, metric) + key] = arr
+
+        self.panel = pd.concat([panel, pd.DataFrame(pct_cols)], axis=1)
+        self.years = sorted(self.panel["fiscal_year"].dropna().astype(int).unique())
+        self._year_index = {
+            int(year): idx.to_numpy()
+            for year, idx in self.panel.groupby("fiscal_year").groups.items()
+        }
+
+    @property
+    def latest_year(self) -> Optional[int]:
+        return int(self.years[-1]) if self.years else None
+
+    # ------------------------------------------------------------------
+    # 백분위 조회
+    # ------------------------------------------------------------------
+
+    def percentile_of(
+        self, metric: str, value: float, year: int, scope: str = "all", group: Optional[str] = None
+    ) -> Optional[float]:
+        """임의 값의 동종 그룹 내 백분위 점수 (0~1, 높을수록 좋음)"""
+        arr = self._sorted.get((scope, metric, year) + ((group,) if group else ()))
+        if arr is None or value is None or np.isnan(value):
+            return None
+        if metric in LOWER_IS_BETTER:
+            return float((arr.size - np.searchsorted(arr, value, side="left")) / arr.size)
+        return float(np.searchsorted(arr, value, side="right") / arr.size)
+
+    def peer_stats(
+        self, metric: str, year: int, scope: str = "all", group: Optional[str] = None
+    ) -> Dict:
+        """동종 그룹 분포 요약 (기업 수, 중앙값, 상/하위 10%)"""
+        arr = self._sorted.get((scope, metric, year) + ((group,) if group else ()))
+        if arr is None:
+            return {}
+        p10, p50, p90 = np.quantile(arr, [0.1, 0.5, 0.9])
+        return {"peers": int(arr.size), "p10": float(p10), "median": float(p50), "p90": float(p90)}
+
+    def peer_rank(
+        self, ticker: str, year: Optional[int] = None, scope: str = "sector"
+    ) -> Dict:
+        """
+        특정 기업의 지표별 동종업계 순위
+
+        Returns:
+            {"ticker", "year", "scope", "group", "metrics": {metric: {value, percentile, peers, median}}}
+        """
+        ticker = ticker.upper()
+        rows = self.panel[self.panel["ticker"] == ticker] if "ticker" in self.panel else None
+        if rows is None or rows.empty:
+            return {"ticker": ticker, "error": "재무비율 데이터가 없습니다."}
+        if year is None:
+            year = int(rows["fiscal_year"].max())
+        rows = rows[rows["fiscal_year"] == year]
+        if rows.empty:
+            return {"ticker": ticker, "error": f"{year}년 데이터가 없습니다."}
+
+        row = rows.iloc[0]
+        group_col = SCOPES.get(scope)
+        group = row.get(group_col) if group_col else None
+        if group_col and (group is None or pd.isna(group)):
+            scope, group_col, group = "all", None, None
+
+        metrics = {}
+        for metric in self.metrics:
+            value = row.get(metric)
+            if value is None or pd.isna(value):
+                continue
+            stats = self.peer_stats(metric, year, scope, group)
+            pct = row.get(pct_column(metric, scope))
+            metrics[metric] = {
+                "value": float(value),
+                "percentile": None if pd.isna(pct) else round(float(pct), 3),
+                "peers": stats.get("peers"),
+                "median": stats.get("median"),
+            }
+
+        return {
+            "ticker": ticker,
+            "company_name": row.get("company_name"),
+            "year": year,
+            "scope": scope,
+            "group": group,
+            "metrics": metrics,
+        }
+
+    # ------------------------------------------------------------------
+    # 스크리닝
+    # ------------------------------------------------------------------
+
+    def screen(
+        self,
+        criteria: List[Dict],
+        year: Optional[int] = None,
+        sector: Optional[str] = None,
+        industry: Optional[str] = None,
+        limit: int = 20,
+    ) -> pd.DataFrame:
+        """
+        다중 조건 스크리닝
+
+        Args:
+            criteria: [{"metric": "roe", "op": ">=", "value": 0.9, "percentile": True,
+                        "scope": "sector"}, {"metric": "debt_to_equity", "op": "<", "value": 1}]
+                      percentile=True이면 value는 백분위 점수(0~1)와 비교
+            year: 회계연도 (기본: 최신 연도)
+            sector / industry: 대상 그룹 제한 (대소문자 무시)
+            limit: 최대 결과 수
+
+        Returns:
+            조건을 모두 만족하는 기업 (첫 조건 지표 기준 정렬)
+
+        Raises:
+            ValueError: 지원하지 않는 조건, 또는 패널에 없는 섹터/산업 열로 필터/백분위 요청
+        """
+        year = int(year or self.latest_year or 0)
+        idx = self._year_index.get(year)
+        if idx is None:
+            return pd.DataFrame()
+        frame = self.panel.iloc[idx]
+        mask = np.ones(len(frame), dtype=bool)
+
+        for col, wanted in (("sector", sector), ("industry", industry)):
+            if not wanted:
+                continue
+            if col not in frame.columns:
+                # 그룹 필터를 건너뛰면 전체 시장이 결과로 나오므로 오류로 처리
+                raise ValueError(f"{col} 정보가 없어 '{wanted}' 필터를 적용할 수 없습니다.")
+            mask &= frame[col].fillna("").str.lower().to_numpy() == wanted.lower()
+
+        used_cols: List[str] = []
+        for c in criteria:
+            metric = resolve_metric(c.get("metric", ""))
+            op = _OPS.get(c.get("op", ">="))
+            if metric not in self.metrics or op is None:
+                raise ValueError(f"지원하지 않는 조건: {c}")
+            col = metric
+            if c.get("percentile"):
+                scope = c.get("scope", "sector")
+                if scope not in SCOPES:
+                    raise ValueError(f"지원하지 않는 백분위 기준: {scope}")
+                col = pct_column(metric, scope)
+                if col not in frame.columns:
+                    raise ValueError(
+                        f"{SCOPES[scope]} 정보가 없어 {scope} 기준 백분위를 계산할 수 없습니다."
+                    )
+            values = frame[col].to_numpy(dtype=float)
+            with np.errstate(invalid="ignore"):
+                mask &= op(values, float(c.get("value"))) & ~np.isnan(values)
+            used_cols.extend(dict.fromkeys([metric, col]))
+
+        result = frame[mask]
+        if criteria:
+            first = criteria[0]
+            metric = resolve_metric(first.get("metric", ""))
+            result = result.sort_values(
+                metric, ascending=metric in LOWER_IS_BETTER, na_position="last"
+            )
+
+        info_cols = [c for c in ("ticker", "company_name", "sector", "industry") if c in result.columns]
+        columns = info_cols + ["fiscal_year"] + list(dict.fromkeys(used_cols))
+        return result[columns].head(limit).reset_index(drop=True)
+
+
+# ============================================================
+# 조건 파싱
+# ============================================================
+
+
+def resolve_metric(name: str) -> str:
+    """지표 별칭 -> 패널 열 이름"""
+    key = name.strip().lower()
+    return METRIC_ALIASES.get(key, key.replace(" ", "_"))
+
+
+_TOP_RE = re.compile(r"^(?:top\s*(\d+(?:\.\d+)?)\s*%\s*(.+)|(.+?)\s*(?:top|상위)\s*(\d+(?:\.\d+)?)\s*%)$", re.I)
+_TOP_DECILE_RE = re.compile(r"^top\s+(decile|quartile|half)\s+(.+)$", re.I)
+_COMPARE_RE = re.compile(r"^(.+?)\s*(>=|<=|==|>|<)\s*(-?\d+(?:\.\d+)?)\s*(%?)$")
+_TOP_WORDS = {"decile": 10, "quartile": 25, "half": 50}
+
+
+def parse_criteria(text: str, scope: str = "sector") -> List[Dict]:
+    """
+    간단한 조건 문자열 파싱
+
+    예: "top decile ROE, D/E < 1, revenue growth > 10%"
+        "ROE 상위 10%, 부채비율 < 1"
+    """
+    criteria = []
+    for part in re.split(r"[,;]|\band\b", text):
+        part = part.strip()
+        if not part:
+            continue
+        m = _TOP_DECILE_RE.match(part)
+        if m:
+            top, metric = _TOP_WORDS[m.group(1).lower()], m.group(2)
+        else:
+            m = _TOP_RE.match(part)
+            if m:
+                top = float(m.group(1) or m.group(4))
+                metric = m.group(2) or m.group(3)
+            else:
+                top = None
+        if top is not None:
+            criteria.append(
+                {
+                    "metric": resolve_metric(metric),
+                    "op": ">=",
+                    "value": 1 - top / 100,
+                    "percentile": True,
+                    "scope": scope,
+                }
+            )
+            continue
+        m = _COMPARE_RE.match(part)
+        if not m:
+            raise ValueError(f"조건을 해석할 수 없습니다: {part}")
+        value = float(m.group(3)) / (100 if m.group(4) else 1)
+        criteria.append({"metric": resolve_metric(m.group(1)), "op": m.group(2), "value": value})
+    return criteria
+
+
+# ============================================================
+# PUBLIC API (챗봇 도구 / 대시보드)
+# ============================================================
+
+
+def get_engine() -> Optional[ScreeningEngine]:
+    """비율 패널이 바뀔 때만 엔진 재구축"""
+    panel = load_ratio_panel()
+    if panel is None or panel.empty:
+        return None
+    with _engine_lock:
+        if _engine_cache["panel"] is panel:
+            return _engine_cache["engine"]
+    engine = ScreeningEngine(panel)
+    with _engine_lock:
+        _engine_cache["panel"] = panel
+        _engine_cache["engine"] = engine
+    return engine
+
+
+def screen_companies(
+    criteria,
+    year: Optional[int] = None,
+    sector: Optional[str] = None,
+    industry: Optional[str] = None,
+    limit: int = 20,
+) -> pd.DataFrame:
+    """조건(딕셔너리 목록 또는 문자열)으로 기업 스크리닝"""
+    engine = get_engine()
+    if engine is None:
+        return pd.DataFrame()
+    if isinstance(criteria, str):
+        criteria = parse_criteria(criteria)
+    return engine.screen(criteria, year=year, sector=sector, industry=industry, limit=limit)
+
+
+def get_peer_ranking(ticker: str, year: Optional[int] = None, scope: str = "sector") -> Dict:
+    """기업의 섹터/산업 내 지표별 백분위"""
+    engine = get_engine()
+    if engine is None:
+        return {"ticker": ticker, "error": "재무비율 데이터가 없습니다."}
+    return engine.peer_rank(ticker, year=year, scope=scope)
+
+
+def list_sectors() -> List[str]:
+    """스크리닝 가능한 섹터 목록"""
+    engine = get_engine()
+    if engine is None or "sector" not in engine.panel.columns:
+        return []
+    return sorted(s for s in engine.panel["sector"].dropna().unique() if str(s).strip())
@@ -0,0 +1,190 @@
+"""
+Search Index - 티커/기업명 인메모리 검색 인덱스
+- 접두사 트라이(평탄화된 prefix -> 문서 ID 테이블): 티커/이름/키워드 앞부분 일치
+- 문자 n-gram 역색인: 한글 등 부분 문자열 일치 (후보 교집합 후 검증)
+- 캐시 갱신 시 1회 구축, 키 입력마다 전체 목록을 순회하지 않음
+- 점수: 티커 완전 일치 > 티커 접두사 > 이름/키워드 완전·접두사 > 부분 일치
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+MAX_PREFIX_LEN = 24
+NGRAM = 2
+DEFAULT_LIMIT = 20
+
+# 필드 종류별 점수 (exact, prefix, substring)
+_SCORES = {
+    "ticker": (100, 80, 25),
+    "name": (70, 60, 30),
+    "keyword": (55, 50, 20),
+}
+
+
+@dataclass
+class SearchDoc:
+    """검색 대상 문서 (티커 1개)"""
+
+    ticker: str
+    korean_name: str = ""
+    company_name: str = ""
+    keywords: List[str] = field(default_factory=list)
+    extra: Dict = field(default_factory=dict)
+
+    def fields(self) -> List[Tuple[str, str]]:
+        """(필드 종류, 소문자 값) 목록"""
+        values = [("ticker", self.ticker.lower())]
+        for name in (self.korean_name, self.company_name):
+            if name:
+                values.append(("name", name.lower()))
+        values.extend(("keyword", k.lower()) for k in self.keywords if k)
+        return values
+
+
+def _normalize_keywords(keywords) -> List[str]:
+    """numpy 배열/None/문자열 등을 문자열 목록으로 정리"""
+    if keywords is None:
+        return []
+    if hasattr(keywords, "tolist"):
+        keywords = keywords.tolist()
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    if not isinstance(keywords, (list, tuple)):
+        return []
+    return [str(k) for k in keywords if k]
+
+
+def _ngrams(text: str, n: int = NGRAM) -> Set[str]:
+    text = text.replace(" ", "")
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+class SearchIndex:
+    """접두사 테이블 + n-gram 역색인 기반 검색 인덱스"""
+
+    def __init__(self, docs: Iterable[SearchDoc]):
+        self.docs: List[SearchDoc] = []
+        self.by_ticker: Dict[str, int] = {}
+        self._fields: List[List[Tuple[str, str]]] = []
+        self._prefix: Dict[str, Set[int]] = {}
+        self._grams: Dict[str, Set[int]] = {}
+        self._chars: Dict[str, Set[int]] = {}
+
+        for doc in docs:
+            ticker = doc.ticker.upper()
+            if not ticker or ticker in self.by_ticker:
+                continue
+            doc.ticker = ticker
+            doc_id = len(self.docs)
+            self.docs.append(doc)
+            self.by_ticker[ticker] = doc_id
+
+            fields = doc.fields()
+            self._fields.append(fields)
+            for _, value in fields:
+                self._index_value(doc_id, value)
+
+    def _index_value(self, doc_id: int, value: str) -> None:
+        # 값 전체 + 공백 기준 단어별 접두사 ("bank of america" -> "america"도 접두사 검색)
+        starts = [value] + value.split()[1:]
+        for start in starts:
+            for i in range(1, min(len(start), MAX_PREFIX_LEN) + 1):
+                self._prefix.setdefault(start[:i], set()).add(doc_id)
+        for gram in _ngrams(value):
+            self._grams.setdefault(gram, set()).add(doc_id)
+        for ch in set(value.replace(" ", "")):
+            self._chars.setdefault(ch, set()).add(doc_id)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> "SearchIndex":
+        """fetch_all_tickers()/companies 행(dict) 목록으로 인덱스 구축"""
+        docs = []
+        for item in records:
+            ticker = (item.get("ticker") or "").strip()
+            if not ticker:
+                continue
+            docs.append(
+                SearchDoc(
+                    ticker=ticker,
+                    korean_name=item.get("korean_name") or "",
+                    company_name=item.get("company_name") or "",
+                    keywords=_normalize_keywords(item.get("keywords")),
+                    extra={
+                        k: item[k]
+                        for k in ("id", "sector", "industry", "exchange")
+                        if item.get(k) is not None
+                    },
+                )
+            )
+        return cls(docs)
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    def _candidates(self, term: str) -> Set[int]:
+        """접두사 일치 문서 ∪ 부분 문자열 후보 문서"""
+        candidates = set(self._prefix.get(term[:MAX_PREFIX_LEN], ()))
+        compact = term.replace(" ", "")
+        if len(compact) < NGRAM:
+            candidates |= self._chars.get(compact, set())
+            return candidates
+
+        postings = [self._grams.get(g) for g in _ngrams(compact)]
+        if all(postings):
+            postings.sort(key=len)
+            common = set(postings[0])
+            for p in postings[1:]:
+                common &= p
+                if not common:
+                    break
+            candidates |= common
+        return candidates
+
+    def _score(self, doc_id: int, term: str) -> int:
+        best = 0
+        for kind, value in self._fields[doc_id]:
+            exact, prefix, substring = _SCORES[kind]
+            if value == term:
+                score = exact
+            elif value.startswith(term) or f" {term}" in value:
+                score = prefix
+            elif term in value:
+                score = substring
+            else:
+                continue
+            if score > best:
+                best = score
+        return best
+
+    def search(self, term: str, limit: int = DEFAULT_LIMIT) -> List[SearchDoc]:
+        """점수 순 검색 결과 (동점이면 이름이 짧은 순, 티커순)"""
+        return [doc for _, doc in self.search_scored(term, limit)]
+
+    def search_scored(
+        self, term: str, limit: int = DEFAULT_LIMIT
+    ) -> List[Tuple[int, SearchDoc]]:
+        term = (term or "").lower().strip()
+        if not term:
+            return []
+
+        scored = []
+        for doc_id in self._candidates(term):
+            score = self._score(doc_id, term)
+            if score:
+                doc = self.docs[doc_id]
+                name_len = len(doc.korean_name or doc.company_name)
+                scored.append((-score, len(doc.ticker) + name_len, doc.ticker, doc_id))
+
+        scored.sort()
+        return [(-s, self.docs[i]) for s, _, _, i in scored[:limit]]
+
+    def get(self, ticker: str) -> Optional[SearchDoc]:
+        """티커로 문서 조회"""
+        doc_id = self.by_ticker.get((ticker or "").upper())
+        return self.docs[doc_id] if doc_id is not None else None
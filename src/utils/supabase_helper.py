@@ -8,6 +8,13 @@ from config.settings import settings
 import pandas as pd
 from datetime import datetime, timedelta
 
+try:
+    from utils.company_search import get_company_search
+except ImportError:
+    from src.utils.company_search import get_company_search
+
+SEARCH_RESULT_LIMIT = 30
+
 
 # Cache the supabase client connection
 @st.cache_resource
@@ -46,12 +53,13 @@ def fetch_all_tickers():
         return []
 
 
-def search_tickers(search_term: str):
+def search_tickers(search_term: str, limit: int = SEARCH_RESULT_LIMIT):
     """
     Search tickers by term.
 
     Args:
         search_term (str): User input string
+        limit (int): Maximum number of ticker matches
 
     Returns:
         list: List of tuples (display_string, value_string) for streamlit-searchbox
@@ -60,54 +68,20 @@ def search_tickers(search_term: str):
         return []
 
     search_term = search_term.lower().strip()
-    all_tickers = fetch_all_tickers()
-
-    results = []
-
-    for item in all_tickers:
-        ticker = item.get("ticker", "").upper()
-        korean_name = item.get("korean_name", "") or ""
-        keywords = item.get("keywords", []) or []
-
-        # Ensure keywords is a list (handle potential None or non-list)
-        if hasattr(keywords, "tolist"):  # If numpy array
-            keywords = keywords.tolist()
-        if not isinstance(keywords, list):
-            keywords = []
-
-        # Add ticker and korean name to search targets
-        search_targets = [ticker.lower(), korean_name.lower()] + [
-            k.lower() for k in keywords
-        ]
-
-        # Check if search term is in any of the targets
-        # logic: partial match for any field
-        matched = False
-        for target in search_targets:
-            if search_term in target:
-                matched = True
-                break
-
-        if matched:
-            # Format: "**AAPL** | 애플"
-            display_text = f"**{ticker}** | {korean_name}"
-            results.append((display_text, ticker))
-
-    # Sort results: shorter matches first (usually more relevant), then alphabetical
-    # But prioritize starting with the search term
-
-    def sort_key(item):
-        display, val = item
-        # extracting pure text might be complex, simplified sort:
-        return len(display)
+    if not search_term:
+        return []
 
-    results.sort(key=sort_key)
+    # Ranked: exact ticker > ticker prefix > name/keyword prefix > substring
+    # The index is shared with company search/resolution (companies + tickers)
+    results = [
+        (f"**{doc.ticker}** | {doc.korean_name or doc.company_name}", doc.ticker)
+        for doc in get_company_search().index.search(search_term, limit=limit)
+    ]
 
     # [NEW] Add the raw search term as a "Direct Input" option at the top
     # This allows users to select "Hearthstone" even if it's not in the DB
-    if search_term:
-        direct_input_display = f"🔍 직접 입력: {search_term}"
-        # Prevent duplicates if exact match exists but ensure manual option is always available
-        results.insert(0, (direct_input_display, search_term))
+    direct_input_display = f"🔍 직접 입력: {search_term}"
+    # Prevent duplicates if exact match exists but ensure manual option is always available
+    results.insert(0, (direct_input_display, search_term))
 
     return results
@@ -0,0 +1,265 @@
+"""
+Technical Indicators - 벡터화 기술적 지표 엔진
+- price_cache의 OHLCV 데이터를 (날짜 x 티커) 행렬로 정렬하여 여러 티커를 한 번에 계산
+- 이동평균(SMA/EMA), RSI, MACD, 볼린저 밴드, ATR, 낙폭(drawdown), 변동성
+- 행 단위 Python 루프 없이 numpy/pandas 열 연산으로 처리
+- 데이터 지문(fingerprint) 기준 메모이제이션 → 차트 오버레이/챗봇 컨텍스트에서 재사용
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from utils.price_cache import fetch_stock_histories, data_fingerprint
+except ImportError:
+    from src.utils.price_cache import fetch_stock_histories, data_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# 기본 파라미터
+SMA_WINDOWS = (20, 50, 200)
+EMA_SPANS = (12, 26)
+RSI_PERIOD = 14
+MACD_PARAMS = (12, 26, 9)  # fast, slow, signal
+BOLLINGER_PARAMS = (20, 2.0)  # window, num_std
+ATR_PERIOD = 14
+VOLATILITY_WINDOW = 20
+TRADING_DAYS = 252
+DEFAULT_LOOKBACK_DAYS = 365  # SMA200 계산에 충분한 기간
+
+MAX_MEMO_ENTRIES = 32
+
+_memo: "OrderedDict[str, Dict[str, pd.DataFrame]]" = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+# ============================================================
+# 데이터 정렬 (티커별 튜플 -> 날짜 x 티커 행렬)
+# ============================================================
+
+
+def build_ohlcv_panel(histories: Dict[str, Optional[Tuple]]) -> Dict[str, pd.DataFrame]:
+    """
+    price_cache 형식 {ticker: (dates, o, h, l, c, v)} 를 필드별 DataFrame으로 변환
+
+    모든 티커를 날짜 합집합 인덱스에 정렬하며, 없는 날짜는 NaN으로 채웁니다.
+
+    Returns:
+        {"open"|"high"|"low"|"close"|"volume": DataFrame(index=날짜, columns=티커)}
+    """
+    fields = ("open", "high", "low", "close", "volume")
+    columns: Dict[str, Dict[str, pd.Series]] = {f: {} for f in fields}
+
+    for ticker, data in histories.items():
+        if not data:
+            continue
+        index = pd.DatetimeIndex(data[0])
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        for field, values in zip(fields, data[1:]):
+            columns[field][ticker] = pd.Series(
+                np.asarray(values, dtype=float), index=index
+            )
+
+    return {
+        field: pd.DataFrame(series).sort_index() if series else pd.DataFrame()
+        for field, series in columns.items()
+    }
+
+
+# ============================================================
+# 지표 계산 (DataFrame 전체 열을 한 번에 계산)
+# ============================================================
+
+
+def sma(close: pd.DataFrame, window: int) -> pd.DataFrame:
+    """단순 이동평균"""
+    return close.rolling(window, min_periods=window).mean()
+
+
+def ema(close: pd.DataFrame, span: int) -> pd.DataFrame:
+    """지수 이동평균"""
+    return close.ewm(span=span, adjust=False, min_periods=span).mean()
+
+
+def rsi(close: pd.DataFrame, period: int = RSI_PERIOD) -> pd.DataFrame:
+    """RSI (Wilder 평활)"""
+    delta = close.diff()
+    gain = delta.clip(lower=0)
+    loss = -delta.clip(upper=0)
+    avg_gain = gain.ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+    avg_loss = loss.ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+    rs = avg_gain / avg_loss.replace(0, np.nan)
+    result = 100 - 100 / (1 + rs)
+    # 하락이 전혀 없는 구간은 RSI 100
+    return result.mask((avg_loss == 0) & avg_gain.notna(), 100.0)
+
+
+def macd(
+    close: pd.DataFrame,
+    fast: int = MACD_PARAMS[0],
+    slow: int = MACD_PARAMS[1],
+    signal: int = MACD_PARAMS[2],
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """MACD -> (macd, signal, histogram)"""
+    line = ema(close, fast) - ema(close, slow)
+    signal_line = line.ewm(span=signal, adjust=False, min_periods=signal).mean()
+    return line, signal_line, line - signal_line
+
+
+def bollinger_bands(
+    close: pd.DataFrame,
+    window: int = BOLLINGER_PARAMS[0],
+    num_std: float = BOLLINGER_PARAMS[1],
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """볼린저 밴드 -> (middle, upper, lower)"""
+    mid = sma(close, window)
+    std = close.rolling(window, min_periods=window).std(ddof=0)
+    return mid, mid + num_std * std, mid - num_std * std
+
+
+def atr(
+    high: pd.DataFrame,
+    low: pd.DataFrame,
+    close: pd.DataFrame,
+    period: int = ATR_PERIOD,
+) -> pd.DataFrame:
+    """ATR (Average True Range, Wilder 평활)"""
+    prev_close = close.shift(1)
+    true_range = np.fmax(
+        high - low, np.fmax((high - prev_close).abs(), (low - prev_close).abs())
+    )
+    return true_range.ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+
+
+def drawdown(close: pd.DataFrame) -> pd.DataFrame:
+    """고점 대비 낙폭 (0 ~ -1)"""
+    return close / close.cummax() - 1
+
+
+def rolling_volatility(
+    close: pd.DataFrame, window: int = VOLATILITY_WINDOW, annualize: bool = True
+) -> pd.DataFrame:
+    """로그 수익률 기반 이동 변동성 (기본: 연율화)"""
+    log_ret = np.log(close / close.shift(1))
+    vol = log_ret.rolling(window, min_periods=window).std()
+    return vol * np.sqrt(TRADING_DAYS) if annualize else vol
+
+
+def compute_indicators(histories: Dict[str, Optional[Tuple]]) -> Dict[str, pd.DataFrame]:
+    """
+    모든 티커의 기술적 지표를 한 번에 계산 (데이터 지문 기준 메모이제이션)
+
+    Args:
+        histories: price_cache 형식 {ticker: (dates, o, h, l, c, v)}
+
+    Returns:
+        {지표명: DataFrame(index=날짜, columns=티커)}
+        지표명: close, sma_20/50/200, ema_12/26, rsi_14, macd, macd_signal,
+                macd_hist, bb_mid, bb_upper, bb_lower, atr_14, drawdown, volatility_20
+    """
+    key = data_fingerprint(
+        histories,
+        SMA_WINDOWS,
+        EMA_SPANS,
+        RSI_PERIOD,
+        MACD_PARAMS,
+        BOLLINGER_PARAMS,
+        ATR_PERIOD,
+        VOLATILITY_WINDOW,
+    )
+    with _memo_lock:
+        if key in _memo:
+            _memo.move_to_end(key)
+            return _memo[key]
+
+    panel = build_ohlcv_panel(histories)
+    close = panel["close"]
+    result: Dict[str, pd.DataFrame] = {"close": close}
+
+    if not close.empty:
+        for w in SMA_WINDOWS:
+            result[f"sma_{w}"] = sma(close, w)
+        for span in EMA_SPANS:
+            result[f"ema_{span}"] = ema(close, span)
+        result[f"rsi_{RSI_PERIOD}"] = rsi(close, RSI_PERIOD)
+        result["macd"], result["macd_signal"], result["macd_hist"] = macd(close)
+        result["bb_mid"], result["bb_upper"], result["bb_lower"] = bollinger_bands(
+            close
+        )
+        result[f"atr_{ATR_PERIOD}"] = atr(panel["high"], panel["low"], close)
+        result["drawdown"] = drawdown(close)
+        result[f"volatility_{VOLATILITY_WINDOW}"] = rolling_volatility(close)
+
+    with _memo_lock:
+        _memo[key] = result
+        while len(_memo) > MAX_MEMO_ENTRIES:
+            _memo.popitem(last=False)
+    return result
+
+
+def get_indicators(
+    tickers: List[str], days: int = DEFAULT_LOOKBACK_DAYS
+) -> Dict[str, pd.DataFrame]:
+    """price_cache에서 주가를 일괄 조회한 뒤 지표 계산"""
+    return compute_indicators(fetch_stock_histories(tickers, days))
+
+
+def clear_cache():
+    """지표 메모 초기화"""
+    with _memo_lock:
+        _memo.clear()
+
+
+# ============================================================
+# 요약 (챗봇 컨텍스트용)
+# ============================================================
+
+
+def latest_snapshot(indicators: Dict[str, pd.DataFrame], ticker: str) -> Dict:
+    """특정 티커의 최신 지표 값 (NaN 제외)"""
+    ticker = ticker.upper()
+    snapshot = {}
+    for name, frame in indicators.items():
+        if ticker not in frame.columns:
+            continue
+        series = frame[ticker].dropna()
+        if not series.empty:
+            snapshot[name] = float(series.iloc[-1])
+    if "drawdown" in indicators and ticker in indicators["drawdown"].columns:
+        max_dd = indicators["drawdown"][ticker].min()
+        if pd.notna(max_dd):
+            snapshot["max_drawdown"] = float(max_dd)
+    return snapshot
+
+
+def format_indicator_summary(ticker: str, snapshot: Dict) -> str:
+    """지표 스냅샷을 읽기 쉬운 텍스트로 변환"""
+    if not snapshot:
+        return ""
+
+    def _fmt(key: str, fmt: str = "{:.2f}") -> str:
+        value = snapshot.get(key)
+        return fmt.format(value) if value is not None else "N/A"
+
+    close = snapshot.get("close")
+    trend = []
+    for w in SMA_WINDOWS:
+        ma = snapshot.get(f"sma_{w}")
+        if close is not None and ma is not None:
+            trend.append(f"SMA{w} {'상회' if close >= ma else '하회'}")
+
+    lines = [
+        f"- 종가: {_fmt('close')} / SMA20: {_fmt('sma_20')} / SMA50: {_fmt('sma_50')} / SMA200: {_fmt('sma_200')}",
+        f"- RSI({RSI_PERIOD}): {_fmt(f'rsi_{RSI_PERIOD}', '{:.1f}')} / MACD: {_fmt('macd')} (시그널 {_fmt('macd_signal')})",
+        f"- 볼린저 밴드: {_fmt('bb_lower')} ~ {_fmt('bb_upper')} / ATR({ATR_PERIOD}): {_fmt(f'atr_{ATR_PERIOD}')}",
+        f"- 변동성({VOLATILITY_WINDOW}일, 연율): {_fmt(f'volatility_{VOLATILITY_WINDOW}', '{:.1%}')} / 현재 낙폭: {_fmt('drawdown', '{:.1%}')} / 최대 낙폭: {_fmt('max_drawdown', '{:.1%}')}",
+    ]
+    if trend:
+        lines.append(f"- 추세: {', '.join(trend)}")
+    return "\n".join(lines)
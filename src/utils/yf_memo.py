@@ -0,0 +1,203 @@
+"""
+yfinance Memo - 심볼별 Ticker.info / history 단일 호출(single-flight) 메모
+- Finnhub 실패 시 get_quote, get_basic_financials, get_price_target가 같은 심볼의
+  .info를 동시에 요청해도 실제 다운로드는 1회만 수행하고 결과를 공유
+- 짧은 TTL로 메모 (info 1분, history 5분), 실패 결과도 잠시 기억해 재시도 폭주 방지
+- src/data, src/tools의 stock_api_client와 리포트 yfinance 폴백이 공용으로 사용
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INFO_TTL_SECONDS = 60  # 시세 fallback에도 쓰이므로 짧게
+HISTORY_TTL_SECONDS = 300
+FAILURE_TTL_SECONDS = 30  # 빈 결과/예외 후 재시도까지의 간격
+MAX_ENTRIES = 1000
+
+
+class SingleFlightMemo:
+    """키별 동시 요청을 1회 로드로 합치는 TTL 메모"""
+
+    def __init__(self, ttl: float, failure_ttl: float = FAILURE_TTL_SECONDS):
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self._values: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def get(self, key: Hashable, loader: Callable[[], Any], is_valid=bool) -> Any:
+        """
+        메모된 값 반환, 없으면 loader 실행 (동시 호출자는 같은 결과를 기다림)
+
+        Args:
+            key: 메모 키
+            loader: 실제 로드 함수
+            is_valid: 정상 결과 판별 함수 (False면 failure_ttl 동안만 유지)
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            return future.result()
+
+        value, error = None, None
+        try:
+            value = loader()
+        except Exception as e:
+            error = e
+
+        ttl = self.ttl if error is None and is_valid(value) else self.failure_ttl
+        with self._lock:
+            self.loads += 1
+            self._values[key] = (time.time() + ttl, value)
+            if len(self._values) > MAX_ENTRIES:
+                self._evict()
+            del self._inflight[key]
+
+        if error is not None:
+            future.set_exception(error)
+            raise error
+        future.set_result(value)
+        return value
+
+    def _evict(self) -> None:
+        now = time.time()
+        expired = [k for k, (exp, _) in self._values.items() if exp <= now]
+        for k in expired:
+            del self._values[k]
+        # 만료 항목이 없으면 가장 빨리 만료될 항목부터 제거
+        overflow = len(self._values) - MAX_ENTRIES
+        if overflow > 0:
+            for k, _ in sorted(self._values.items(), key=lambda kv: kv[1][0])[:overflow]:
+                del self._values[k]
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._values.clear()
+            else:
+                self._values.pop(key, None)
+
+
+_info_memo = SingleFlightMemo(INFO_TTL_SECONDS)
+_history_memo = SingleFlightMemo(HISTORY_TTL_SECONDS)
+
+
+def _has_symbol(info) -> bool:
+    return bool(info) and "symbol" in info
+
+
+def _has_rows(hist) -> bool:
+    return hist is not None and not hist.empty
+
+
+def get_info(symbol: str) -> Dict:
+    """yf.Ticker(symbol).info (메모/단일 호출, 실패 시 빈 dict)"""
+    symbol = symbol.upper()
+
+    def load():
+        import yfinance as yf
+
+        return yf.Ticker(symbol).info or {}
+
+    try:
+        return _info_memo.get(symbol, load, is_valid=_has_symbol) or {}
+    except Exception as e:
+        logger.warning(f"yfinance info failed for {symbol}: {e}")
+        return {}
+
+
+def get_history(symbol: str, **kwargs):
+    """
+    yf.Ticker(symbol).history(**kwargs) (메모/단일 호출)
+
+    Raises:
+        yfinance 예외는 그대로 전달 (호출 측 fallback 처리 유지)
+    """
+    symbol = symbol.upper()
+    key = (symbol, tuple(sorted((k, str(v)) for k, v in kwargs.items())))
+
+    def load():
+        import yfinance as yf
+
+        return yf.Ticker(symbol).history(**kwargs)
+
+    hist = _history_memo.get(key, load, is_valid=_has_rows)
+    if hist is None:
+        import pandas as pd
+
+        return pd.DataFrame()
+    return hist
+
+
+def download_quotes(symbols: List[str]) -> Dict[str, Dict]:
+    """
+    여러 심볼의 최근 시세를 yf.download 1회로 조회 (get_quotes 일괄 fallback)
+
+    Returns:
+        {symbol: Finnhub quote 형식 dict (c, h, l, o, pc, t, source)}
+        (데이터가 없는 심볼은 제외)
+    """
+    import pandas as pd
+    import yfinance as yf
+
+    symbols = [s.upper() for s in symbols]
+    if not symbols:
+        return {}
+
+    df = yf.download(
+        symbols,
+        period="5d",
+        interval="1d",
+        group_by="ticker",
+        auto_adjust=False,
+        threads=True,
+        progress=False,
+    )
+    if df is None or df.empty:
+        return {}
+
+    quotes = {}
+    for symbol in symbols:
+        if isinstance(df.columns, pd.MultiIndex):
+            if symbol not in df.columns.get_level_values(0):
+                continue
+            bars = df[symbol].dropna(subset=["Close"])
+        else:
+            # 구버전 yfinance: 단일 심볼은 평면 컬럼
+            bars = df.dropna(subset=["Close"]) if len(symbols) == 1 else None
+        if bars is None or bars.empty:
+            continue
+
+        last = bars.iloc[-1]
+        prev_close = float(bars["Close"].iloc[-2]) if len(bars) > 1 else None
+        quotes[symbol] = {
+            "c": float(last["Close"]),
+            "h": float(last["High"]),
+            "l": float(last["Low"]),
+            "o": float(last["Open"]),
+            "pc": prev_close,
+            "t": int(bars.index[-1].timestamp()),
+            "source": "yfinance",
+        }
+    return quotes
+
+
+def clear():
+    """메모 전체 초기화"""
+    _info_memo.invalidate()
+    _history_memo.invalidate()